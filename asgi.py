@@ -0,0 +1,21 @@
+"""
+ASGI entry point, used by ``serve.py`` when SERVER=asgi runs several workers.
+
+``serve.py`` exports its worker and thread counts to the uvicorn workers;
+started directly, the counts come from WORKERS and THREADS in ``.env``.
+
+Usage:
+    uvicorn asgi:application --workers 4
+"""
+import os
+
+from main import create_app, share_worker_state
+from src.utilities.asgi import ASGIAdapter
+from src.utilities.config import Config
+from src.utilities.server import THREADS_ENV, WORKERS_ENV
+
+workers = int(os.environ.get(WORKERS_ENV, Config.WORKERS))
+threads = int(os.environ.get(THREADS_ENV, Config.THREADS))
+if workers > 1:
+    share_worker_state()
+application = ASGIAdapter(create_app(), threads)
@@ -0,0 +1,186 @@
+"""
+End-to-end throughput and latency benchmark for the Flask app.
+
+Seeds (or reuses) a synthetic catalog, then drives the hot routes
+through Flask's test client and/or a real threaded WSGI server with a
+local load generator. Reports p50/p95/p99 latency and req/s per route
+as JSON that can be diffed across commits.
+
+Usage:
+    python -m benchmarks.bench_app --rows 100k --requests 500 --concurrency 8 --output bench.json
+"""
+import argparse
+import http.client
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+from benchmarks.common import (
+    BENCH_PASSWORD,
+    configure_environment,
+    percentiles,
+    write_report,
+)
+from benchmarks.seed import SCALES, database_name, seed
+
+SELLER_EMAIL = "seller0@bench.local"
+
+# (name, method, path, form data, needs seller login)
+ROUTES = [
+    ("user.index", "GET", "/", None, False),
+    ("user.index.deep_page", "GET", "/?page=500", None, False),
+    ("user.search", "GET", "/search?q=wireless+mouse", None, False),
+    ("seller.dashboard", "GET", "/seller/dashboard", None, True),
+    ("seller.dashboard.sorted", "GET", "/seller/dashboard?sort=price_desc&page=5", None, True),
+    ("seller.dashboard.search", "GET", "/seller/dashboard?q=lamp", None, True),
+    ("auth.login", "POST", "/auth/login", {"email_id": SELLER_EMAIL, "password": BENCH_PASSWORD}, False),
+]
+
+
+def run_load(send: Callable[[], int], requests: int, concurrency: int) -> dict:
+    """
+    Issue ``requests`` calls to ``send`` from ``concurrency`` threads.
+
+    Args:
+        send (Callable[[], int]): Performs one request, returns its status.
+        requests (int): Total requests.
+        concurrency (int): Client threads.
+
+    Returns:
+        dict: Latency percentiles, req/s and status counts.
+    """
+    latencies: list[float] = []
+    statuses = {}
+    lock = threading.Lock()
+    per_worker = max(1, requests // concurrency)
+
+    def worker(_):
+        local = []
+        local_statuses = {}
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            status = send()
+            local.append(time.perf_counter() - start)
+            local_statuses[status] = local_statuses.get(status, 0) + 1
+        with lock:
+            latencies.extend(local)
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(worker, range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        **percentiles(latencies),
+        "req_per_sec": round(len(latencies) / elapsed, 2),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+def bench_test_client(app, seller_id: int, requests: int, concurrency: int) -> list[dict]:
+    results = []
+    local = threading.local()
+
+    for name, method, path, data, needs_login in ROUTES:
+        def send(method=method, path=path, data=data):
+            client = getattr(local, "client", None)
+            if client is None:
+                client = local.client = app.test_client()
+                with client.session_transaction() as session:
+                    session["user_id"] = seller_id
+                    session["role"] = "seller"
+                    session["full_name"] = "Seller 0"
+            return client.open(path, method=method, data=data).status_code
+
+        results.append({"mode": "test_client", "route": name, **run_load(send, requests, concurrency)})
+        local.__dict__.clear()
+    return results
+
+
+def bench_wsgi(app, requests: int, concurrency: int) -> list[dict]:
+    from werkzeug.serving import make_server
+
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_port
+    results = []
+
+    def login_cookie() -> str:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        body = urlencode({"email_id": SELLER_EMAIL, "password": BENCH_PASSWORD})
+        connection.request("POST", "/auth/login", body, {"Content-Type": "application/x-www-form-urlencoded"})
+        response = connection.getresponse()
+        response.read()
+        connection.close()
+        return response.getheader("Set-Cookie", "").split(";", 1)[0]
+
+    try:
+        cookie = login_cookie()
+        local = threading.local()
+        for name, method, path, data, needs_login in ROUTES:
+            def send(method=method, path=path, data=data, needs_login=needs_login):
+                connection = getattr(local, "connection", None)
+                if connection is None:
+                    connection = local.connection = http.client.HTTPConnection("127.0.0.1", port)
+                headers = {"Cookie": cookie} if needs_login else {}
+                body = None
+                if data:
+                    body = urlencode(data)
+                    headers["Content-Type"] = "application/x-www-form-urlencoded"
+                connection.request(method, path, body, headers)
+                response = connection.getresponse()
+                response.read()
+                if response.getheader("Connection", "").lower() == "close" or response.version == 10:
+                    connection.close()
+                    local.connection = None
+                return response.status
+
+            results.append({"mode": "wsgi", "route": name, **run_load(send, requests, concurrency)})
+            local.__dict__.clear()
+    finally:
+        server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--sellers", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per route")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--mode", choices=("test_client", "wsgi", "both"), default="both")
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    configure_environment(database_name(rows))
+    if args.reseed or not os.path.exists(os.path.join(os.environ["DATABASE_DIR"], database_name(rows))):
+        seed(rows, min(args.sellers, rows), customers=args.sellers)
+
+    from sqlmodel import Session, select
+
+    from main import app
+    from src.models.user import User
+    from src.utilities.database import engine
+
+    with Session(engine) as db_session:
+        seller_id = db_session.exec(select(User.id).where(User.email_id == SELLER_EMAIL)).one()
+
+    results = []
+    if args.mode in ("test_client", "both"):
+        results += bench_test_client(app, seller_id, args.requests, args.concurrency)
+    if args.mode in ("wsgi", "both"):
+        results += bench_wsgi(app, args.requests, args.concurrency)
+
+    write_report("app", results, args.output, rows=rows, concurrency=args.concurrency, requests=args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Concurrent checkout stress benchmark.
+
+Creates a fresh database with a few "hot" items, then has hundreds of
+buyers check out multi-line carts of those items at once. Afterwards it
+checks that reserved units plus remaining stock equal the starting
+stock for every item (no oversell, no lost units) and exits non-zero if
+they do not. Reports checkout latency and throughput as JSON.
+
+Usage:
+    python -m benchmarks.bench_checkout --buyers 500 --stock 200 --concurrency 64 --output checkout.json
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from benchmarks.common import configure_environment, percentiles, write_report
+
+DATABASE_NAME = "checkout.db"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--buyers", type=int, default=500, help="Concurrent checkouts")
+    parser.add_argument("--items", type=int, default=3, help="Hot items competed for")
+    parser.add_argument("--stock", type=int, default=200, help="Starting stock per item")
+    parser.add_argument("--max-quantity", type=int, default=3, help="Max units per cart line")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--expire", action="store_true", help="Expire all reservations afterwards")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    configure_environment(DATABASE_NAME)
+    path = os.path.join(os.environ["DATABASE_DIR"], DATABASE_NAME)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    from sqlalchemy import func, update
+    from sqlmodel import Session, select
+
+    from src.models.inventory import Inventory
+    from src.models.order import Order, OrderLine, OrderStatus
+    from src.models.user import User, UserRole
+    from src.utilities.checkout import OutOfStockError, checkout
+    from src.utilities.database import engine, init_table
+    from src.utilities.helper import get_utc_now
+
+    init_table()
+    with Session(engine) as db_session:
+        seller = User(full_name="Seller", email_id="seller@bench.local", hashed_password="-", role=UserRole.SELLER)
+        buyer = User(full_name="Buyer", email_id="buyer@bench.local", hashed_password="-")
+        db_session.add_all([seller, buyer])
+        db_session.commit()
+        items = [
+            Inventory(name=f"Hot item {index}", description="Stress test item", price=9.99,
+                      quantity=args.stock, seller_id=seller.id)
+            for index in range(args.items)
+        ]
+        db_session.add_all(items)
+        db_session.commit()
+        item_ids = [item.id for item in items]
+        buyer_id = buyer.id
+
+    rng = random.Random(42)
+    carts = [
+        {item_id: rng.randint(1, args.max_quantity) for item_id in rng.sample(item_ids, rng.randint(1, len(item_ids)))}
+        for _ in range(args.buyers)
+    ]
+
+    latencies = []
+    outcomes = {"reserved": 0, "out_of_stock": 0, "error": 0}
+    lock = threading.Lock()
+    go = threading.Event()
+
+    def buy(cart):
+        go.wait()
+        start = time.perf_counter()
+        try:
+            checkout.reserve(buyer_id, cart)
+            outcome = "reserved"
+        except OutOfStockError:
+            outcome = "out_of_stock"
+        except Exception as e:  # noqa: BLE001 - counted and reported, the run goes on
+            print(f"checkout failed: {e!r}", file=sys.stderr)
+            outcome = "error"
+        elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            outcomes[outcome] += 1
+
+    with ThreadPoolExecutor(args.concurrency) as executor:
+        futures = [executor.submit(buy, cart) for cart in carts]
+        start = time.perf_counter()
+        go.set()  # release the first wave of buyers at once
+        for future in futures:
+            future.result()
+    elapsed = time.perf_counter() - start
+
+    if args.expire:
+        with Session(engine) as db_session:
+            db_session.exec(update(Order).values(expires_at=get_utc_now() - timedelta(seconds=1)))
+            db_session.commit()
+        checkout.release_expired()
+
+    with Session(engine) as db_session:
+        remaining = dict(db_session.exec(select(Inventory.id, Inventory.quantity)).all())
+        held = dict(db_session.exec(
+            select(OrderLine.inventory_id, func.sum(OrderLine.quantity))
+            .join(Order, Order.id == OrderLine.order_id)
+            .where(Order.status == OrderStatus.RESERVED)
+            .group_by(OrderLine.inventory_id)
+        ).all())
+
+    consistency = []
+    for item_id in item_ids:
+        consistency.append({
+            "item_id": item_id,
+            "start": args.stock,
+            "held": held.get(item_id, 0),
+            "remaining": remaining[item_id],
+            "ok": remaining[item_id] >= 0 and remaining[item_id] + held.get(item_id, 0) == args.stock,
+        })
+
+    results = [{
+        "case": "concurrent_checkout",
+        **percentiles(latencies),
+        "checkouts_per_sec": round(len(latencies) / elapsed, 2),
+        **outcomes,
+        "stock": consistency,
+    }]
+    write_report("checkout", results, args.output, buyers=args.buyers, concurrency=args.concurrency)
+
+    if not all(entry["ok"] for entry in consistency) or outcomes["error"]:
+        print("Stock invariant violated", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
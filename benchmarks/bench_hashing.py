@@ -0,0 +1,72 @@
+"""
+Password hashing benchmark.
+
+Reports how many bcrypt login verifications one core can sustain at
+each cost factor, plus the throughput of the shared hashing pool.
+
+Usage:
+    python -m benchmarks.bench_hashing --costs 10 11 12 13 --seconds 3
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.utilities.hashing import HashingService, bcrypt_check, bcrypt_hash
+
+PASSWORD = b"benchmark-password"
+
+
+def logins_per_second(cost: int, seconds: float) -> float:
+    hashed = bcrypt_hash(PASSWORD, cost)
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        bcrypt_check(PASSWORD, hashed)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def pool_logins_per_second(cost: int, seconds: float, workers: int) -> float:
+    hashed = bcrypt_hash(PASSWORD, cost)
+    service = HashingService(workers=workers, max_pending=workers * 2, queue_timeout=60)
+    deadline = time.perf_counter() + seconds
+
+    def client(_):
+        done = 0
+        while time.perf_counter() < deadline:
+            service.run(bcrypt_check, PASSWORD, hashed)
+            done += 1
+        return done
+
+    try:
+        service.run(bcrypt_check, PASSWORD, hashed)  # warm up worker processes
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers * 2) as executor:
+            total = sum(executor.map(client, range(workers * 2)))
+        return total / (time.perf_counter() - start)
+    finally:
+        service.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--costs", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    results = []
+    for cost in args.costs:
+        results.append({
+            "cost": cost,
+            "logins_per_sec_per_core": round(logins_per_second(cost, args.seconds), 2),
+            "pool_workers": args.workers,
+            "pool_logins_per_sec": round(pool_logins_per_second(cost, args.seconds, args.workers), 2),
+        })
+    print(json.dumps({"benchmark": "hashing", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
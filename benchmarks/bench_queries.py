@@ -0,0 +1,109 @@
+"""
+Micro-benchmarks for the catalog query builders and password hashing.
+
+Times statement construction and compilation separately from execution
+so regressions in either show up on their own.
+
+Usage:
+    python -m benchmarks.bench_queries --rows 100k --repeat 200 --output queries.json
+"""
+import argparse
+import os
+import time
+from collections.abc import Callable
+
+from benchmarks.common import configure_environment, percentiles, write_report
+from benchmarks.seed import SCALES, database_name, seed
+
+
+def measure(name: str, func: Callable[[], object], repeat: int) -> dict:
+    func()  # warm caches and compiled statements
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return {"case": name, **percentiles(samples), "ops_per_sec": round(repeat / sum(samples), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--hash-repeat", type=int, default=10)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    configure_environment(database_name(rows))
+    if not os.path.exists(os.path.join(os.environ["DATABASE_DIR"], database_name(rows))):
+        seed(rows, min(1000, rows), customers=1000)
+
+    from sqlmodel import Session, select
+
+    from src.models.inventory import Inventory
+    from src.models.user import User
+    from src.utilities.config import Config
+    from src.utilities.database import engine
+    from src.utilities.hashing import bcrypt_check, bcrypt_hash
+    from src.utilities.pagination import paginate
+    from src.utilities.queries import catalog_listing, find_seller_item, seller_listing
+    from src.utilities.search import matching_ids, ranked_matches
+
+    with Session(engine) as db_session:
+        seller_id = db_session.exec(
+            select(User.id).where(User.email_id == "seller0@bench.local")
+        ).one()
+        item_id = db_session.exec(
+            select(Inventory.id).where(Inventory.seller_id == seller_id).limit(1)
+        ).one()
+
+    def dashboard_stmt():
+        return seller_listing(seller_id)
+
+    def build_and_compile():
+        dashboard_stmt().order_by(Inventory.price.desc()).limit(10).compile(engine)
+
+    db_session = Session(engine)
+    cursor = paginate(db_session, dashboard_stmt(), sort="price_desc", cursor="").next_cursor
+    password = b"benchmark-password"
+    hashed = bcrypt_hash(password, Config.SALT_LENGTH)
+
+    cases = [
+        ("build_and_compile_dashboard_stmt", build_and_compile, args.repeat),
+        ("dashboard_offset_page_1",
+         lambda: paginate(db_session, dashboard_stmt(), sort="price_desc", page=1), args.repeat),
+        ("dashboard_offset_page_50",
+         lambda: paginate(db_session, dashboard_stmt(), sort="price_desc", page=50), args.repeat),
+        ("dashboard_cursor_page",
+         lambda: paginate(db_session, dashboard_stmt(), sort="price_desc", cursor=cursor or ""), args.repeat),
+        ("index_cursor_first_page",
+         lambda: paginate(db_session, catalog_listing(), per_page=8, cursor=""), args.repeat),
+        ("find_seller_item",
+         lambda: find_seller_item(db_session, item_id, seller_id), args.repeat),
+        ("dashboard_fts_filter",
+         lambda: paginate(db_session, dashboard_stmt().where(Inventory.id.in_(matching_ids("lamp"))),
+                          sort="date_desc"), args.repeat),
+        ("public_search_ranked",
+         lambda: db_session.exec(
+             select(Inventory)
+             .join(matches := ranked_matches("wireless mouse"), matches.c.rowid == Inventory.id)
+             .order_by(matches.c.rank)
+             .limit(8)
+         ).all(), args.repeat),
+        (f"bcrypt_hash_cost_{Config.SALT_LENGTH}",
+         lambda: bcrypt_hash(password, Config.SALT_LENGTH), args.hash_repeat),
+        (f"bcrypt_verify_cost_{Config.SALT_LENGTH}",
+         lambda: bcrypt_check(password, hashed), args.hash_repeat),
+    ]
+
+    try:
+        results = [measure(name, func, repeat) for name, func, repeat in cases]
+    finally:
+        db_session.close()
+
+    write_report("queries", results, args.output, rows=rows)
+
+
+if __name__ == "__main__":
+    main()
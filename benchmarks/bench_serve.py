@@ -0,0 +1,110 @@
+"""
+Throughput of the production server as the worker count grows.
+
+Starts ``serve.py`` once per worker count against a seeded catalog,
+drives the public catalog routes over real HTTP connections and reports
+req/s and latency percentiles per worker count.
+
+Usage:
+    python -m benchmarks.bench_serve --rows 100k --workers 1 2 4 --concurrency 16 --output serve.json
+"""
+import argparse
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.bench_app import run_load
+from benchmarks.common import configure_environment, write_report
+from benchmarks.seed import SCALES, database_name, seed
+
+ROUTES = [
+    ("user.index", "/"),
+    ("user.index.deep_page", "/?page=50"),
+    ("user.search", "/search?q=wireless+mouse"),
+]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def wait_until_listening(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Server did not start listening on port {port}")
+
+
+def bench_workers(server: str, workers: int, threads: int, requests: int, concurrency: int) -> list[dict]:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "serve.py", "--server", server, "--workers", str(workers),
+         "--threads", str(threads), "--host", "127.0.0.1", "--port", str(port)],
+    )
+    results = []
+    try:
+        wait_until_listening(port)
+        local = threading.local()
+        for name, path in ROUTES:
+            def send(path=path):
+                connection = getattr(local, "connection", None)
+                if connection is None:
+                    connection = local.connection = http.client.HTTPConnection("127.0.0.1", port)
+                connection.request("GET", path)
+                response = connection.getresponse()
+                response.read()
+                if response.getheader("Connection", "").lower() == "close" or response.version == 10:
+                    connection.close()
+                    local.connection = None
+                return response.status
+
+            # Warm the per-worker caches so every worker count is measured hot
+            run_load(send, workers * concurrency, concurrency)
+            results.append({"server": server, "workers": workers, "threads": threads, "route": name,
+                            **run_load(send, requests, concurrency)})
+            local.__dict__.clear()
+    finally:
+        process.send_signal(signal.SIGTERM)
+        process.wait(timeout=30)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--sellers", type=int, default=1000)
+    parser.add_argument("--server", default="prefork")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per route and worker count")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--reseed", action="store_true")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    configure_environment(database_name(rows))
+    if args.reseed or not os.path.exists(os.path.join(os.environ["DATABASE_DIR"], database_name(rows))):
+        seed(rows, min(args.sellers, rows), customers=args.sellers)
+
+    results = []
+    for workers in args.workers:
+        results += bench_workers(args.server, workers, args.threads, args.requests, args.concurrency)
+
+    write_report("serve", results, args.output, rows=rows, cpus=os.cpu_count(),
+                 concurrency=args.concurrency, requests=args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Cold-start benchmark: process start to first served request.
+
+Starts a fresh interpreter per run with ``-X importtime`` and times each
+startup phase in it: importing ``main``, ``create_app()``,
+``init_table()`` and the first ``GET /``. Reports percentiles per phase
+plus the modules with the highest cumulative and self import times, so
+a new eager import shows up by name.
+
+Usage:
+    python -m benchmarks.bench_startup --rows 1k --runs 10 --output startup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from benchmarks.common import configure_environment, percentiles, write_report
+from benchmarks.seed import SCALES, database_name, seed
+
+# Runs inside the child; prints phase timings in seconds as one JSON line
+CHILD = """
+import json, time
+start = time.perf_counter()
+from main import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+from src.utilities.database import init_table
+init_table()
+initialized = time.perf_counter()
+status = app.test_client().get("/").status_code
+served = time.perf_counter()
+print(json.dumps({
+    "import_main": imported - start,
+    "create_app": created - imported,
+    "init_table": initialized - created,
+    "first_request": served - initialized,
+    "status": status,
+}))
+"""
+
+PHASES = ("import_main", "create_app", "init_table", "first_request")
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """
+    Parse ``-X importtime`` output.
+
+    Returns:
+        List[Tuple[str, int, int]]: ``(module, self_us, cumulative_us)`` per import.
+    """
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        modules.append((name, int(self_us), int(cumulative_us)))
+    return modules
+
+
+def run_once() -> tuple[dict, list[tuple[str, int, int]]]:
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD],
+        capture_output=True, text=True, check=True,
+    )
+    wall = time.perf_counter() - start
+    phases = json.loads(completed.stdout.strip().splitlines()[-1])
+    phases["process_wall"] = wall
+    return phases, parse_importtime(completed.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    configure_environment(database_name(rows))
+    if not os.path.exists(os.path.join(os.environ["DATABASE_DIR"], database_name(rows))):
+        seed(rows, min(1000, rows), customers=1000)
+
+    run_once()  # warm the OS file cache and .pyc files; also stamps the schema
+    samples: dict[str, list[float]] = defaultdict(list)
+    self_times: dict[str, list[int]] = defaultdict(list)
+    cumulative_times: dict[str, list[int]] = defaultdict(list)
+    for _ in range(args.runs):
+        phases, modules = run_once()
+        if phases.pop("status") != 200:
+            raise SystemExit("First request did not return 200")
+        for name, value in phases.items():
+            samples[name].append(value)
+        for name, self_us, cumulative_us in modules:
+            self_times[name].append(self_us)
+            cumulative_times[name].append(cumulative_us)
+
+    def slowest(times: dict[str, list[int]]) -> list[dict]:
+        ranked = sorted(times.items(), key=lambda item: -sum(item[1]) / len(item[1]))
+        return [{"module": name, "mean_ms": round(sum(values) / len(values) / 1000, 3)}
+                for name, values in ranked[:args.top]]
+
+    results = [{"phase": name, **percentiles(samples[name])} for name in (*PHASES, "process_wall")]
+    results.append({"slowest_imports_cumulative": slowest(cumulative_times)})
+    results.append({"slowest_imports_self": slowest(self_times)})
+    write_report("startup", results, args.output, rows=rows, runs=args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Query plan check for the hot routes.
+
+Drives each hot route once through Flask's test client, records every
+SELECT it sends to SQLite, and runs ``EXPLAIN QUERY PLAN`` on it. Exits
+non-zero if any statement reads a whole table instead of searching an
+index, so a missing or unusable index fails the run.
+
+``tests/test_query_plans.py`` runs the same check on every test run;
+this script reports the plans against a benchmark-sized catalog.
+
+Usage:
+    python -m benchmarks.check_query_plans --rows 100k --output plans.json
+"""
+import argparse
+import os
+import sys
+import threading
+
+from benchmarks.bench_app import ROUTES, SELLER_EMAIL
+from benchmarks.common import configure_environment, write_report
+from benchmarks.seed import SCALES, database_name, seed
+
+
+def plan_routes(engine) -> tuple[int, list]:
+    """
+    Build the routes to check for the seller ``SELLER_EMAIL``.
+
+    Args:
+        engine (Engine): Engine of a seeded database.
+
+    Returns:
+        Tuple[int, list]: The seller's id and ``ROUTES``-style route tuples.
+    """
+    from sqlmodel import Session, select
+
+    from src.models.inventory import Inventory
+    from src.models.user import User
+
+    with Session(engine) as db_session:
+        seller_id = db_session.exec(select(User.id).where(User.email_id == SELLER_EMAIL)).one()
+        item_id = db_session.exec(
+            select(Inventory.id).where(Inventory.seller_id == seller_id, Inventory.is_active == True)
+        ).first()
+
+    return seller_id, [
+        *ROUTES,
+        ("seller.dashboard.cursor", "GET", "/seller/dashboard?cursor=&sort=name_asc", None, True),
+        ("seller.update_inventory", "GET", f"/seller/update-inventory/{item_id}", None, True),
+        ("seller.export", "GET", "/seller/export.csv?sort=price_asc", None, True),
+    ]
+
+
+def check_routes(app, engine, seller_id: int, routes: list) -> list[dict]:
+    """
+    Request every route and explain each SELECT it sent.
+
+    Args:
+        app (Flask): Application under test.
+        engine (Engine): Engine the application queries.
+        seller_id (int): Seller logged in for routes that need it.
+        routes (list): ``(name, method, path, data, needs_login)`` tuples.
+
+    Returns:
+        List[dict]: One entry per statement; ``table_scans`` lists offending plan steps.
+    """
+    from sqlalchemy import event
+
+    from src.utilities.indexes import explain, table_scans
+
+    captured = []
+    # Background threads such as the invalidation poller share the engine;
+    # only the statements the request itself sends are checked
+    request_thread = threading.get_ident()
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() != request_thread:
+            return
+        if not executemany and statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            captured.append((statement, parameters))
+
+    results = []
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with engine.connect() as connection:
+            dbapi_connection = connection.connection.driver_connection
+            for name, method, path, data, needs_login in routes:
+                client = app.test_client()
+                if needs_login:
+                    with client.session_transaction() as session:
+                        session["user_id"] = seller_id
+                        session["role"] = "seller"
+                        session["full_name"] = "Seller 0"
+                captured.clear()
+                response = client.open(path, method=method, data=data)
+                response.get_data()  # runs streamed bodies such as the export
+
+                for statement, parameters in captured:
+                    results.append({
+                        "route": name,
+                        "status": response.status_code,
+                        "sql": " ".join(statement.split()),
+                        "plan": explain(dbapi_connection, statement, parameters),
+                        "table_scans": table_scans(dbapi_connection, statement, parameters),
+                    })
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--sellers", type=int, default=1000)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    configure_environment(database_name(rows))
+    if not os.path.exists(os.path.join(os.environ["DATABASE_DIR"], database_name(rows))):
+        seed(rows, min(args.sellers, rows), customers=args.sellers)
+
+    from main import app
+    from src.utilities.database import engine, init_table
+
+    init_table()  # brings the indexes of an older benchmark database up to date
+    seller_id, routes = plan_routes(engine)
+    results = check_routes(app, engine, seller_id, routes)
+    failures = sum(bool(result["table_scans"]) for result in results)
+
+    write_report("query_plans", results, args.output, rows=rows, failures=failures)
+    if failures:
+        print(f"{failures} statement(s) fall back to a table scan", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Every benchmark points the application at its own SQLite file by
+setting environment variables *before* any ``src`` module is imported,
+since Config reads them at import time.
+"""
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections.abc import Iterable
+
+BENCH_DIR = os.path.join("database", "bench")
+BENCH_PASSWORD = "benchmark-password"
+
+
+def configure_environment(database_name: str, quiet: bool = True) -> None:
+    """
+    Point Config at a benchmark database and keep logging out of the way.
+
+    Args:
+        database_name (str): File name inside ``database/bench``.
+        quiet (bool): Sample away INFO logs so they do not skew timings.
+    """
+    os.environ["DATABASE_DIR"] = BENCH_DIR
+    os.environ["DATABASE_NAME"] = database_name
+    os.environ.setdefault("LOG_DIR", os.path.join(BENCH_DIR, "logs"))
+    os.environ.setdefault("UPLOAD_DIR", os.path.join("static", "uploads"))
+    os.environ["DEBUG"] = "false"
+    os.environ["QUERY_GUARD"] = "off"
+    if quiet:
+        os.environ["LOG_SAMPLE_RATE"] = "0"
+
+
+def percentiles(samples: list[float]) -> dict:
+    """
+    Summarise latency samples given in seconds.
+
+    Args:
+        samples (List[float]): Per-request latencies.
+
+    Returns:
+        dict: Count, mean and p50/p95/p99/max in milliseconds.
+    """
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pick(fraction: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+        "p50_ms": pick(0.50),
+        "p95_ms": pick(0.95),
+        "p99_ms": pick(0.99),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_report(name: str, results: Iterable[dict], output: str | None, **meta) -> dict:
+    """
+    Print a JSON report and optionally save it for diffing across commits.
+
+    Args:
+        name (str): Benchmark name.
+        results (Iterable[dict]): One entry per measured case.
+        output (Optional[str]): File to write the report to.
+        **meta: Extra top-level fields (scale, workers, ...).
+
+    Returns:
+        dict: The report.
+    """
+    report = {
+        "benchmark": name,
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        **meta,
+        "results": list(results),
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    print(text)
+    if output:
+        with open(output, "w", encoding="utf-8") as report_file:
+            report_file.write(text + "\n")
+    return report
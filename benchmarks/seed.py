@@ -0,0 +1,141 @@
+"""
+Seed a synthetic catalog for benchmarking.
+
+Creates ``database/bench/<name>.db`` with the application's schema, a
+configurable number of sellers and customers, and ``--rows`` inventory
+items spread across the sellers. Every seeded account uses the password
+``benchmark-password``.
+
+Usage:
+    python -m benchmarks.seed --rows 100000 --sellers 2000
+"""
+import argparse
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import BENCH_PASSWORD, configure_environment
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+ADJECTIVES = ("Wireless", "Portable", "Smart", "Compact", "Ergonomic", "Stainless", "Rechargeable", "Foldable")
+NOUNS = ("Mouse", "Speaker", "Lamp", "Backpack", "Tumbler", "Charger", "Headphones", "Stand", "Bottle", "Tracker")
+WORDS = ("durable", "lightweight", "premium", "travel", "office", "gaming", "outdoor", "daily", "gift", "classic")
+BATCH_SIZE = 10_000
+
+
+def database_name(rows: int) -> str:
+    return f"catalog-{rows}.db"
+
+
+def seed(rows: int, sellers: int, customers: int, seed_value: int = 42) -> str:
+    """
+    Build a fresh benchmark database.
+
+    Args:
+        rows (int): Inventory rows to create.
+        sellers (int): Seller accounts owning those rows.
+        customers (int): Customer accounts.
+        seed_value (int): Random seed, so runs are reproducible.
+
+    Returns:
+        str: Path of the database file.
+    """
+    name = database_name(rows)
+    configure_environment(name)
+    path = os.path.join(os.environ["DATABASE_DIR"], name)
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    from src.utilities.database import engine, init_table
+
+    init_table()
+    populate(engine, rows, sellers, customers, seed_value)
+    return path
+
+
+def populate(engine, rows: int, sellers: int, customers: int, seed_value: int = 42) -> None:
+    """
+    Insert synthetic accounts and inventory into an initialised database.
+
+    Args:
+        engine (Engine): Engine of the database to fill.
+        rows (int): Inventory rows to create.
+        sellers (int): Seller accounts owning those rows.
+        customers (int): Customer accounts.
+        seed_value (int): Random seed, so runs are reproducible.
+    """
+    from src.utilities.security import hash_password
+
+    rng = random.Random(seed_value)
+    hashed = hash_password(BENCH_PASSWORD)
+    start_date = datetime(2024, 1, 1)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        now = datetime.now().isoformat(sep=" ")
+        users = [
+            (f"Seller {index}", f"seller{index}@bench.local", hashed, "SELLER", now, now)
+            for index in range(sellers)
+        ] + [
+            (f"Customer {index}", f"customer{index}@bench.local", hashed, "CUSTOMER", now, now)
+            for index in range(customers)
+        ]
+        cursor.executemany(
+            "INSERT INTO users (full_name, email_id, hashed_password, role, is_active, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, 1, ?, ?)",
+            users,
+        )
+        seller_ids = [row[0] for row in cursor.execute("SELECT id FROM users WHERE role = 'SELLER'")]
+        connection.commit()
+
+        images = sorted(
+            name for name in os.listdir(os.environ["UPLOAD_DIR"])
+            if os.path.isfile(os.path.join(os.environ["UPLOAD_DIR"], name)) and not name.startswith(".")
+        ) or [None]
+
+        for offset in range(0, rows, BATCH_SIZE):
+            batch = []
+            for _ in range(min(BATCH_SIZE, rows - offset)):
+                created = start_date + timedelta(seconds=rng.randrange(0, 3 * 365 * 86400))
+                stamp = created.isoformat(sep=" ", timespec="microseconds")
+                batch.append((
+                    f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.randrange(10_000)}",
+                    " ".join(rng.choice(WORDS) for _ in range(12)),
+                    round(rng.uniform(1, 500), 2),
+                    rng.randrange(0, 500),
+                    rng.choice(images),
+                    rng.choice(seller_ids),
+                    1 if rng.random() < 0.95 else 0,
+                    stamp,
+                    stamp,
+                ))
+            cursor.executemany(
+                "INSERT INTO inventory (name, description, price, quantity, image, seller_id, "
+                "is_active, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                batch,
+            )
+            connection.commit()
+        cursor.execute("ANALYZE")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", default="1k", help="Row count or one of: " + ", ".join(SCALES))
+    parser.add_argument("--sellers", type=int, default=1000)
+    parser.add_argument("--customers", type=int, default=1000)
+    args = parser.parse_args()
+
+    rows = SCALES.get(args.rows.lower()) or int(args.rows)
+    start = time.perf_counter()
+    path = seed(rows, min(args.sellers, rows), args.customers)
+    print(f"Seeded {rows} rows into {path} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
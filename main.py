@@ -1,32 +1,115 @@
 from flask import Flask
 
-from src.routes.admin import admin
-from src.routes.auth import auth
-from src.routes.customer import customer
-from src.routes.seller import seller
-from src.routes.user import user
 from src.utilities.config import Config
-from src.utilities.database import init_table
 from src.utilities.logger import get_logger
 
 logger = get_logger(__name__)
-app = Flask(__name__)
-app.secret_key = Config.SECRET_KEY
 
 host = Config.HOST
 port = Config.PORT
 debug = Config.DEBUG
 
-app.register_blueprint(user, url_prefix="")
-app.register_blueprint(auth, url_prefix="/auth")
-app.register_blueprint(admin, url_prefix="/admin")
-app.register_blueprint(seller, url_prefix="/seller")
-app.register_blueprint(customer, url_prefix="/customer")
+
+def create_app() -> Flask:
+    """
+    Build the Flask application.
+
+    Routes and the modules behind them are imported here rather than at
+    the top of the file, so importing ``main`` stays cheap until an
+    application is actually needed.
+
+    Returns:
+        Flask: Configured application with every blueprint registered.
+    """
+    from src.routes.admin import admin
+    from src.routes.auth import auth
+    from src.routes.customer import customer
+    from src.routes.seller import seller
+    from src.routes.user import user
+    from src.utilities.database import engine
+    from src.utilities.http_cache import cache_static_assets
+    from src.utilities.images import image_variants
+    from src.utilities.instrumentation import init_instrumentation
+    from src.utilities.invalidation import invalidation_bus
+    from src.utilities.logger import sample_request
+    from src.utilities.query_guard import init_query_guard
+    from src.utilities.sessions import session_interface
+    from src.utilities.storage import storage
+
+    app = Flask(__name__)
+    app.secret_key = Config.SECRET_KEY
+    app.session_interface = session_interface
+
+    app.before_request(sample_request)
+    app.after_request(cache_static_assets)
+    init_instrumentation(app, engine)
+    init_query_guard(app)
+    app.add_template_global(image_variants)
+    app.add_template_global(storage.url, "upload_url")
+    # Forked server workers restart the poller in start_worker()
+    invalidation_bus.start(engine, Config.INVALIDATION_POLL_INTERVAL)
+
+    app.register_blueprint(user, url_prefix="")
+    app.register_blueprint(auth, url_prefix="/auth")
+    app.register_blueprint(admin, url_prefix="/admin")
+    app.register_blueprint(seller, url_prefix="/seller")
+    app.register_blueprint(customer, url_prefix="/customer")
+    return app
+
+
+def start_background_jobs() -> None:
+    """Start the process-wide background jobs; once per deployment, not per worker."""
+    from src.utilities.analytics import reconciler
+    from src.utilities.checkout import checkout
+    from src.utilities.database import engine
+    from src.utilities.images import image_pipeline
+    from src.utilities.migrations import backfill_runner
+    from src.utilities.storage import storage
+
+    storage.start_garbage_collector(engine, Config.STORAGE_GC_INTERVAL, Config.STORAGE_GC_GRACE)
+    checkout.start_sweeper(Config.RESERVATION_SWEEP_INTERVAL)
+    reconciler.start(engine, Config.ANALYTICS_RECONCILE_INTERVAL)
+    backfill_runner.start(engine, Config.MIGRATION_BATCH_SIZE, Config.MIGRATION_BATCH_PAUSE)
+    logger.info(f"Scheduled image variants for {image_pipeline.backfill()} uploads")
+
+
+def start_worker() -> None:
+    """Restart the per-process threads in a server worker forked from the parent."""
+    from src.utilities.invalidation import invalidation_bus
+
+    invalidation_bus.restart_after_fork()
+
+
+def share_worker_state() -> None:
+    """Keep carts and login limits in the database, so several worker processes agree on them."""
+    from src.utilities.cart import cart_store
+    from src.utilities.rate_limit import login_throttle
+
+    cart_store.use_write_through()
+    login_throttle.use_shared_backend()
+
+
+_app = None
+
+
+def __getattr__(name: str):
+    # ``from main import app`` still works: the app is built on first access
+    global _app
+    if name == "app":
+        if _app is None:
+            _app = create_app()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == '__main__':
+    from src.utilities.database import init_table
+
     logger.info("Application is starting")
+    app = create_app()
     with app.app_context():
         logger.info("Initializing database")
         init_table()
+    start_background_jobs()
     logger.info(f"Application started on {host}:{port}")
     app.run(host=host, port=port, debug=debug)
@@ -0,0 +1,61 @@
+"""
+Schema migration command line.
+
+``main.py`` and ``serve.py`` apply pending revisions at startup and run
+pending backfills in the background; this script does the same on
+demand, e.g. before a deploy, while the shop keeps serving traffic.
+
+Usage:
+    python migrate.py status
+    python migrate.py upgrade
+    python migrate.py backfill --batch-size 5000 --pause 0.1
+"""
+import argparse
+
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.logger import get_logger
+from src.utilities.migrations import (
+    BACKFILLS,
+    REVISIONS,
+    applied_revisions,
+    pending_backfills,
+    run_backfill,
+    upgrade,
+)
+
+logger = get_logger(__name__)
+
+
+def status() -> None:
+    applied = set(applied_revisions(engine))
+    for revision in REVISIONS:
+        mark = "x" if revision.revision in applied else " "
+        print(f"[{mark}] {revision.revision} {revision.description}")
+    for progress in pending_backfills(engine):
+        print(f"backfill {progress.name}: id {progress.last_id}/{progress.end_id}, {progress.rows} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply schema revisions and run backfills")
+    parser.add_argument("command", choices=("status", "upgrade", "backfill"))
+    parser.add_argument("--batch-size", type=int, default=Config.MIGRATION_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=Config.MIGRATION_BATCH_PAUSE)
+    args = parser.parse_args()
+
+    if args.command == "status":
+        status()
+    elif args.command == "upgrade":
+        applied = upgrade(engine)
+        print(f"Applied {len(applied)} revision(s): {', '.join(applied) or '-'}")
+    else:
+        for progress in pending_backfills(engine):
+            if progress.name not in BACKFILLS:
+                print(f"backfill {progress.name}: unknown to this code, skipped")
+                continue
+            rows = run_backfill(engine, progress.name, args.batch_size, args.pause)
+            print(f"backfill {progress.name}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Production entry point.
+
+Serves the application from several worker processes instead of the
+single-process development server started by ``main.py``. Defaults come
+from SERVER, WORKERS, THREADS, HOST and PORT in ``.env``.
+
+Usage:
+    python serve.py
+    python serve.py --workers 8 --threads 4
+    python serve.py --server gunicorn      # or asgi, if installed
+"""
+import argparse
+
+from main import create_app, share_worker_state, start_background_jobs, start_worker
+from src.utilities.config import Config
+from src.utilities.database import init_table
+from src.utilities.logger import get_logger
+from src.utilities.server import SERVERS, serve
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the application with multiple workers")
+    parser.add_argument("--server", choices=SERVERS, default=Config.SERVER)
+    parser.add_argument("--workers", type=int, default=Config.WORKERS)
+    parser.add_argument("--threads", type=int, default=Config.THREADS)
+    parser.add_argument("--host", default=Config.HOST)
+    parser.add_argument("--port", type=int, default=Config.PORT)
+    args = parser.parse_args()
+
+    # Schema setup runs once, before any worker exists
+    app = create_app()
+    with app.app_context():
+        init_table()
+    if args.workers > 1:
+        share_worker_state()
+    serve(app, args.host, args.port, args.workers, args.threads, args.server,
+          on_ready=start_background_jobs, on_worker_start=start_worker)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+from sqlmodel import Field, SQLModel
+
+
+class CatalogStats(SQLModel, table=True):
+    __tablename__ = "catalog_stats"
+
+    id: int = Field(default=1, primary_key=True)
+    active_items: int = Field(default=0)
+    inactive_items: int = Field(default=0)
+    stock_units: int = Field(default=0)
+    # Whole cents, so the triggers and the reconciler add up to the same value
+    stock_value_cents: int = Field(default=0)
+
+
+class SellerStats(SQLModel, table=True):
+    __tablename__ = "seller_stats"
+
+    seller_id: int = Field(foreign_key="users.id", primary_key=True)
+    active_items: int = Field(default=0)
+    inactive_items: int = Field(default=0)
+    stock_units: int = Field(default=0)
+    stock_value_cents: int = Field(default=0, index=True)
+
+
+class UserStats(SQLModel, table=True):
+    __tablename__ = "user_stats"
+
+    role: str = Field(primary_key=True)
+    active_users: int = Field(default=0)
+    inactive_users: int = Field(default=0)
+
+
+class DailyStats(SQLModel, table=True):
+    __tablename__ = "daily_stats"
+
+    day: str = Field(primary_key=True)
+    new_listings: int = Field(default=0)
+    new_signups: int = Field(default=0)
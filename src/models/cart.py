@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel, UniqueConstraint
+
+from src.utilities.helper import get_utc_now
+
+
+class CartItem(SQLModel, table=True):
+    __tablename__ = "cart_items"
+    __table_args__ = (UniqueConstraint("user_id", "inventory_id"),)
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id", nullable=False, index=True)
+    inventory_id: int = Field(foreign_key="inventory.id", nullable=False)
+    quantity: int = Field(default=1, gt=0)
+
+    created_at: datetime = Field(
+        default_factory=get_utc_now, alias="created_at"
+    )
+    updated_at: datetime = Field(
+        default_factory=get_utc_now, alias="updated_at"
+    )
@@ -0,0 +1,24 @@
+
+from sqlmodel import Field, SQLModel
+
+
+class ImportProgress(SQLModel, table=True):
+    __tablename__ = "import_jobs"
+
+    # Shared by every worker process, so any of them can answer a status poll
+    id: str = Field(primary_key=True)
+    seller_id: int = Field(foreign_key="users.id", nullable=False)
+    filename: str = Field(nullable=False)
+    file_format: str = Field(nullable=False)
+    total_bytes: int = Field(default=0)
+    status: str = Field(default="queued")
+    bytes_read: int = Field(default=0)
+    processed: int = Field(default=0)
+    inserted: int = Field(default=0)
+    error_count: int = Field(default=0)
+    # JSON list of [line, message], at most MAX_REPORTED_ERRORS entries
+    errors: str = Field(default="[]")
+    message: str = Field(default="")
+    # Unix timestamps, as reported by the status endpoint
+    started_at: float | None = Field(default=None)
+    finished_at: float | None = Field(default=None)
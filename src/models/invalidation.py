@@ -0,0 +1,9 @@
+from sqlmodel import Field, SQLModel
+
+
+class CacheVersion(SQLModel, table=True):
+    __tablename__ = "cache_versions"
+
+    # Cache namespace, e.g. "catalog"; bumped by whichever worker changed its data
+    channel: str = Field(primary_key=True)
+    version: int = Field(default=0, nullable=False)
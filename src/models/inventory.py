@@ -1,6 +1,8 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
+from sqlalchemy import text
 from sqlmodel import Field
 from sqlmodel import Relationship
 from sqlmodel import SQLModel
@@ -10,9 +12,17 @@ from src.utilities.helper import get_utc_now
 
 class Inventory(SQLModel, table=True):
     __tablename__ = "inventory"
+    __table_args__ = (
+        # Seller dashboard: seller_id = ? AND is_active = 1, one per sort column
+        Index("ix_inventory_seller_active_created", "seller_id", "is_active", "created_at"),
+        Index("ix_inventory_seller_active_price", "seller_id", "is_active", "price"),
+        Index("ix_inventory_seller_active_name", "seller_id", "is_active", "name"),
+        # Public catalog: active items only, newest first
+        Index("ix_inventory_active_created", "created_at", sqlite_where=text("is_active = 1")),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    name: str = Field(nullable=False, index=True)
+    name: str = Field(nullable=False)
     description: Optional[str] = Field(default=None)
     price: float = Field(nullable=False, gt=0)
     quantity: int = Field(default=0, ge=0)
@@ -25,10 +35,10 @@ class Inventory(SQLModel, table=True):
         back_populates=None,  # one-directional
     )
 
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     created_at: datetime = Field(
-        default_factory=get_utc_now, alias="created_at", index=True
+        default_factory=get_utc_now, alias="created_at"
     )
     updated_at: datetime = Field(
-        default_factory=get_utc_now, alias="updated_at", index=True
+        default_factory=get_utc_now, alias="updated_at"
     )
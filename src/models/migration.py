@@ -0,0 +1,26 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+from src.utilities.helper import get_utc_now
+
+
+class SchemaRevision(SQLModel, table=True):
+    __tablename__ = "schema_revisions"
+
+    revision: str = Field(primary_key=True)
+    applied_at: datetime = Field(default_factory=get_utc_now)
+
+
+class BackfillProgress(SQLModel, table=True):
+    __tablename__ = "backfills"
+
+    name: str = Field(primary_key=True)
+    # Highest primary key processed so far; the next batch starts after it
+    last_id: int = Field(default=0)
+    # Highest primary key when the backfill was scheduled; newer rows are
+    # already written by code that knows about the change
+    end_id: int = Field(default=0)
+    rows: int = Field(default=0)
+    done: bool = Field(default=False)
+    updated_at: datetime = Field(default_factory=get_utc_now)
@@ -0,0 +1,41 @@
+from datetime import datetime
+from enum import Enum
+
+from sqlmodel import Field, SQLModel
+
+from src.utilities.helper import get_utc_now
+
+
+class OrderStatus(str, Enum):
+    RESERVED = "reserved"
+    PAID = "paid"
+    EXPIRED = "expired"
+    CANCELLED = "cancelled"
+
+
+class Order(SQLModel, table=True):
+    __tablename__ = "orders"
+
+    id: int | None = Field(default=None, primary_key=True)
+    user_id: int = Field(foreign_key="users.id", nullable=False, index=True)
+    status: OrderStatus = Field(default=OrderStatus.RESERVED, index=True)
+    total: float = Field(default=0, ge=0)
+    expires_at: datetime = Field(nullable=False, index=True)
+
+    created_at: datetime = Field(
+        default_factory=get_utc_now, alias="created_at"
+    )
+    updated_at: datetime = Field(
+        default_factory=get_utc_now, alias="updated_at"
+    )
+
+
+class OrderLine(SQLModel, table=True):
+    __tablename__ = "order_lines"
+
+    id: int | None = Field(default=None, primary_key=True)
+    order_id: int = Field(foreign_key="orders.id", nullable=False, index=True)
+    inventory_id: int = Field(foreign_key="inventory.id", nullable=False)
+    name: str
+    quantity: int = Field(gt=0)
+    unit_price: float = Field(gt=0)
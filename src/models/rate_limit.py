@@ -0,0 +1,11 @@
+from sqlmodel import Field, SQLModel
+
+
+class RateLimitBucket(SQLModel, table=True):
+    __tablename__ = "rate_limits"
+
+    # "<limiter>:<identity>", e.g. "login-ip:203.0.113.7"
+    key: str = Field(primary_key=True)
+    tokens: float = Field(nullable=False)
+    # Unix time of the last refill; shared by every worker process
+    updated: float = Field(nullable=False, index=True)
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class StoredSession(SQLModel, table=True):
+    __tablename__ = "sessions"
+
+    id: str = Field(primary_key=True)
+    # Copied out of the payload so all of a user's sessions can be revoked
+    user_id: int | None = Field(default=None, foreign_key="users.id", index=True)
+    data: str = Field(nullable=False)
+    expires_at: datetime = Field(nullable=False, index=True)
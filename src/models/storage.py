@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+from src.utilities.helper import get_utc_now
+
+
+class StoredFile(SQLModel, table=True):
+    __tablename__ = "stored_files"
+
+    # Content address: "<sha256><ext>"
+    key: str = Field(primary_key=True)
+    ref_count: int = Field(default=0)
+
+    created_at: datetime = Field(
+        default_factory=get_utc_now, alias="created_at"
+    )
+    updated_at: datetime = Field(
+        default_factory=get_utc_now, alias="updated_at", index=True
+    )
@@ -23,12 +23,12 @@ class User(SQLModel, table=True):
     email_id: EmailStr = Field(unique=True, index=True)
     hashed_password: str = Field(nullable=False)
     phone_no: Optional[str] = None
-    role: UserRole = Field(default=UserRole.CUSTOMER, index=True)
+    role: UserRole = Field(default=UserRole.CUSTOMER)
 
-    is_active: bool = Field(default=True, index=True)
+    is_active: bool = Field(default=True)
     created_at: datetime = Field(
-        default_factory=get_utc_now, alias="created_at", index=True
+        default_factory=get_utc_now, alias="created_at"
     )
     updated_at: datetime = Field(
-        default_factory=get_utc_now, alias="updated_at", index=True
+        default_factory=get_utc_now, alias="updated_at"
     )
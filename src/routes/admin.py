@@ -1,9 +1,38 @@
 from flask import Blueprint
+from flask import abort
+from flask import flash
+from flask import jsonify
+from flask import redirect
 from flask import render_template
+from flask import request
+from flask import session
+from flask import url_for
+from sqlmodel import Session
 
+from src.models.inventory import Inventory
+from src.models.user import UserRole
+from src.utilities.analytics import analytics_summary
+from src.utilities.analytics import reconciler
+from src.utilities.cache import get_cache_metrics
+from src.utilities.cart import cart_store
+from src.utilities.checkout import checkout
+from src.utilities.database import engine
+from src.utilities.database import get_pool_metrics
+from src.utilities.export import export_response
+from src.utilities.export import export_statement
+from src.utilities.hashing import hashing_service
+from src.utilities.helper import get_utc_now
+from src.utilities.instrumentation import metrics as request_metrics
+from src.utilities.invalidation import invalidation_bus
+from src.utilities.logger import get_log_metrics
 from src.utilities.logger import get_logger
+from src.utilities.migrations import backfill_runner
+from src.utilities.queries import find_user_by_email
+from src.utilities.rate_limit import login_throttle
+from src.utilities.search import matching_ids
 from src.utilities.security import login_required
 from src.utilities.security import role_required
+from src.utilities.sessions import session_store
 
 logger = get_logger(__name__)
 admin = Blueprint("admin", __name__)
@@ -13,4 +42,83 @@ admin = Blueprint("admin", __name__)
 @login_required
 @role_required("admin")
 def dashboard():
-    return render_template("admin/dashboard.html")
+    with Session(engine) as db_session:
+        summary = analytics_summary(db_session)
+        return render_template("admin/dashboard.html", **summary)
+
+
+@admin.route("/users", methods=["POST"])
+@login_required
+@role_required("admin")
+def update_user():
+    email_id = request.form.get("email_id", "").strip()
+    try:
+        role = UserRole(request.form.get("role", ""))
+    except ValueError:
+        flash("Invalid role", "Error")
+        return redirect(url_for("admin.dashboard"))
+    is_active = request.form.get("is_active") == "1"
+
+    with Session(engine) as db_session:
+        db_user = find_user_by_email(db_session, email_id)
+        if not db_user:
+            flash(f"No account with email id {email_id}", "Error")
+            return redirect(url_for("admin.dashboard"))
+        if db_user.id == session["user_id"]:
+            flash("You cannot change your own account", "Error")
+            return redirect(url_for("admin.dashboard"))
+
+        db_user.role = role
+        db_user.is_active = is_active
+        db_user.updated_at = get_utc_now()
+        db_session.add(db_user)
+        db_session.commit()
+        user_id = db_user.id
+
+    # Cached state is invalidated on commit; a deactivated user is also
+    # logged out everywhere right away
+    revoked = 0 if is_active else session_store.delete_user(user_id)
+    message = f"Updated {email_id}: role={role.value} active={is_active}, {revoked} sessions revoked"
+    flash(message, "Success")
+    logger.info(message)
+    return redirect(url_for("admin.dashboard"))
+
+
+@admin.route("/metrics", methods=["GET"])
+@login_required
+@role_required("admin")
+def metrics():
+    return jsonify(
+        requests=request_metrics.snapshot(),
+        database_pool=get_pool_metrics(),
+        caches=get_cache_metrics(),
+        carts=cart_store.stats(),
+        checkout=checkout.stats(),
+        analytics=reconciler.stats(),
+        backfills=backfill_runner.stats(),
+        invalidation=invalidation_bus.stats(),
+        hashing=hashing_service.stats(),
+        login_throttle=login_throttle.stats(),
+        logging=get_log_metrics(),
+    )
+
+
+@admin.route("/export.<file_format>", methods=["GET"])
+@login_required
+@role_required("admin")
+def export_inventory(file_format: str):
+    conditions = []
+    seller_id = request.args.get("seller_id", type=int)
+    if seller_id is not None:
+        conditions.append(Inventory.seller_id == seller_id)
+    if request.args.get("include_inactive") != "1":
+        conditions.append(Inventory.is_active == True)
+    query = request.args.get("q", "").strip()
+    if query:
+        conditions.append(Inventory.id.in_(matching_ids(query)))
+
+    stmt = export_statement(*conditions, sort=request.args.get("sort", ""))
+    try:
+        return export_response(stmt, file_format, "inventory-all" if seller_id is None else f"inventory-{seller_id}")
+    except ValueError:
+        abort(404)
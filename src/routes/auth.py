@@ -6,15 +6,22 @@ from flask import request
 from flask import session
 from flask import url_for
 from sqlmodel import Session
-from sqlmodel import select
 
 from src.models.user import User
 from src.models.user import UserRole
 from src.utilities.database import engine
+from src.utilities.hashing import HashingBusyError
+from src.utilities.helper import get_utc_now
 from src.utilities.logger import get_logger
+from src.utilities.queries import find_user_by_email
+from src.utilities.rate_limit import LoginThrottled
+from src.utilities.rate_limit import login_throttle
+from src.utilities.security import dummy_verify
 from src.utilities.security import hash_password
 from src.utilities.security import login_required
+from src.utilities.security import needs_rehash
 from src.utilities.security import verify_password
+from src.utilities.sessions import rotate_session
 
 logger = get_logger(__name__)
 auth = Blueprint("auth", __name__)
@@ -49,9 +56,7 @@ def signup():
     phone_no = request.form.get("phone_no").strip()
 
     with Session(engine) as db_session:
-        db_user = db_session.exec(
-            select(User).where(User.email_id == email_id)
-        ).one_or_none()
+        db_user = find_user_by_email(db_session, email_id)
         if db_user:
             message = "Email ID already exists"
             flash(message, "Error")
@@ -101,23 +106,37 @@ def login():
         logger.error(message)
         return redirect(url_for("auth.login"))
 
+    # Before any database or bcrypt work, so floods are cheap to turn away
+    login_throttle.check(request.remote_addr or "", email_id)
+
     with Session(engine) as db_session:
         try:
-            db_user = db_session.exec(
-                select(User).where(User.email_id == email_id, User.is_active == True)  # noqa
-            ).one_or_none()
-            if not db_user:
-                message = "Invalid email id"
+            db_user = find_user_by_email(db_session, email_id, active_only=True)
+            # Unknown accounts pay for a bcrypt verify too and get the same
+            # message, so neither timing nor wording reveals which emails exist
+            if db_user is None:
+                password_ok = dummy_verify(password)
+            else:
+                password_ok = verify_password(password, db_user.hashed_password)
+            if not password_ok:
+                login_throttle.failed()
+                message = "Invalid email id or password"
                 flash(message, "Error")
-                logger.error(message)
+                logger.error(f"{message}: {email_id}")
                 return redirect(url_for("auth.login"))
 
-            if not verify_password(password, db_user.hashed_password):
-                message = "Invalid password"
-                flash(message, "Error")
-                logger.error(message)
-                return redirect(url_for("auth.login"))
+            login_throttle.succeeded(email_id)
 
+            if needs_rehash(db_user.hashed_password):
+                db_user.hashed_password = hash_password(password)
+                db_user.updated_at = get_utc_now()
+                db_session.add(db_user)
+                db_session.commit()
+                db_session.refresh(db_user)
+                logger.info(f"Password hash upgraded for user {db_user.id}")
+
+            # New session id on privilege change, against session fixation
+            rotate_session()
             session["user_id"] = db_user.id
             session["full_name"] = db_user.full_name
             session["role"] = db_user.role
@@ -144,6 +163,9 @@ def login():
 
             return redirect(url_for("user.index"))
 
+        except HashingBusyError:
+            raise
+
         except Exception as e:
             logger.exception(str(e))
             flash(str(e), "Error")
@@ -153,7 +175,20 @@ def login():
 @auth.route("/logout")
 @login_required
 def logout():
+    user_id, full_name = session.get("user_id"), session.get("full_name")
     session.clear()
-    logger.info(f"User logged out successfully: {session.get('full_name')}")
+    rotate_session()
+    logger.info(f"User logged out successfully: {full_name} (user {user_id})")
     flash("You have been logged out", "Success")
     return redirect(url_for("user.index"))
+
+
+@auth.errorhandler(LoginThrottled)
+def login_throttled(error):
+    return str(error), 429, {"Retry-After": str(max(1, round(error.retry_after)))}
+
+
+@auth.errorhandler(HashingBusyError)
+def hashing_busy(error):
+    logger.warning(f"Rejected {request.path}: {error}")
+    return "Service is busy, please try again shortly", 503, {"Retry-After": "1"}
@@ -1,6 +1,21 @@
 from flask import Blueprint
+from flask import abort
+from flask import flash
+from flask import redirect
 from flask import render_template
+from flask import request
+from flask import session
+from flask import url_for
+from sqlmodel import Session
+from sqlmodel import select
 
+from src.models.inventory import Inventory
+from src.models.order import Order
+from src.models.order import OrderLine
+from src.utilities.cart import cart_store
+from src.utilities.checkout import OutOfStockError
+from src.utilities.checkout import checkout
+from src.utilities.database import engine
 from src.utilities.logger import get_logger
 from src.utilities.security import login_required
 from src.utilities.security import role_required
@@ -13,4 +28,124 @@ customer = Blueprint("customer", __name__)
 @login_required
 @role_required("customer", "seller", "admin")
 def dashboard():
-    return render_template("customer/dashboard.html")
+    with Session(engine) as db_session:
+        lines, total = cart_store.view(db_session, session.get("user_id"))
+    return render_template("customer/dashboard.html", lines=lines, total=total)
+
+
+@customer.route("/cart/add/<int:item_id>", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def add_to_cart(item_id):
+    quantity = request.form.get("quantity", 1, type=int)
+    if quantity is None or quantity <= 0:
+        flash("Quantity must be a positive number", "Error")
+        return redirect(request.referrer or url_for("user.index"))
+
+    with Session(engine) as db_session:
+        item = db_session.exec(
+            select(Inventory.name, Inventory.quantity).where(
+                Inventory.id == item_id,
+                Inventory.is_active == True,
+            )
+        ).first()
+
+    if not item:
+        flash("Item not found", "Error")
+        return redirect(request.referrer or url_for("user.index"))
+
+    if item.quantity <= 0:
+        flash(f"'{item.name}' is out of stock", "Error")
+        return redirect(request.referrer or url_for("user.index"))
+
+    user_id = session.get("user_id")
+    cart_store.add(user_id, item_id, quantity)
+    flash(f"'{item.name}' added to cart", "Success")
+    logger.info(f"User {user_id} added item {item_id} x{quantity} to cart")
+    return redirect(request.referrer or url_for("customer.dashboard"))
+
+
+@customer.route("/cart/update/<int:item_id>", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def update_cart(item_id):
+    quantity = request.form.get("quantity", type=int)
+    if quantity is None or quantity < 0:
+        flash("Quantity must be 0 or greater", "Error")
+        return redirect(url_for("customer.dashboard"))
+
+    user_id = session.get("user_id")
+    if item_id not in cart_store.items(user_id):
+        flash("Item is not in your cart", "Error")
+        return redirect(url_for("customer.dashboard"))
+
+    cart_store.set_quantity(user_id, item_id, quantity)
+    flash("Cart updated", "Success")
+    return redirect(url_for("customer.dashboard"))
+
+
+@customer.route("/cart/remove/<int:item_id>", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def remove_from_cart(item_id):
+    cart_store.remove(session.get("user_id"), item_id)
+    flash("Item removed from cart", "Success")
+    return redirect(url_for("customer.dashboard"))
+
+
+@customer.route("/checkout", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def place_order():
+    user_id = session.get("user_id")
+    cart = cart_store.items(user_id)
+    if not cart:
+        flash("Your cart is empty", "Error")
+        return redirect(url_for("customer.dashboard"))
+
+    try:
+        order = checkout.reserve(user_id, cart)
+    except OutOfStockError as e:
+        flash(str(e), "Error")
+        logger.warning(f"Checkout for user {user_id} failed: {e}")
+        return redirect(url_for("customer.dashboard"))
+
+    cart_store.clear(user_id)
+    flash(f"Order #{order.id} reserved, complete payment to confirm it", "Success")
+    return redirect(url_for("customer.order_detail", order_id=order.id))
+
+
+@customer.route("/orders/<int:order_id>", methods=["GET"])
+@login_required
+@role_required("customer", "seller", "admin")
+def order_detail(order_id):
+    with Session(engine) as db_session:
+        order = db_session.exec(
+            select(Order).where(Order.id == order_id, Order.user_id == session.get("user_id"))
+        ).first()
+        if not order:
+            abort(404)
+        lines = db_session.exec(select(OrderLine).where(OrderLine.order_id == order_id)).all()
+        return render_template("customer/order.html", order=order, lines=lines)
+
+
+@customer.route("/orders/<int:order_id>/pay", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def pay_order(order_id):
+    if checkout.confirm(order_id, session.get("user_id")):
+        flash(f"Order #{order_id} paid", "Success")
+    else:
+        flash(f"Order #{order_id} can no longer be paid", "Error")
+    return redirect(url_for("customer.order_detail", order_id=order_id))
+
+
+@customer.route("/orders/<int:order_id>/cancel", methods=["POST"])
+@login_required
+@role_required("customer", "seller", "admin")
+def cancel_order(order_id):
+    if checkout.cancel(order_id, session.get("user_id")):
+        flash(f"Order #{order_id} cancelled", "Success")
+    else:
+        flash(f"Order #{order_id} can no longer be cancelled", "Error")
+    return redirect(url_for("customer.order_detail", order_id=order_id))
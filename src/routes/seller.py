@@ -1,29 +1,34 @@
-import os
-import re
-from math import ceil
-
 from flask import Blueprint
+from flask import abort
 from flask import flash
+from flask import jsonify
 from flask import redirect
 from flask import render_template
 from flask import request
 from flask import session
 from flask import url_for
 from sqlmodel import Session
-from sqlmodel import or_
-from sqlmodel import select
 
 from src.models.inventory import Inventory
+from src.utilities.bulk_import import bulk_importer
+from src.utilities.cache import catalog_cache
 from src.utilities.database import engine
+from src.utilities.export import export_response
+from src.utilities.export import export_statement
 from src.utilities.helper import get_utc_now
+from src.utilities.images import image_pipeline
 from src.utilities.logger import get_logger
+from src.utilities.pagination import paginate
+from src.utilities.queries import find_seller_item
+from src.utilities.queries import seller_listing
+from src.utilities.search import matching_ids
 from src.utilities.security import login_required
 from src.utilities.security import role_required
+from src.utilities.storage import storage
+from src.utilities.validation import validate_inventory
 
 logger = get_logger(__name__)
 seller = Blueprint("seller", __name__)
-UPLOAD_FOLDER = "static/uploads"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 ITEMS_PER_PAGE = 10
 
 
@@ -35,43 +40,34 @@ def dashboard():
     query = request.args.get("q", "").strip()
     sort = request.args.get("sort", "")
     page = request.args.get("page", 1, type=int)
+    cursor = request.args.get("cursor")
 
     with Session(engine) as db_session:
-        stmt = select(Inventory).where(
-            Inventory.seller_id == seller_id,
-            Inventory.is_active == True
-        )
+        stmt = seller_listing(seller_id)
 
         if query:
-            stmt = stmt.where(
-                or_(
-                    Inventory.name.ilike(f"%{query}%"),
-                    Inventory.description.ilike(f"%{query}%")
-                )
-            )
-
-        total_items = len(db_session.exec(stmt).all())
-        total_pages = ceil(total_items / ITEMS_PER_PAGE)
-
-        if sort == "name_asc":
-            stmt = stmt.order_by(Inventory.name.asc())
-        elif sort == "name_desc":
-            stmt = stmt.order_by(Inventory.name.desc())
-        elif sort == "price_asc":
-            stmt = stmt.order_by(Inventory.price.asc())
-        elif sort == "price_desc":
-            stmt = stmt.order_by(Inventory.price.desc())
-        elif sort == "date_asc":
-            stmt = stmt.order_by(Inventory.created_at.asc())
-        elif sort == "date_desc":
-            stmt = stmt.order_by(Inventory.created_at.desc())
-        else:
-            stmt = stmt.order_by(Inventory.created_at.desc())
-
-        stmt = stmt.offset((page - 1) * ITEMS_PER_PAGE).limit(ITEMS_PER_PAGE)
-        inventories = db_session.exec(stmt).all()
+            stmt = stmt.where(Inventory.id.in_(matching_ids(query)))
+
+        result = paginate(db_session, stmt, sort=sort, page=page, per_page=ITEMS_PER_PAGE, cursor=cursor)
     return render_template("seller/dashboard.html",
-                           inventories=inventories, total_pages=total_pages, page=page, search_query=query, sort=sort)
+                           inventories=result.items, total_pages=result.total_pages, page=result.page,
+                           next_cursor=result.next_cursor, search_query=query, sort=sort)
+
+
+@seller.route("/export.<file_format>", methods=["GET"])
+@login_required
+@role_required("seller", "admin")
+def export_inventory(file_format: str):
+    conditions = [Inventory.seller_id == session.get("user_id"), Inventory.is_active == True]
+    query = request.args.get("q", "").strip()
+    if query:
+        conditions.append(Inventory.id.in_(matching_ids(query)))
+
+    stmt = export_statement(*conditions, sort=request.args.get("sort", ""))
+    try:
+        return export_response(stmt, file_format, "inventory")
+    except ValueError:
+        abort(404)
 
 
 @seller.route("/add-inventory", methods=["GET", "POST"])
@@ -81,62 +77,27 @@ def add_inventory():
     if request.method == "GET":
         return render_template("seller/add-inventory.html")
 
-    name = request.form.get("name").strip()
-    description = request.form.get("description").strip()
-    if not name or not description:
-        message = "Name and description are required"
-        flash(message, "Error")
-        logger.error(message)
-        return redirect(url_for("seller.add_inventory"))
-
-    price = request.form.get("price").strip()
-    if not price:
-        message = "Price is required"
-        flash(message, "Error")
-        logger.error(message)
-        return redirect(url_for("seller.add_inventory"))
-
     try:
-        price = float(price)
-        if price <= 0:
-            raise ValueError
-    except ValueError:
-        message = "Price must be a positive number"
-        flash(message, "Error")
-        logger.error(message)
-        return redirect(url_for("seller.add_inventory"))
-
-    quantity = request.form.get("quantity").strip()
-    if not quantity:
-        message = "Quantity is required"
+        fields = validate_inventory(
+            request.form.get("name"),
+            request.form.get("description"),
+            request.form.get("price"),
+            request.form.get("quantity"),
+        )
+    except ValueError as e:
+        message = str(e)
         flash(message, "Error")
         logger.error(message)
         return redirect(url_for("seller.add_inventory"))
 
-    try:
-        quantity = int(quantity)
-        if quantity < 0:
-            raise ValueError
-    except ValueError:
-        flash("Quantity must be 0 or greater", "Error")
-        return redirect(url_for("seller.add_inventory"))
-
-    image_file = request.files.get("image")
-    image_filename = None
-    safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', name)
-    if image_file and image_file.filename != "":
-        ext = os.path.splitext(image_file.filename)[1]
-        image_filename = f"{safe_name}_{get_utc_now().strftime('%Y_%m_%d_%H_%M_%S')}{ext}"
-        image_path = os.path.join(UPLOAD_FOLDER, image_filename)
-        image_file.save(image_path)
+    image_filename = storage.save_upload(request.files.get("image"))
+    if image_filename and storage.backend.local_path(image_filename):
+        image_pipeline.schedule(image_filename)
 
     seller_id = session.get("user_id")
 
     new_item = Inventory(
-        name=name,
-        description=description,
-        price=price,
-        quantity=quantity,
+        **fields,
         image=image_filename,
         seller_id=seller_id,
     )
@@ -145,8 +106,10 @@ def add_inventory():
         with Session(engine) as db_session:
 
             db_session.add(new_item)
+            storage.acquire(db_session, new_item.image)
             db_session.commit()
             db_session.refresh(new_item)
+            catalog_cache.invalidate()
 
             flash(f"Inventory item '{new_item.name}' added successfully", "Success")
             logger.info(f"Inventory added by seller {seller_id}: {new_item.name}")
@@ -165,13 +128,7 @@ def delete_inventory(item_id: int):
     seller_id = session.get("user_id")
     try:
         with Session(engine) as db:
-            item = db.exec(
-                select(Inventory).where(
-                    Inventory.id == item_id,
-                    Inventory.seller_id == seller_id,
-                    Inventory.is_active == True,
-                )
-            ).one_or_none()
+            item = find_seller_item(db, item_id, seller_id)
 
             if not item:
                 message = "Inventory item not found or access denied"
@@ -183,8 +140,10 @@ def delete_inventory(item_id: int):
             item.updated_at = get_utc_now()
 
             db.add(item)
+            storage.release(db, item.image)
             db.commit()
             db.refresh(item)
+            catalog_cache.invalidate()
 
             message = f"Inventory '{item.name}' removed successfully"
             flash(message, "Success")
@@ -203,13 +162,7 @@ def update_inventory(item_id: int):
     seller_id = session.get("user_id")
 
     with Session(engine) as db:
-        inventory = db.exec(
-            select(Inventory).where(
-                Inventory.id == item_id,
-                Inventory.seller_id == seller_id,
-                Inventory.is_active == True,  # noqa
-            )
-        ).one_or_none()
+        inventory = find_seller_item(db, item_id, seller_id)
 
         if not inventory:
             message = "Inventory item not found"
@@ -227,20 +180,19 @@ def update_inventory(item_id: int):
             inventory.quantity = int(request.form.get("quantity"))
             inventory.updated_at = get_utc_now()
 
-            image_file = request.files.get("image")
-            safe_name = re.sub(r'[^a-zA-Z0-9_-]', '_', inventory.name)
-            if image_file and image_file.filename != "":
-                ext = os.path.splitext(image_file.filename)[1]
-                image_filename = f"{safe_name}_{get_utc_now().strftime('%Y_%m_%d_%H_%M_%S')}{ext}"
-                image_path = os.path.join(UPLOAD_FOLDER, image_filename)
-                old_image_path = os.path.join(UPLOAD_FOLDER, inventory.image)
-                image_file.save(image_path)
+            image_filename = storage.save_upload(request.files.get("image"))
+            if image_filename and image_filename != inventory.image:
+                if storage.backend.local_path(image_filename):
+                    image_pipeline.schedule(image_filename)
+                # The old file is removed by the storage garbage collector
+                storage.release(db, inventory.image)
+                storage.acquire(db, image_filename)
                 inventory.image = image_filename
-                os.remove(old_image_path)
 
             db.add(inventory)
             db.commit()
             db.refresh(inventory)
+            catalog_cache.invalidate()
 
             flash("Inventory updated successfully", "Success")
             logger.info(f"Inventory updated: {inventory.id}")
@@ -251,3 +203,41 @@ def update_inventory(item_id: int):
             flash("Failed to update inventory", "Error")
 
     return redirect(url_for("seller.dashboard"))
+
+
+@seller.route("/import-inventory", methods=["GET", "POST"])
+@login_required
+@role_required("seller")
+def import_inventory():
+    if request.method == "GET":
+        return render_template("seller/import-inventory.html")
+
+    try:
+        job = bulk_importer.submit(session.get("user_id"), request.files.get("file"))
+    except ValueError as e:
+        message = str(e)
+        flash(message, "Error")
+        logger.error(message)
+        return redirect(url_for("seller.import_inventory"))
+
+    return redirect(url_for("seller.import_progress", job_id=job.id))
+
+
+@seller.route("/import-inventory/<job_id>", methods=["GET"])
+@login_required
+@role_required("seller")
+def import_progress(job_id: str):
+    job = bulk_importer.get(job_id, session.get("user_id"))
+    if job is None:
+        abort(404)
+    return render_template("seller/import-progress.html", job=job.snapshot())
+
+
+@seller.route("/import-inventory/<job_id>/status", methods=["GET"])
+@login_required
+@role_required("seller")
+def import_status(job_id: str):
+    job = bulk_importer.get(job_id, session.get("user_id"))
+    if job is None:
+        abort(404)
+    return jsonify(job.snapshot())
@@ -2,27 +2,70 @@ from flask import Blueprint
 from flask import render_template
 from flask import request
 from sqlmodel import Session
-from sqlmodel import select
 
 from src.models.inventory import Inventory
+from src.utilities.cache import catalog_cache
 from src.utilities.database import engine
+from src.utilities.http_cache import conditional_render
 from src.utilities.logger import get_logger
+from src.utilities.pagination import paginate
+from src.utilities.queries import catalog_listing
+from src.utilities.search import ranked_matches
 
 logger = get_logger(__name__)
 user = Blueprint("user", __name__)
+ITEMS_PER_PAGE = 8
 
 
 @user.route('/')
 def index():
-    page = int(request.args.get("page", 1))
-    per_page = 8
-    offset = (page - 1) * per_page
-
-    with Session(engine) as db_session:
-        inventories = db_session.exec(
-            select(Inventory)
-            .where(Inventory.is_active == True)  # noqa
-            .offset(offset)
-            .limit(per_page)
-        ).all()
-    return render_template('index.html', inventories=inventories, page=page)
+    # Keyset pagination unless a numbered page is explicitly requested
+    page = request.args.get("page", type=int)
+    cursor = request.args.get("cursor", "" if page is None else None)
+
+    def load_page():
+        with Session(engine) as db_session:
+            return paginate(
+                db_session,
+                catalog_listing(),
+                page=page or 1,
+                per_page=ITEMS_PER_PAGE,
+                cursor=cursor,
+            )
+
+    result = catalog_cache.get_or_load(("index", page, cursor), load_page)
+    return conditional_render(
+        result.items,
+        lambda: render_template('index.html', inventories=result.items, page=result.page,
+                                next_cursor=result.next_cursor),
+    )
+
+
+@user.route('/search')
+def search():
+    query = request.args.get("q", "").strip()
+    page = request.args.get("page", 1, type=int)
+    page = max(page, 1)
+
+    inventories = []
+    has_next = False
+    if query:
+        matches = ranked_matches(query)
+        with Session(engine) as db_session:
+            rows = db_session.exec(
+                catalog_listing()
+                .join(matches, matches.c.rowid == Inventory.id)
+                .order_by(matches.c.rank, Inventory.id)
+                .offset((page - 1) * ITEMS_PER_PAGE)
+                .limit(ITEMS_PER_PAGE + 1)
+            ).all()
+        inventories = rows[:ITEMS_PER_PAGE]
+        has_next = len(rows) > ITEMS_PER_PAGE
+        logger.debug(f"Catalog search {query!r} returned {len(inventories)} items")
+
+    return conditional_render(
+        inventories,
+        lambda: render_template('index.html', inventories=inventories, page=page, next_cursor=None,
+                                search_query=query, has_next=has_next),
+        has_next,
+    )
@@ -0,0 +1,350 @@
+"""
+Incrementally maintained catalog and user analytics.
+
+This module provides:
+- Triggers that keep the summary tables (``catalog_stats``,
+  ``seller_stats``, ``user_stats``, ``daily_stats``) in step with every
+  write to ``inventory`` and ``users``, whichever code path makes it
+- A reconciler that recomputes the summaries from the base tables
+  outside the write lock, corrects any drift and runs periodically in
+  the background
+- A dashboard query that only reads the summaries, so its cost does not
+  grow with the catalog
+
+Usage:
+    from src.utilities.analytics import analytics_summary
+    summary = analytics_summary(db_session)
+"""
+import threading
+from datetime import timedelta
+
+from sqlalchemy import text
+from sqlmodel import Session, select
+
+from src.models.analytics import CatalogStats, DailyStats, SellerStats, UserStats
+from src.models.user import User
+from src.utilities.helper import get_utc_now
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (sign, row alias) pairs; an UPDATE applies the new row and removes the old one
+Terms = list[tuple[str, str]]
+
+# Stock value of one active row, in whole cents. Triggers and the
+# reconciler both add up this per-row value, so their totals match exactly
+ACTIVE_VALUE_CENTS = "CASE WHEN {row}.is_active THEN CAST(round({row}.quantity * {row}.price * 100) AS INTEGER) ELSE 0 END"
+
+
+def _delta(terms: Terms, expression: str) -> str:
+    return " ".join(f"{sign} ({expression.format(row=row)})" for sign, row in terms)
+
+
+def _apply_inventory(terms: Terms, key: str, table: str, key_column: str) -> str:
+    active_units = "CASE WHEN {row}.is_active THEN {row}.quantity ELSE 0 END"
+    return f"""
+        INSERT OR IGNORE INTO {table} ({key_column}, active_items, inactive_items, stock_units, stock_value_cents)
+        VALUES ({key}, 0, 0, 0, 0);
+        UPDATE {table} SET
+            active_items = active_items {_delta(terms, "{row}.is_active = 1")},
+            inactive_items = inactive_items {_delta(terms, "{row}.is_active = 0")},
+            stock_units = stock_units {_delta(terms, active_units)},
+            stock_value_cents = stock_value_cents {_delta(terms, ACTIVE_VALUE_CENTS)}
+        WHERE {key_column} = {key};
+    """
+
+
+def _apply_catalog(terms: Terms) -> str:
+    return _apply_inventory(terms, "1", "catalog_stats", "id")
+
+
+def _apply_seller(terms: Terms, row: str) -> str:
+    return _apply_inventory(terms, f"{row}.seller_id", "seller_stats", "seller_id")
+
+
+def _apply_users(terms: Terms, row: str) -> str:
+    return f"""
+        INSERT OR IGNORE INTO user_stats (role, active_users, inactive_users) VALUES ({row}.role, 0, 0);
+        UPDATE user_stats SET
+            active_users = active_users {_delta(terms, "{row}.is_active = 1")},
+            inactive_users = inactive_users {_delta(terms, "{row}.is_active = 0")}
+        WHERE role = {row}.role;
+    """
+
+
+def _count_day(column: str) -> str:
+    return f"""
+        INSERT OR IGNORE INTO daily_stats (day, new_listings, new_signups)
+        VALUES (substr(new.created_at, 1, 10), 0, 0);
+        UPDATE daily_stats SET {column} = {column} + 1 WHERE day = substr(new.created_at, 1, 10);
+    """
+
+
+NEW = [("+", "new")]
+OLD = [("-", "old")]
+CHANGE = [("+", "new"), ("-", "old")]
+
+TRIGGERS = {
+    "analytics_inventory_ai": f"""
+        AFTER INSERT ON inventory BEGIN
+            {_apply_catalog(NEW)}
+            {_apply_seller(NEW, "new")}
+            {_count_day("new_listings")}
+        END
+    """,
+    "analytics_inventory_ad": f"""
+        AFTER DELETE ON inventory BEGIN
+            {_apply_catalog(OLD)}
+            {_apply_seller(OLD, "old")}
+        END
+    """,
+    # Most updates (stock decrements, edits) keep the seller: one pass per table
+    "analytics_inventory_au": f"""
+        AFTER UPDATE OF price, quantity, is_active ON inventory
+        WHEN old.seller_id = new.seller_id BEGIN
+            {_apply_catalog(CHANGE)}
+            {_apply_seller(CHANGE, "new")}
+        END
+    """,
+    "analytics_inventory_au_seller": f"""
+        AFTER UPDATE OF seller_id ON inventory
+        WHEN old.seller_id != new.seller_id BEGIN
+            {_apply_catalog(CHANGE)}
+            {_apply_seller(OLD, "old")}
+            {_apply_seller(NEW, "new")}
+        END
+    """,
+    "analytics_users_ai": f"""
+        AFTER INSERT ON users BEGIN
+            {_apply_users(NEW, "new")}
+            {_count_day("new_signups")}
+        END
+    """,
+    "analytics_users_ad": f"""
+        AFTER DELETE ON users BEGIN
+            {_apply_users(OLD, "old")}
+        END
+    """,
+    "analytics_users_au": f"""
+        AFTER UPDATE OF role, is_active ON users BEGIN
+            {_apply_users(OLD, "old")}
+            {_apply_users(NEW, "new")}
+        END
+    """,
+}
+
+# Summary table -> (key column, counter columns, query computing it from the base tables)
+_EXPECTED = {
+    "catalog_stats": (
+        "id", ("active_items", "inactive_items", "stock_units", "stock_value_cents"),
+        f"""
+        SELECT 1,
+               coalesce(sum(is_active = 1), 0),
+               coalesce(sum(is_active = 0), 0),
+               coalesce(sum(CASE WHEN is_active THEN quantity ELSE 0 END), 0),
+               coalesce(sum({ACTIVE_VALUE_CENTS.format(row="inventory")}), 0)
+        FROM inventory
+        """,
+    ),
+    "seller_stats": (
+        "seller_id", ("active_items", "inactive_items", "stock_units", "stock_value_cents"),
+        f"""
+        SELECT seller_id,
+               sum(is_active = 1),
+               sum(is_active = 0),
+               sum(CASE WHEN is_active THEN quantity ELSE 0 END),
+               sum({ACTIVE_VALUE_CENTS.format(row="inventory")})
+        FROM inventory GROUP BY seller_id
+        """,
+    ),
+    "user_stats": (
+        "role", ("active_users", "inactive_users"),
+        "SELECT role, sum(is_active = 1), sum(is_active = 0) FROM users GROUP BY role",
+    ),
+    "daily_stats": (
+        "day", ("new_listings", "new_signups"),
+        """
+        SELECT day, sum(listing), sum(signup) FROM (
+            SELECT substr(created_at, 1, 10) AS day, 1 AS listing, 0 AS signup FROM inventory
+            UNION ALL
+            SELECT substr(created_at, 1, 10), 0, 1 FROM users
+        ) GROUP BY day
+        """,
+    ),
+}
+
+
+def init_analytics(connection) -> None:
+    """
+    Create the analytics triggers, replacing any whose body changed.
+
+    When triggers are created against existing data the summary tables
+    are rebuilt once from the base tables.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+    """
+    existing = dict(connection.execute(
+        text("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'analytics_%'")
+    ).all())
+    changed = False
+    for name, body in TRIGGERS.items():
+        statement = f"CREATE TRIGGER {name} {body.strip()}"
+        if existing.get(name) != statement:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            connection.execute(text(statement))
+            changed = True
+
+    if changed:
+        rebuild(connection)
+        logger.info("Analytics summary tables built")
+
+
+def rebuild(connection) -> None:
+    """
+    Replace every summary table with rows computed from the base tables.
+
+    Holds the write lock for the whole rebuild; meant for schema setup,
+    the periodic check is :func:`reconcile`.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+    """
+    for table, (key, columns, query) in _EXPECTED.items():
+        connection.execute(text(f"DELETE FROM {table}"))
+        connection.execute(text(f"INSERT INTO {table} ({key}, {', '.join(columns)}) {query}"))
+
+
+def _drift_query(table: str, key: str, columns: tuple[str, ...], query: str) -> str:
+    # Expected minus stored, per key, in one statement and so one snapshot
+    stored = ", ".join(f"-{column} AS {column}" for column in columns)
+    return f"""
+        SELECT {key}, {", ".join(f"sum({column})" for column in columns)} FROM (
+            SELECT {key}, {stored} FROM {table}
+            UNION ALL
+            SELECT * FROM ({query})
+        ) GROUP BY {key}
+        HAVING {" OR ".join(f"sum({column}) != 0" for column in columns)}
+    """
+
+
+def reconcile(engine) -> int:
+    """
+    Compare every summary table with the base tables and correct drift.
+
+    The expected aggregates are computed in read-only statements, so the
+    full scans never hold the write lock. Each statement diffs a table
+    against its summary within one snapshot, and the difference is then
+    applied as a delta in a short write transaction. Triggers move the
+    base rows and their summary together, so a write committed in
+    between leaves that difference unchanged.
+
+    Args:
+        engine (Engine): Database engine.
+
+    Returns:
+        int: Number of summary rows that were wrong or missing.
+    """
+    corrections = {}
+    with engine.connect() as connection:
+        for table, (key, columns, query) in _EXPECTED.items():
+            rows = connection.execute(text(_drift_query(table, key, columns, query))).all()
+            if rows:
+                corrections[table] = [dict(zip(("key", *columns), row)) for row in rows]
+
+    if not corrections:
+        return 0
+
+    with engine.begin() as connection:
+        for table, rows in corrections.items():
+            key, columns, _ = _EXPECTED[table]
+            connection.execute(
+                text(f"INSERT OR IGNORE INTO {table} ({key}, {', '.join(columns)}) "
+                     f"VALUES (:key, {', '.join('0' for _ in columns)})"),
+                rows,
+            )
+            connection.execute(
+                text(f"UPDATE {table} SET {', '.join(f'{column} = {column} + :{column}' for column in columns)} "
+                     f"WHERE {key} = :key"),
+                rows,
+            )
+    return sum(len(rows) for rows in corrections.values())
+
+
+class AnalyticsReconciler:
+    """Run :func:`reconcile` on a daemon thread at a fixed interval."""
+
+    def __init__(self):
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.runs = 0
+        self.corrected_rows = 0
+
+    def start(self, engine, interval: float) -> None:
+        """
+        Start reconciling every ``interval`` seconds.
+
+        Args:
+            engine (Engine): Database engine.
+            interval (float): Seconds between runs.
+        """
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    corrected = reconcile(engine)
+                    self.runs += 1
+                    self.corrected_rows += corrected
+                    if corrected:
+                        logger.warning(f"Analytics reconciler corrected {corrected} summary rows")
+                except Exception:
+                    logger.exception("Analytics reconcile failed")
+
+        self._thread = threading.Thread(target=run, name="analytics-reconciler", daemon=True)
+        self._thread.start()
+
+    def stats(self) -> dict:
+        return {"runs": self.runs, "corrected_rows": self.corrected_rows}
+
+
+reconciler = AnalyticsReconciler()
+
+
+def analytics_summary(db_session: Session, days: int = 14, top_sellers: int = 10) -> dict:
+    """
+    Read the admin dashboard numbers from the summary tables.
+
+    Every query is a primary-key or index lookup with a fixed limit.
+
+    Args:
+        db_session (Session): Open database session.
+        days (int): Length of the daily history, ending today (UTC).
+        top_sellers (int): Sellers listed, by stock value.
+
+    Returns:
+        dict: ``catalog``, ``users``, ``sellers`` and ``daily`` entries.
+    """
+    catalog = db_session.get(CatalogStats, 1) or CatalogStats()
+    users = db_session.exec(select(UserStats).order_by(UserStats.role)).all()
+    sellers = db_session.exec(
+        select(SellerStats, User.full_name)
+        .join(User, User.id == SellerStats.seller_id)
+        .order_by(SellerStats.stock_value_cents.desc())
+        .limit(top_sellers)
+    ).all()
+
+    today = get_utc_now().date()
+    first_day = (today - timedelta(days=days - 1)).isoformat()
+    recorded = {
+        row.day: row for row in db_session.exec(
+            select(DailyStats).where(DailyStats.day >= first_day).order_by(DailyStats.day)
+        ).all()
+    }
+    daily = []
+    for offset in range(days):
+        day = (today - timedelta(days=days - 1 - offset)).isoformat()
+        daily.append(recorded.get(day) or DailyStats(day=day))
+
+    return {"catalog": catalog, "users": users, "sellers": sellers, "daily": daily}
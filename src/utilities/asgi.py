@@ -0,0 +1,154 @@
+"""
+ASGI adapter for the WSGI application.
+
+This module provides:
+- ASGIAdapter: serves a WSGI app from an ASGI server, running the app on
+  a bounded thread pool while the event loop owns the connections
+- Streaming of WSGI response iterables chunk by chunk, so exports are
+  not buffered in memory
+
+Usage:
+    from src.utilities.asgi import ASGIAdapter
+    application = ASGIAdapter(app, threads=8)   # uvicorn asgi:application
+"""
+import asyncio
+import io
+import sys
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+
+def build_environ(scope: dict[str, Any], body: bytes) -> dict[str, Any]:
+    """
+    Translate an ASGI HTTP scope into a WSGI environ.
+
+    Args:
+        scope (dict): ASGI ``http`` scope.
+        body (bytes): Complete request body.
+
+    Returns:
+        dict: WSGI environ.
+    """
+    server = scope.get("server") or ("localhost", 80)
+    client = scope.get("client") or ("", 0)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": str(server[0]),
+        "SERVER_PORT": str(server[1]),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "REMOTE_ADDR": client[0],
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        # The body is fully buffered, so it can be read without a Content-Length
+        "wsgi.input_terminated": True,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        key = name if name in ("CONTENT_TYPE", "CONTENT_LENGTH") else f"HTTP_{name}"
+        value = raw_value.decode("latin-1")
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+class ASGIAdapter:
+    """
+    ASGI application wrapping a WSGI one.
+
+    Args:
+        wsgi_app (Callable): WSGI application, e.g. the Flask app.
+        threads (int): Requests run concurrently per process.
+    """
+
+    def __init__(self, wsgi_app: Callable, threads: int):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(threads, thread_name_prefix="asgi")
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+        elif scope["type"] == "http":
+            await self._http(scope, receive, send)
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _http(self, scope, receive, send) -> None:
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+
+        loop = asyncio.get_running_loop()
+        environ = build_environ(scope, bytes(body))
+        status, headers, chunks = await loop.run_in_executor(self.executor, self._start, environ)
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+
+        # Pull the rest of the body off the pool chunk by chunk
+        iterator = iter(chunks)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(self.executor, next, iterator, None)
+                if chunk is None:
+                    break
+                if chunk:
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                await loop.run_in_executor(self.executor, close)
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    def _start(self, environ: dict[str, Any]) -> tuple[int, list[tuple[bytes, bytes]], Any]:
+        response: dict[str, Any] = {}
+        written: list[bytes] = []
+
+        def start_response(status: str, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [
+                (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers
+            ]
+            return written.append
+
+        chunks = self.wsgi_app(environ, start_response)
+        iterator = iter(chunks)
+        # start_response may be deferred until the first chunk is produced
+        first = b"" if "status" in response else next(iterator, b"")
+        return response["status"], response["headers"], _Prepend(b"".join(written) + first, iterator, chunks)
+
+
+class _Prepend:
+    """Iterable yielding ``first`` then the rest; close() closes the app's iterable."""
+
+    def __init__(self, first: bytes, rest, original):
+        self.first = first
+        self.rest = rest
+        self.original = original
+
+    def __iter__(self):
+        yield self.first
+        yield from self.rest
+
+    def close(self) -> None:
+        close = getattr(self.original, "close", None)
+        if close is not None:
+            close()
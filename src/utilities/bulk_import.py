@@ -0,0 +1,351 @@
+"""
+Bulk inventory import from CSV or JSONL uploads.
+
+This module provides:
+- Streaming row parsers for CSV and JSONL files; rows are read one at a
+  time, so file size does not affect memory use
+- Validation with the same rules as the single-item form
+- Batched ``executemany`` inserts, one transaction per batch
+- Background import jobs with progress counters and per-row errors,
+  stored in ``import_jobs`` so every worker process can report them
+
+Usage:
+    from src.utilities.bulk_import import bulk_importer
+    job = bulk_importer.submit(seller_id, request.files["file"])
+    bulk_importer.get(job.id, seller_id).snapshot()
+"""
+import codecs
+import csv
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import IO
+
+from sqlalchemy import delete, insert, select, update
+from werkzeug.datastructures import FileStorage
+
+from src.models.import_job import ImportProgress
+from src.models.inventory import Inventory
+from src.utilities.cache import catalog_cache
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.helper import get_utc_now
+from src.utilities.logger import get_logger
+from src.utilities.validation import validate_inventory
+
+logger = get_logger(__name__)
+
+FORMATS = ("csv", "jsonl")
+COPY_CHUNK_SIZE = 64 * 1024
+MAX_REPORTED_ERRORS = 500
+MAX_FINISHED_JOBS = 100
+# Seconds between progress writes while rows are parsed between batches
+PROGRESS_INTERVAL = 0.5
+
+_jobs = ImportProgress.__table__
+
+
+def detect_format(filename: str) -> str | None:
+    """Map an upload's extension to ``csv`` or ``jsonl`` (``.ndjson`` too)."""
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return None
+
+
+def iter_csv(stream: IO[bytes]) -> Iterator[tuple[int, object]]:
+    """
+    Yield ``(line_number, row)`` from a CSV file with a header row.
+
+    A row is a dict keyed by lower-cased header names.
+    """
+    reader = csv.reader(codecs.iterdecode(stream, "utf-8-sig"))
+    header = next(reader, None)
+    if header is None:
+        return
+    keys = [name.strip().lower() for name in header]
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        yield reader.line_num, dict(zip(keys, row))
+
+
+def iter_jsonl(stream: IO[bytes]) -> Iterator[tuple[int, object]]:
+    """
+    Yield ``(line_number, row)`` from a JSON Lines file.
+
+    A line that is not a JSON object is yielded as a ``ValueError``
+    so the caller can report it against its line number.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield line_number, ValueError(f"Invalid JSON: {e.args[0]}")
+            continue
+        if not isinstance(row, dict):
+            yield line_number, ValueError("Expected a JSON object")
+            continue
+        yield line_number, {str(key).lower(): value for key, value in row.items()}
+
+
+PARSERS = {"csv": iter_csv, "jsonl": iter_jsonl}
+
+
+@dataclass
+class ImportJob:
+    """Progress and outcome of one import."""
+
+    id: str
+    seller_id: int
+    filename: str
+    file_format: str
+    total_bytes: int
+    status: str = "queued"
+    bytes_read: int = 0
+    processed: int = 0
+    inserted: int = 0
+    error_count: int = 0
+    errors: list[tuple[int, str]] = field(default_factory=list)
+    message: str = ""
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def add_error(self, line_number: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line_number, message))
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def progress_values(self) -> dict:
+        """Columns of ``import_jobs`` that change while the job runs."""
+        return {
+            "status": self.status,
+            "bytes_read": self.bytes_read,
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "error_count": self.error_count,
+            "errors": json.dumps(self.errors),
+            "message": self.message,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    @classmethod
+    def from_row(cls, row) -> "ImportJob":
+        return cls(
+            id=row.id, seller_id=row.seller_id, filename=row.filename, file_format=row.file_format,
+            total_bytes=row.total_bytes, status=row.status, bytes_read=row.bytes_read,
+            processed=row.processed, inserted=row.inserted, error_count=row.error_count,
+            errors=[tuple(error) for error in json.loads(row.errors)], message=row.message,
+            started_at=row.started_at, finished_at=row.finished_at,
+        )
+
+    def snapshot(self) -> dict:
+        progress = self.bytes_read / self.total_bytes if self.total_bytes else 1.0
+        end = self.finished_at or time.time()
+        return {
+            "id": self.id,
+            "filename": self.filename,
+            "status": self.status,
+            "message": self.message,
+            "progress": round(min(progress, 1.0) if not self.finished else 1.0, 4),
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "error_count": self.error_count,
+            "errors": [{"line": line, "error": error} for line, error in self.errors],
+            "errors_truncated": self.error_count > len(self.errors),
+            "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else 0.0,
+        }
+
+
+class _CountingReader:
+    """Binary file wrapper that counts bytes consumed, for progress."""
+
+    def __init__(self, raw: IO[bytes], job: ImportJob):
+        self.raw = raw
+        self.job = job
+
+    def __iter__(self):
+        for line in self.raw:
+            self.job.bytes_read += len(line)
+            yield line
+
+
+class BulkImporter:
+    """
+    Run inventory imports on a small background worker pool.
+
+    Uploads are spooled to a temporary file first, because the request's
+    file handle is closed as soon as the response is sent. Job progress
+    lives in ``import_jobs``: the status poll may reach a different
+    worker process than the one running the import.
+
+    Args:
+        engine (Engine): Database engine.
+        batch_size (int): Rows per ``executemany`` batch and transaction.
+        workers (int): Concurrent import jobs.
+    """
+
+    def __init__(self, engine, batch_size: int, workers: int):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.workers = workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, seller_id: int, upload: FileStorage) -> ImportJob:
+        """
+        Queue an uploaded file for import.
+
+        Args:
+            seller_id (int): Owner of the imported items.
+            upload (FileStorage): Uploaded ``.csv``, ``.jsonl`` or ``.ndjson`` file.
+
+        Returns:
+            ImportJob: The queued job.
+
+        Raises:
+            ValueError: If no file was sent or its type is unsupported.
+        """
+        if upload is None or not upload.filename:
+            raise ValueError("Please choose a file to import")
+        file_format = detect_format(upload.filename)
+        if file_format is None:
+            raise ValueError("Only .csv, .jsonl and .ndjson files can be imported")
+
+        handle, path = tempfile.mkstemp(prefix="import-", suffix=f".{file_format}")
+        with os.fdopen(handle, "wb") as spool:
+            shutil.copyfileobj(upload.stream, spool, COPY_CHUNK_SIZE)
+
+        job = ImportJob(
+            id=uuid.uuid4().hex,
+            seller_id=seller_id,
+            filename=os.path.basename(upload.filename),
+            file_format=file_format,
+            total_bytes=os.path.getsize(path),
+        )
+        with self.engine.begin() as connection:
+            connection.execute(insert(_jobs).values(
+                id=job.id, seller_id=seller_id, filename=job.filename, file_format=file_format,
+                total_bytes=job.total_bytes, **job.progress_values(),
+            ))
+            self._prune(connection)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="bulk-import")
+        self._executor.submit(self._run, job, path)
+        logger.info(f"Queued import {job.id} of {job.filename} for seller {seller_id}")
+        return job
+
+    def get(self, job_id: str, seller_id: int) -> ImportJob | None:
+        """Return a seller's job, or None if it is unknown or not theirs."""
+        with self.engine.connect() as connection:
+            row = connection.execute(
+                select(_jobs).where(_jobs.c.id == job_id, _jobs.c.seller_id == seller_id)
+            ).one_or_none()
+        return ImportJob.from_row(row) if row is not None else None
+
+    @staticmethod
+    def _prune(connection) -> None:
+        keep = (
+            select(_jobs.c.id).where(_jobs.c.finished_at.is_not(None))
+            .order_by(_jobs.c.finished_at.desc()).limit(MAX_FINISHED_JOBS)
+        )
+        connection.execute(delete(_jobs).where(_jobs.c.finished_at.is_not(None), _jobs.c.id.not_in(keep)))
+
+    @staticmethod
+    def _save(connection, job: ImportJob) -> None:
+        connection.execute(update(_jobs).where(_jobs.c.id == job.id).values(**job.progress_values()))
+
+    def _save_progress(self, job: ImportJob) -> None:
+        with self.engine.begin() as connection:
+            self._save(connection, job)
+
+    def _run(self, job: ImportJob, path: str) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        try:
+            self._save_progress(job)
+            with open(path, "rb") as raw:
+                self._import(job, PARSERS[job.file_format](_CountingReader(raw, job)))
+            job.status = "done"
+            job.message = f"Imported {job.inserted} items, {job.error_count} rows rejected"
+        except Exception as e:
+            logger.exception(f"Import {job.id} failed")
+            job.status = "failed"
+            job.message = f"Import stopped after {job.inserted} items: {e}"
+        finally:
+            job.finished_at = time.time()
+            os.remove(path)
+            try:
+                self._save_progress(job)
+            except Exception:
+                logger.exception(f"Failed to record the outcome of import {job.id}")
+            if job.inserted:
+                catalog_cache.invalidate()
+            logger.info(f"Import {job.id} {job.status}: {job.inserted} inserted, {job.error_count} errors")
+
+    def _import(self, job: ImportJob, rows: Iterator[tuple[int, object]]) -> None:
+        batch = []
+        last_saved = time.monotonic()
+        for line_number, row in rows:
+            job.processed += 1
+            if time.monotonic() - last_saved >= PROGRESS_INTERVAL:
+                self._save_progress(job)
+                last_saved = time.monotonic()
+            if isinstance(row, Exception):
+                job.add_error(line_number, str(row))
+                continue
+            try:
+                fields = validate_inventory(
+                    row.get("name"), row.get("description"), row.get("price"), row.get("quantity")
+                )
+            except ValueError as e:
+                job.add_error(line_number, str(e))
+                continue
+
+            now = get_utc_now()
+            batch.append({
+                **fields,
+                "seller_id": job.seller_id,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            })
+            if len(batch) >= self.batch_size:
+                self._insert(job, batch)
+                last_saved = time.monotonic()
+                batch = []
+
+        if batch:
+            self._insert(job, batch)
+
+    def _insert(self, job: ImportJob, batch: list[dict]) -> None:
+        # The rows and the progress that counts them commit together
+        job.inserted += len(batch)
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(insert(Inventory.__table__), batch)
+                self._save(connection, job)
+        except Exception:
+            job.inserted -= len(batch)
+            raise
+
+
+bulk_importer = BulkImporter(engine, Config.IMPORT_BATCH_SIZE, Config.IMPORT_WORKERS)
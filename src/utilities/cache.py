@@ -0,0 +1,223 @@
+"""
+In-process caching utilities.
+
+This module provides:
+- A pluggable CacheBackend interface
+- A bounded, thread-safe LRU backend with per-entry TTL
+- A namespaced read-through cache with hit/miss counters and
+  generation-based invalidation, optionally shared with other worker
+  processes through the invalidation bus
+
+Usage:
+    from src.utilities.cache import catalog_cache
+    page = catalog_cache.get_or_load(("index", 1), load_page)
+    catalog_cache.invalidate()
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from src.utilities.config import Config
+from src.utilities.helper import get_utc_now
+from src.utilities.invalidation import InvalidationBus, invalidation_bus
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+MISSING = object()
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached values."""
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or ``MISSING`` if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value under ``key``."""
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+
+
+class LRUCache(CacheBackend):
+    """
+    Bounded least-recently-used cache with a time-to-live per entry.
+
+    Args:
+        maxsize (int): Maximum number of entries kept.
+        ttl (float): Seconds an entry stays valid; 0 disables expiry.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key, MISSING)
+            if entry is MISSING:
+                return MISSING
+
+            expires_at, value = entry
+            if expires_at and expires_at < time.monotonic():
+                del self._data[key]
+                return MISSING
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl if self.ttl else 0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ReadThroughCache:
+    """
+    Namespaced read-through cache with hit/miss counters.
+
+    Keys are prefixed with a generation number, so :meth:`invalidate`
+    is O(1): stale entries simply stop being addressed and age out
+    of the backend. ``changed_at`` records when this process last saw
+    the data change, for HTTP ``Last-Modified`` headers. With a ``bus``, an invalidation is also published to
+    every other worker process, and theirs are applied here.
+
+    Args:
+        name (str): Namespace used in keys, logs and as the bus channel.
+        backend (CacheBackend): Storage backend.
+        bus (Optional[InvalidationBus]): Cross-process invalidation bus.
+    """
+
+    def __init__(self, name: str, backend: CacheBackend, bus: InvalidationBus | None = None):
+        self.name = name
+        self.backend = backend
+        self.bus = bus
+        self._lock = threading.Lock()
+        self._generation = 0
+        # Nothing is known about changes before this process started
+        self.changed_at = get_utc_now()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.remote_invalidations = 0
+        if bus is not None:
+            bus.subscribe(name, self._invalidate_remote)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for ``key``, calling ``loader`` on a miss.
+
+        Args:
+            key (Hashable): Cache key, e.g. ``("index", page, cursor)``.
+            loader (Callable): Zero-argument function producing the value.
+
+        Returns:
+            Any: Cached or freshly loaded value.
+        """
+        generation = self._generation
+        full_key = (self.name, generation, key)
+        value = self.backend.get(full_key)
+        if value is not MISSING:
+            with self._lock:
+                self.hits += 1
+            return value
+
+        with self._lock:
+            self.misses += 1
+
+        value = loader()
+        # Do not store a value loaded across an invalidation
+        if generation == self._generation:
+            self.backend.set(full_key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry in this namespace, in this and every other worker."""
+        with self._lock:
+            self._generation += 1
+            self.changed_at = get_utc_now()
+            self.invalidations += 1
+        logger.debug(f"Cache {self.name} invalidated (generation {self._generation})")
+        if self.bus is not None:
+            self.bus.publish(self.name)
+
+    def _invalidate_remote(self) -> None:
+        # Another worker changed the data; drop our copy without publishing again
+        with self._lock:
+            self._generation += 1
+            self.changed_at = get_utc_now()
+            self.remote_invalidations += 1
+
+    def stats(self) -> dict:
+        """
+        Report hit/miss counters for this namespace.
+
+        Returns:
+            dict: Counters plus hit ratio and backend size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "remote_invalidations": self.remote_invalidations,
+                "generation": self._generation,
+                "entries": len(self.backend),
+            }
+
+
+catalog_cache = ReadThroughCache(
+    "catalog",
+    LRUCache(maxsize=Config.CATALOG_CACHE_SIZE, ttl=Config.CATALOG_CACHE_TTL),
+    bus=invalidation_bus,
+)
+
+# Role and active flag per user, checked on every authenticated request
+user_cache = ReadThroughCache(
+    "users",
+    LRUCache(maxsize=Config.USER_CACHE_SIZE, ttl=Config.USER_CACHE_TTL),
+    bus=invalidation_bus,
+)
+
+
+def get_cache_metrics() -> dict:
+    """
+    Report counters for every application cache.
+
+    Returns:
+        dict: Stats keyed by cache name.
+    """
+    return {cache.name: cache.stats() for cache in (catalog_cache, user_cache)}
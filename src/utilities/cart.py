@@ -0,0 +1,301 @@
+"""
+Server-side shopping cart store.
+
+This module provides:
+- An in-memory cart per user, answered without touching the database
+- Write-behind persistence: changed carts are batch-flushed to the
+  ``cart_items`` table by a background thread
+- Cart views priced with a single query for all lines
+
+Usage:
+    from src.utilities.cart import cart_store
+    cart_store.add(user_id, item_id, 2)
+    lines, total = cart_store.view(db_session, user_id)
+"""
+import atexit
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, delete, select
+
+from src.models.cart import CartItem
+from src.models.inventory import Inventory
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.helper import get_utc_now
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAX_LINE_QUANTITY = 99
+
+
+class CartLine(NamedTuple):
+    """One priced cart line, ready for the template."""
+
+    inventory_id: int
+    name: str
+    image: str | None
+    price: float
+    quantity: int
+    available: int
+    subtotal: float
+
+
+class CartStore:
+    """
+    Write-behind cache of carts keyed by user id.
+
+    Reads and writes only touch memory; dirty carts are persisted in
+    one transaction per flush. Clean carts beyond ``max_carts`` are
+    evicted least-recently-used first and reloaded on demand.
+
+    Args:
+        engine (Engine): Database engine.
+        max_carts (int): Clean carts kept in memory.
+        flush_interval (float): Seconds between background flushes.
+    """
+
+    def __init__(self, engine, max_carts: int, flush_interval: float):
+        self.engine = engine
+        self.max_carts = max_carts
+        self.flush_interval = flush_interval
+        self._carts: OrderedDict[int, dict[int, int]] = OrderedDict()
+        self._dirty = set()
+        # Carts in the snapshot being committed: the database is still older
+        self._flushing = set()
+        self._lock = threading.RLock()
+        # Held from snapshot to commit, so flushes reach the database in order
+        self._flush_lock = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.write_through = False
+        self.flushes = 0
+        self.flushed_carts = 0
+
+    def _load(self, user_id: int) -> dict[int, int]:
+        cart = self._carts.get(user_id)
+        # A dirty or flushing cart is newer than the database, even in write-through mode
+        if cart is not None and (not self.write_through or user_id in self._dirty or user_id in self._flushing):
+            self._carts.move_to_end(user_id)
+            return cart
+
+        with Session(self.engine) as db_session:
+            rows = db_session.exec(
+                select(CartItem.inventory_id, CartItem.quantity).where(CartItem.user_id == user_id)
+            ).all()
+        cart = {inventory_id: quantity for inventory_id, quantity in rows}
+        self._carts[user_id] = cart
+        self._evict()
+        return cart
+
+    def _evict(self) -> None:
+        overflow = len(self._carts) - self.max_carts
+        if overflow <= 0:
+            return
+        for user_id in list(self._carts):
+            if overflow <= 0:
+                break
+            if user_id not in self._dirty and user_id not in self._flushing:
+                del self._carts[user_id]
+                overflow -= 1
+
+    def items(self, user_id: int) -> dict[int, int]:
+        """
+        Return a copy of a user's cart as ``{inventory_id: quantity}``.
+
+        Args:
+            user_id (int): Cart owner.
+
+        Returns:
+            Dict[int, int]: Quantities by inventory id.
+        """
+        with self._lock:
+            return dict(self._load(user_id))
+
+    def count(self, user_id: int) -> int:
+        """Total number of units in a user's cart."""
+        with self._lock:
+            return sum(self._load(user_id).values())
+
+    def set_quantity(self, user_id: int, inventory_id: int, quantity: int) -> int:
+        """
+        Set a line's quantity; zero or less removes the line.
+
+        Args:
+            user_id (int): Cart owner.
+            inventory_id (int): Inventory item.
+            quantity (int): New quantity, capped at ``MAX_LINE_QUANTITY``.
+
+        Returns:
+            int: The quantity stored.
+        """
+        with self._lock:
+            quantity = self._store(user_id, inventory_id, quantity)
+        self._written()
+        return quantity
+
+    def add(self, user_id: int, inventory_id: int, quantity: int = 1) -> int:
+        """Increase a line's quantity, creating it if needed."""
+        with self._lock:
+            current = self._load(user_id).get(inventory_id, 0)
+            quantity = self._store(user_id, inventory_id, current + quantity)
+        self._written()
+        return quantity
+
+    def _store(self, user_id: int, inventory_id: int, quantity: int) -> int:
+        # Caller holds self._lock; flushing happens after it is released
+        quantity = min(quantity, MAX_LINE_QUANTITY)
+        cart = self._load(user_id)
+        if quantity <= 0:
+            cart.pop(inventory_id, None)
+            quantity = 0
+        else:
+            cart[inventory_id] = quantity
+        self._dirty.add(user_id)
+        return quantity
+
+    def remove(self, user_id: int, inventory_id: int) -> None:
+        """Remove a line from the cart."""
+        self.set_quantity(user_id, inventory_id, 0)
+
+    def clear(self, user_id: int) -> None:
+        """Empty a user's cart."""
+        with self._lock:
+            self._carts[user_id] = {}
+            self._dirty.add(user_id)
+        self._written()
+
+    def view(self, db_session: Session, user_id: int) -> tuple[list[CartLine], float]:
+        """
+        Price a cart with one query for all of its lines.
+
+        Lines whose item was deactivated are dropped from the view.
+
+        Args:
+            db_session (Session): Open database session.
+            user_id (int): Cart owner.
+
+        Returns:
+            Tuple[List[CartLine], float]: Priced lines and the cart total.
+        """
+        cart = self.items(user_id)
+        if not cart:
+            return [], 0.0
+
+        rows = db_session.exec(
+            select(Inventory.id, Inventory.name, Inventory.image, Inventory.price, Inventory.quantity)
+            .where(Inventory.id.in_(cart.keys()), Inventory.is_active == True)
+            .order_by(Inventory.name)
+        ).all()
+
+        lines = [
+            CartLine(
+                inventory_id=row.id,
+                name=row.name,
+                image=row.image,
+                price=row.price,
+                quantity=cart[row.id],
+                available=row.quantity,
+                subtotal=round(row.price * cart[row.id], 2),
+            )
+            for row in rows
+        ]
+        return lines, round(sum(line.subtotal for line in lines), 2)
+
+    def flush(self) -> int:
+        """
+        Persist every dirty cart in a single transaction.
+
+        Concurrent calls (request threads in write-through mode, the
+        background flusher) run one at a time, so an older snapshot can
+        never be committed after a newer one.
+
+        Returns:
+            int: Number of carts written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    return 0
+                snapshot = {user_id: dict(self._carts.get(user_id, {})) for user_id in self._dirty}
+                self._flushing = set(snapshot)
+                self._dirty.clear()
+
+            now = get_utc_now()
+            try:
+                with Session(self.engine) as db_session:
+                    db_session.exec(delete(CartItem).where(CartItem.user_id.in_(snapshot.keys())))
+                    rows = [
+                        {"user_id": user_id, "inventory_id": inventory_id, "quantity": quantity,
+                         "created_at": now, "updated_at": now}
+                        for user_id, cart in snapshot.items()
+                        for inventory_id, quantity in cart.items()
+                    ]
+                    if rows:
+                        db_session.exec(insert(CartItem), params=rows)
+                    db_session.commit()
+
+            except Exception:
+                # Put the carts back so the next flush retries them
+                with self._lock:
+                    self._dirty.update(snapshot.keys())
+                raise
+
+            finally:
+                with self._lock:
+                    self._flushing = set()
+
+        with self._lock:
+            self.flushes += 1
+            self.flushed_carts += len(snapshot)
+        logger.debug(f"Flushed {len(snapshot)} carts")
+        return len(snapshot)
+
+    def _written(self) -> None:
+        if self.write_through:
+            self.flush()
+        else:
+            self.start()
+
+    def use_write_through(self) -> None:
+        """
+        Persist every change at once and re-read carts on each access.
+
+        Needed when several worker processes serve requests, since another
+        worker may have changed a cart this process holds in memory.
+        """
+        self.flush()
+        self.write_through = True
+
+    def start(self) -> None:
+        """Start the background flusher and flush once more at exit."""
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run, name="cart-flusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Cart flush failed")
+
+    def stats(self) -> dict:
+        """Report cache size and flush counters."""
+        with self._lock:
+            return {
+                "write_through": self.write_through,
+                "carts_in_memory": len(self._carts),
+                "dirty": len(self._dirty),
+                "flushes": self.flushes,
+                "flushed_carts": self.flushed_carts,
+            }
+
+
+cart_store = CartStore(engine, Config.CART_CACHE_SIZE, Config.CART_FLUSH_INTERVAL)
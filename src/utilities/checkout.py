@@ -0,0 +1,289 @@
+"""
+Checkout with atomic stock reservation.
+
+This module provides:
+- Stock reservation with single-statement conditional decrements
+  (``UPDATE ... SET quantity = quantity - ? WHERE quantity >= ?``), so
+  concurrent checkouts of the same item can never oversell
+- Multi-line orders reserved in one transaction: either every line is
+  reserved or none is
+- Reservations that expire unless paid, with a background sweeper that
+  returns their stock
+- Catalog invalidation only when a line sells out or comes back in
+  stock; other quantity changes reach cached pages when they expire
+
+Usage:
+    from src.utilities.checkout import checkout
+    order = checkout.reserve(user_id, {item_id: 2})
+    checkout.confirm(order.id, user_id)
+"""
+import threading
+from datetime import timedelta
+
+from sqlalchemy import bindparam, func, update
+from sqlmodel import Session, select
+
+from src.models.inventory import Inventory
+from src.models.order import Order, OrderLine, OrderStatus
+from src.utilities.cache import catalog_cache
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.helper import get_utc_now
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+_stock = Inventory.__table__
+
+# One executemany statement decrements every line; a line whose stock is
+# short matches no row, so the summed rowcount exposes the failure.
+_reserve_stmt = (
+    update(_stock)
+    .where(
+        _stock.c.id == bindparam("item_id"),
+        _stock.c.quantity >= bindparam("amount"),
+        _stock.c.is_active == True,
+    )
+    .values(quantity=_stock.c.quantity - bindparam("amount"), updated_at=bindparam("now"))
+)
+
+_restore_stmt = (
+    update(_stock)
+    .where(_stock.c.id == bindparam("item_id"))
+    .values(quantity=_stock.c.quantity + bindparam("amount"), updated_at=bindparam("now"))
+)
+
+
+class OutOfStockError(Exception):
+    """Raised when a checkout asks for more units than are available."""
+
+    def __init__(self, names: list[str]):
+        self.names = names
+        super().__init__(f"Not enough stock for: {', '.join(names)}")
+
+
+class Checkout:
+    """
+    Reserve, confirm and release orders against inventory stock.
+
+    Args:
+        engine (Engine): Database engine.
+        reservation_ttl (float): Seconds an unpaid reservation holds stock.
+    """
+
+    def __init__(self, engine, reservation_ttl: float):
+        self.engine = engine
+        self.reservation_ttl = reservation_ttl
+        self._lock = threading.Lock()
+        self._sweeper: threading.Thread | None = None
+        self._sweeper_stop = threading.Event()
+        self.counters = {"reserved": 0, "out_of_stock": 0, "paid": 0, "cancelled": 0, "expired": 0}
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def reserve(self, user_id: int, cart: dict[int, int]) -> Order:
+        """
+        Reserve stock for every line of a cart and create the order.
+
+        Args:
+            user_id (int): Buyer.
+            cart (Dict[int, int]): Quantities by inventory id.
+
+        Returns:
+            Order: The reserved order, detached from its session.
+
+        Raises:
+            ValueError: If the cart is empty.
+            OutOfStockError: If any line cannot be fully reserved; no
+                stock is taken in that case.
+        """
+        lines = sorted((item_id, quantity) for item_id, quantity in cart.items() if quantity > 0)
+        if not lines:
+            raise ValueError("Cart is empty")
+
+        now = get_utc_now()
+        with Session(self.engine) as db_session:
+            # The write comes first so the transaction takes SQLite's write
+            # lock up front and waits on busy_timeout instead of failing.
+            result = db_session.connection().execute(
+                _reserve_stmt,
+                [{"item_id": item_id, "amount": quantity, "now": now} for item_id, quantity in lines],
+            )
+            if result.rowcount != len(lines):
+                db_session.rollback()
+                self._count("out_of_stock")
+                raise OutOfStockError(self._short_lines(db_session, dict(lines)))
+            sold_out = self._sold_out(db_session, [item_id for item_id, _ in lines])
+
+            items = {
+                row.id: row for row in db_session.exec(
+                    select(Inventory.id, Inventory.name, Inventory.price)
+                    .where(Inventory.id.in_([item_id for item_id, _ in lines]))
+                ).all()
+            }
+            order = Order(
+                user_id=user_id,
+                total=round(sum(items[item_id].price * quantity for item_id, quantity in lines), 2),
+                expires_at=now + timedelta(seconds=self.reservation_ttl),
+            )
+            db_session.add(order)
+            db_session.flush()
+            db_session.add_all(
+                OrderLine(
+                    order_id=order.id,
+                    inventory_id=item_id,
+                    name=items[item_id].name,
+                    quantity=quantity,
+                    unit_price=items[item_id].price,
+                )
+                for item_id, quantity in lines
+            )
+            db_session.commit()
+            db_session.refresh(order)
+
+        if sold_out:
+            catalog_cache.invalidate()
+        self._count("reserved")
+        logger.info(f"Order {order.id} reserved {len(lines)} lines for user {user_id}")
+        return order
+
+    @staticmethod
+    def _sold_out(db_session: Session, item_ids: list[int]) -> list[int]:
+        # Read inside the write transaction, so no other checkout can move
+        # these rows across zero in between
+        return db_session.exec(
+            select(Inventory.id).where(Inventory.id.in_(item_ids), Inventory.quantity == 0)
+        ).all()
+
+    @staticmethod
+    def _short_lines(db_session: Session, wanted: dict[int, int]) -> list[str]:
+        rows = db_session.exec(
+            select(Inventory.id, Inventory.name, Inventory.quantity, Inventory.is_active)
+            .where(Inventory.id.in_(wanted.keys()))
+        ).all()
+        found = {row.id: row for row in rows}
+        return [
+            found[item_id].name if item_id in found else f"item #{item_id}"
+            for item_id, quantity in wanted.items()
+            if item_id not in found or not found[item_id].is_active or found[item_id].quantity < quantity
+        ]
+
+    def confirm(self, order_id: int, user_id: int) -> bool:
+        """
+        Mark a reservation as paid if it has not expired.
+
+        Args:
+            order_id (int): Order to confirm.
+            user_id (int): Owner of the order.
+
+        Returns:
+            bool: True if the order moved to ``paid``.
+        """
+        now = get_utc_now()
+        with Session(self.engine) as db_session:
+            result = db_session.exec(
+                update(Order)
+                .where(
+                    Order.id == order_id,
+                    Order.user_id == user_id,
+                    Order.status == OrderStatus.RESERVED,
+                    Order.expires_at > now,
+                )
+                .values(status=OrderStatus.PAID, updated_at=now)
+            )
+            db_session.commit()
+
+        if result.rowcount:
+            self._count("paid")
+            logger.info(f"Order {order_id} paid by user {user_id}")
+        return bool(result.rowcount)
+
+    def _release(self, status: OrderStatus, *conditions) -> int:
+        now = get_utc_now()
+        with Session(self.engine) as db_session:
+            # Claiming the orders and returning their stock share one
+            # transaction, so an order is never released twice.
+            order_ids = db_session.exec(
+                update(Order)
+                .where(Order.status == OrderStatus.RESERVED, *conditions)
+                .values(status=status, updated_at=now)
+                .returning(Order.id)
+            ).scalars().all()
+            if not order_ids:
+                db_session.rollback()
+                return 0
+
+            amounts = db_session.exec(
+                select(OrderLine.inventory_id, func.sum(OrderLine.quantity))
+                .where(OrderLine.order_id.in_(order_ids))
+                .group_by(OrderLine.inventory_id)
+            ).all()
+            restocked = self._sold_out(db_session, [item_id for item_id, _ in amounts])
+            db_session.connection().execute(
+                _restore_stmt,
+                [{"item_id": item_id, "amount": amount, "now": now} for item_id, amount in amounts],
+            )
+            db_session.commit()
+
+        if restocked:
+            catalog_cache.invalidate()
+        self._count(status.value, len(order_ids))
+        return len(order_ids)
+
+    def cancel(self, order_id: int, user_id: int) -> bool:
+        """
+        Cancel an unpaid reservation and return its stock.
+
+        Args:
+            order_id (int): Order to cancel.
+            user_id (int): Owner of the order.
+
+        Returns:
+            bool: True if the order was cancelled.
+        """
+        released = self._release(OrderStatus.CANCELLED, Order.id == order_id, Order.user_id == user_id)
+        if released:
+            logger.info(f"Order {order_id} cancelled by user {user_id}")
+        return bool(released)
+
+    def release_expired(self) -> int:
+        """
+        Expire every reservation past its deadline and return its stock.
+
+        Returns:
+            int: Number of orders expired.
+        """
+        released = self._release(OrderStatus.EXPIRED, Order.expires_at <= get_utc_now())
+        if released:
+            logger.info(f"Reservation sweeper expired {released} orders")
+        return released
+
+    def start_sweeper(self, interval: float) -> None:
+        """
+        Run :meth:`release_expired` every ``interval`` seconds on a daemon thread.
+
+        Args:
+            interval (float): Seconds between sweeps.
+        """
+        if self._sweeper is not None:
+            return
+
+        def run():
+            while not self._sweeper_stop.wait(interval):
+                try:
+                    self.release_expired()
+                except Exception:
+                    logger.exception("Reservation sweep failed")
+
+        self._sweeper = threading.Thread(target=run, name="reservation-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stats(self) -> dict:
+        """Report checkout outcome counters."""
+        with self._lock:
+            return dict(self.counters)
+
+
+checkout = Checkout(engine, Config.RESERVATION_TTL)
@@ -11,16 +11,81 @@ class Config:
     PORT: int = int(os.environ["PORT"])
     DEBUG: bool = os.environ["DEBUG"].lower() == "true"
     SECRET_KEY: str = os.environ["SECRET_KEY"]
+    SERVER: str = os.environ["SERVER"].lower()
+    WORKERS: int = int(os.environ["WORKERS"])
+    THREADS: int = int(os.environ["THREADS"])
 
     # Logging
     LOG_DIR: str = os.environ["LOG_DIR"]
     LOG_FILE: str = os.environ["LOG_FILE"]
     MAX_BYTES: int = int(os.environ["MAX_BYTES"])
     BACKUP_COUNT: int = int(os.environ["BACKUP_COUNT"])
+    LOG_FORMAT: str = os.environ["LOG_FORMAT"].lower()
+    LOG_QUEUE_SIZE: int = int(os.environ["LOG_QUEUE_SIZE"])
+    LOG_SAMPLE_RATE: float = float(os.environ["LOG_SAMPLE_RATE"])
+
+    # Profiling
+    PROFILER_ENABLED: bool = os.environ["PROFILER_ENABLED"].lower() == "true"
+    PROFILER_THRESHOLD_MS: float = float(os.environ["PROFILER_THRESHOLD_MS"])
+    PROFILER_INTERVAL_MS: float = float(os.environ["PROFILER_INTERVAL_MS"])
+    PROFILE_DIR: str = os.environ["PROFILE_DIR"]
+    QUERY_GUARD: str = os.environ["QUERY_GUARD"].lower()
+    QUERY_GUARD_MAX_QUERIES: int = int(os.environ["QUERY_GUARD_MAX_QUERIES"])
+    QUERY_GUARD_MAX_LAZY_LOADS: int = int(os.environ["QUERY_GUARD_MAX_LAZY_LOADS"])
 
     # Database
     DATABASE_DIR: str = os.environ["DATABASE_DIR"]
     DATABASE_NAME: str = os.environ["DATABASE_NAME"]
+    DATABASE_JOURNAL_MODE: str = os.environ["DATABASE_JOURNAL_MODE"]
+    DATABASE_SYNCHRONOUS: str = os.environ["DATABASE_SYNCHRONOUS"]
+    DATABASE_BUSY_TIMEOUT: int = int(os.environ["DATABASE_BUSY_TIMEOUT"])
+    DATABASE_CACHE_SIZE: int = int(os.environ["DATABASE_CACHE_SIZE"])
+    DATABASE_MMAP_SIZE: int = int(os.environ["DATABASE_MMAP_SIZE"])
+    DATABASE_POOL_SIZE: int = int(os.environ["DATABASE_POOL_SIZE"])
+    DATABASE_MAX_OVERFLOW: int = int(os.environ["DATABASE_MAX_OVERFLOW"])
+    DATABASE_POOL_TIMEOUT: int = int(os.environ["DATABASE_POOL_TIMEOUT"])
+    ANALYTICS_RECONCILE_INTERVAL: float = float(os.environ["ANALYTICS_RECONCILE_INTERVAL"])
+    MIGRATION_BATCH_SIZE: int = int(os.environ["MIGRATION_BATCH_SIZE"])
+    MIGRATION_BATCH_PAUSE: float = float(os.environ["MIGRATION_BATCH_PAUSE"])
+
+    # Uploads
+    UPLOAD_DIR: str = os.environ["UPLOAD_DIR"]
+    IMAGE_WORKERS: int = int(os.environ["IMAGE_WORKERS"])
+    STORAGE_BACKEND: str = os.environ["STORAGE_BACKEND"].lower()
+    STORAGE_GC_INTERVAL: float = float(os.environ["STORAGE_GC_INTERVAL"])
+    STORAGE_GC_GRACE: float = float(os.environ["STORAGE_GC_GRACE"])
+    S3_BUCKET: str = os.environ["S3_BUCKET"]
+    S3_ENDPOINT_URL: str = os.environ["S3_ENDPOINT_URL"]
+    S3_PUBLIC_URL: str = os.environ["S3_PUBLIC_URL"]
+    IMPORT_BATCH_SIZE: int = int(os.environ["IMPORT_BATCH_SIZE"])
+    IMPORT_WORKERS: int = int(os.environ["IMPORT_WORKERS"])
+    EXPORT_BATCH_SIZE: int = int(os.environ["EXPORT_BATCH_SIZE"])
+
+    # Caching
+    CATALOG_CACHE_SIZE: int = int(os.environ["CATALOG_CACHE_SIZE"])
+    CATALOG_CACHE_TTL: float = float(os.environ["CATALOG_CACHE_TTL"])
+    CART_CACHE_SIZE: int = int(os.environ["CART_CACHE_SIZE"])
+    CART_FLUSH_INTERVAL: float = float(os.environ["CART_FLUSH_INTERVAL"])
+    USER_CACHE_SIZE: int = int(os.environ["USER_CACHE_SIZE"])
+    USER_CACHE_TTL: float = float(os.environ["USER_CACHE_TTL"])
+    INVALIDATION_POLL_INTERVAL: float = float(os.environ["INVALIDATION_POLL_INTERVAL"])
+
+    # Checkout
+    RESERVATION_TTL: float = float(os.environ["RESERVATION_TTL"])
+    RESERVATION_SWEEP_INTERVAL: float = float(os.environ["RESERVATION_SWEEP_INTERVAL"])
 
     # Security
     SALT_LENGTH: int = int(os.environ["SALT_LENGTH"])
+    HASH_WORKERS: int = int(os.environ["HASH_WORKERS"])
+    HASH_MAX_PENDING: int = int(os.environ["HASH_MAX_PENDING"])
+    HASH_QUEUE_TIMEOUT: float = float(os.environ["HASH_QUEUE_TIMEOUT"])
+    SESSION_BACKEND: str = os.environ["SESSION_BACKEND"].lower()
+    SESSION_REDIS_URL: str = os.environ["SESSION_REDIS_URL"]
+    SESSION_LIFETIME: int = int(os.environ["SESSION_LIFETIME"])
+    RATE_LIMIT_BACKEND: str = os.environ["RATE_LIMIT_BACKEND"].lower()
+    RATE_LIMIT_MAX_KEYS: int = int(os.environ["RATE_LIMIT_MAX_KEYS"])
+    RATE_LIMIT_EVICT_INTERVAL: float = float(os.environ["RATE_LIMIT_EVICT_INTERVAL"])
+    LOGIN_IP_BURST: int = int(os.environ["LOGIN_IP_BURST"])
+    LOGIN_IP_REFILL: float = float(os.environ["LOGIN_IP_REFILL"])
+    LOGIN_EMAIL_BURST: int = int(os.environ["LOGIN_EMAIL_BURST"])
+    LOGIN_EMAIL_REFILL: float = float(os.environ["LOGIN_EMAIL_REFILL"])
@@ -1,29 +1,159 @@
 import os
+import threading
+import time
+import zlib
 
+from sqlalchemy import event
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import CreateTable
 from sqlmodel import SQLModel
 from sqlmodel import Session
 from sqlmodel import create_engine
 from sqlmodel import select
 
+from src.models.user import User
 from src.models.user import UserRole
+from src.utilities.analytics import TRIGGERS
+from src.utilities.analytics import init_analytics
 from src.utilities.config import Config
 from src.utilities.logger import get_logger
+from src.utilities.migrations import REVISIONS
+from src.utilities.migrations import upgrade
+from src.utilities.search import SCHEMA as SEARCH_SCHEMA
+from src.utilities.search import init_search_index
 from src.utilities.security import hash_password
 
 logger = get_logger(__name__)
-os.makedirs(Config.DATABASE_DIR, exist_ok=True)
 database_path = f"{Config.DATABASE_DIR}/{Config.DATABASE_NAME}"
 database_url = f"sqlite:///{database_path}"
 
-engine = create_engine(database_url, echo=False)
 
+class PoolMetrics:
+    """Thread-safe counters for connection checkout wait time."""
 
-def init_table():
-    from src.models.user import User  # noqa
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
 
-    # SQLModel.metadata.drop_all(engine)
-    SQLModel.metadata.create_all(engine)
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.total_wait * 1000, 3),
+                "wait_avg_ms": round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record(time.perf_counter() - start)
+        return connection
+
+
+def _create_database_dir(dialect, conn_rec, cargs, cparams):
+    # On the first connection rather than at import; returning None lets
+    # the dialect connect as usual
+    os.makedirs(Config.DATABASE_DIR, exist_ok=True)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={Config.DATABASE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={Config.DATABASE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={Config.DATABASE_BUSY_TIMEOUT:d}")
+        cursor.execute(f"PRAGMA cache_size={Config.DATABASE_CACHE_SIZE:d}")
+        cursor.execute(f"PRAGMA mmap_size={Config.DATABASE_MMAP_SIZE:d}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+    finally:
+        cursor.close()
+
+
+engine = create_engine(
+    database_url,
+    echo=False,
+    poolclass=InstrumentedQueuePool,
+    pool_size=Config.DATABASE_POOL_SIZE,
+    max_overflow=Config.DATABASE_MAX_OVERFLOW,
+    pool_timeout=Config.DATABASE_POOL_TIMEOUT,
+    connect_args={
+        # Connections are checked out by whichever worker thread serves the request
+        "check_same_thread": False,
+        "timeout": Config.DATABASE_BUSY_TIMEOUT / 1000,
+    },
+)
+event.listen(engine, "do_connect", _create_database_dir)
+event.listen(engine, "connect", _set_sqlite_pragmas)
+# Worker processes forked by serve.py must open their own connections;
+# close=False leaves the parent's connections alone
+os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
+
+
+def get_pool_metrics() -> dict:
+    """
+    Report connection pool occupancy and checkout wait times.
 
+    Returns:
+        dict: Pool status plus checkout wait counters in milliseconds.
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        **pool_metrics.snapshot(),
+    }
+
+
+def schema_fingerprint() -> int:
+    """
+    Checksum of the schema this code expects.
+
+    Covers the table and index DDL, the migration revisions and the
+    search/analytics triggers, so any change to them changes the value.
+
+    Returns:
+        int: Positive 31-bit value for ``PRAGMA user_version``.
+    """
+    dialect = engine.dialect
+    parts = [revision.revision for revision in REVISIONS]
+    for table in SQLModel.metadata.sorted_tables:
+        parts.append(str(CreateTable(table).compile(dialect=dialect)))
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            parts.append(str(CreateIndex(index).compile(dialect=dialect)))
+    parts.extend(SEARCH_SCHEMA)
+    parts.extend(f"{name} {body}" for name, body in sorted(TRIGGERS.items()))
+    return zlib.crc32("\n".join(parts).encode("utf-8")) & 0x7FFFFFFF or 1
+
+
+def _create_admin() -> None:
     with Session(engine) as db_session:
         existing_user = db_session.exec(select(User).where(User.id == 1)).first()
         if existing_user:
@@ -43,3 +173,42 @@ def init_table():
         db_session.refresh(admin_user)
 
         logger.info("Admin created successfully")
+
+
+def init_table():
+    """
+    Create or upgrade the schema and seed the admin account.
+
+    Skipped entirely when ``PRAGMA user_version`` already holds the
+    current :func:`schema_fingerprint`, so restarts against an
+    up-to-date database do no schema work.
+    """
+    from src.models.analytics import CatalogStats  # noqa
+    from src.models.cart import CartItem  # noqa
+    from src.models.import_job import ImportProgress  # noqa
+    from src.models.invalidation import CacheVersion  # noqa
+    from src.models.inventory import Inventory  # noqa
+    from src.models.migration import SchemaRevision  # noqa
+    from src.models.order import Order  # noqa
+    from src.models.order import OrderLine  # noqa
+    from src.models.rate_limit import RateLimitBucket  # noqa
+    from src.models.session import StoredSession  # noqa
+    from src.models.storage import StoredFile  # noqa
+
+    fingerprint = schema_fingerprint()
+    with engine.connect() as connection:
+        if connection.exec_driver_sql("PRAGMA user_version").scalar() == fingerprint:
+            logger.info("Schema is up to date")
+            return
+
+    # SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    upgrade(engine)
+    with engine.begin() as connection:
+        init_search_index(connection)
+        init_analytics(connection)
+
+    _create_admin()
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {fingerprint:d}")
+    logger.info("Schema initialized")
@@ -0,0 +1,146 @@
+"""
+Streaming inventory export.
+
+This module provides:
+- CSV and JSON Lines (``.jsonl`` / ``.ndjson``) renderers that work on
+  row batches
+- A generator that reads rows from a server-side cursor with
+  ``yield_per``, so memory stays flat whatever the result size
+- A Flask response helper; nothing is buffered beyond one batch, and a
+  CSV header is sent before the query runs
+
+Usage:
+    from src.utilities.export import export_response
+    from src.utilities.export import export_statement
+    stmt = export_statement(Inventory.seller_id == seller_id, sort="price_asc")
+    return export_response(stmt, "csv", "inventory")
+"""
+import csv
+import io
+import json
+from collections.abc import Iterator
+from datetime import datetime
+
+from flask import Response
+from sqlalchemy import Select
+from sqlmodel import select
+
+from src.models.inventory import Inventory
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.logger import get_logger
+from src.utilities.pagination import get_sort_key
+
+logger = get_logger(__name__)
+
+MIMETYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/jsonl",
+    "ndjson": "application/x-ndjson",
+}
+
+# Column order of the export; the first four are what bulk import reads
+EXPORT_COLUMNS = (
+    Inventory.name,
+    Inventory.description,
+    Inventory.price,
+    Inventory.quantity,
+    Inventory.id,
+    Inventory.image,
+    Inventory.seller_id,
+    Inventory.is_active,
+    Inventory.created_at,
+    Inventory.updated_at,
+)
+FIELD_NAMES = tuple(column.key for column in EXPORT_COLUMNS)
+
+
+def _value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def stream_rows(stmt: Select, batch_size: int) -> Iterator[list]:
+    """
+    Execute ``stmt`` and yield its rows in batches of ``batch_size``.
+
+    The connection is held only while the generator is being consumed
+    and is returned to the pool when it finishes or is closed.
+    """
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(stmt)
+        yield from result.partitions()
+
+
+def render_csv(batches: Iterator[list]) -> Iterator[str]:
+    """Render row batches as CSV, one chunk per batch, header first."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain() -> str:
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(FIELD_NAMES)
+    yield drain()
+    for batch in batches:
+        writer.writerows([_value(value) for value in row] for row in batch)
+        yield drain()
+
+
+def render_jsonl(batches: Iterator[list]) -> Iterator[str]:
+    """Render row batches as JSON Lines, one chunk per batch."""
+    for batch in batches:
+        yield "".join(
+            json.dumps(dict(zip(FIELD_NAMES, map(_value, row))), ensure_ascii=False) + "\n"
+            for row in batch
+        )
+
+
+RENDERERS = {"csv": render_csv, "jsonl": render_jsonl, "ndjson": render_jsonl}
+
+
+def export_statement(*conditions, sort: str | None = None) -> Select:
+    """
+    Build the export query: a column projection with the dashboard's sort order.
+
+    Args:
+        *conditions: WHERE clauses, e.g. the seller and search filters.
+        sort (Optional[str]): A key of ``SORT_KEYS``.
+
+    Returns:
+        Select: The ordered statement.
+    """
+    sort_key = get_sort_key(sort)
+    column = sort_key.column.desc() if sort_key.descending else sort_key.column.asc()
+    tie_breaker = Inventory.id.desc() if sort_key.descending else Inventory.id.asc()
+    return select(*EXPORT_COLUMNS).where(*conditions).order_by(column, tie_breaker)
+
+
+def export_response(stmt: Select, file_format: str, filename: str) -> Response:
+    """
+    Stream ``stmt`` as a downloadable file.
+
+    Args:
+        stmt (Select): Statement selecting ``EXPORT_COLUMNS``.
+        file_format (str): ``csv``, ``jsonl`` or ``ndjson``.
+        filename (str): Download name without extension.
+
+    Returns:
+        Response: A streamed attachment response.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if file_format not in RENDERERS:
+        raise ValueError(f"Unsupported export format '{file_format}'")
+
+    body = RENDERERS[file_format](stream_rows(stmt, Config.EXPORT_BATCH_SIZE))
+    response = Response(body, mimetype=MIMETYPES[file_format])
+    response.headers["Content-Disposition"] = f'attachment; filename="{filename}.{file_format}"'
+    response.headers["Cache-Control"] = "no-store"
+    # Ask reverse proxies not to buffer the stream
+    response.headers["X-Accel-Buffering"] = "no"
+    logger.info(f"Streaming {file_format} export {filename}")
+    return response
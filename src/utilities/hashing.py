@@ -0,0 +1,142 @@
+"""
+Bounded bcrypt hashing service.
+
+This module provides:
+- A process pool that runs bcrypt off the request threads
+- A bounded number of in-flight jobs with fast rejection when saturated
+- Counters for submitted, rejected and in-flight hashing jobs
+
+Usage:
+    from src.utilities.hashing import hashing_service, bcrypt_hash
+    hashed = hashing_service.run(bcrypt_hash, b"secret", 12)
+"""
+import atexit
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import bcrypt
+
+from src.utilities.config import Config
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class HashingBusyError(RuntimeError):
+    """Raised when the hashing pool has no free slot within the wait timeout."""
+
+
+def bcrypt_hash(password: bytes, rounds: int) -> bytes:
+    """Hash ``password`` with a fresh salt; runs inside a pool worker."""
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def bcrypt_check(password: bytes, hashed_password: bytes) -> bool:
+    """Check ``password`` against a bcrypt hash; runs inside a pool worker."""
+    return bcrypt.checkpw(password, hashed_password)
+
+
+class HashingService:
+    """
+    Run CPU-bound password hashing on a dedicated process pool.
+
+    At most ``max_pending`` jobs may be queued or running at once.
+    Callers that cannot get a slot within ``queue_timeout`` seconds
+    get a :class:`HashingBusyError` instead of piling up behind the pool.
+
+    Args:
+        workers (int): Pool processes; 0 runs jobs inline on the caller.
+        max_pending (int): Maximum queued plus running jobs.
+        queue_timeout (float): Seconds to wait for a free slot.
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self.completed = 0
+        self.rejected = 0
+        self.in_flight = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                    logger.info(f"Hashing pool started with {self.workers} workers")
+        return self._executor
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run ``func(*args)`` on the pool and wait for its result.
+
+        Args:
+            func (Callable): Picklable module-level function.
+            *args (Any): Picklable arguments.
+
+        Returns:
+            Any: The function's return value.
+
+        Raises:
+            HashingBusyError: If no slot frees up within ``queue_timeout``.
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            logger.warning(f"Hashing pool saturated: {self.max_pending} jobs pending")
+            raise HashingBusyError("Password hashing is temporarily overloaded")
+
+        with self._lock:
+            self.in_flight += 1
+        try:
+            if self.workers <= 0:
+                return func(*args)
+            return self._get_executor().submit(func, *args).result()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def _forget_executor(self) -> None:
+        # A pool (and lock) inherited through fork() belongs to the parent process
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if they were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    def stats(self) -> dict:
+        """
+        Report pool configuration and job counters.
+
+        Returns:
+            dict: Worker count, limits and counters.
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+hashing_service = HashingService(
+    workers=Config.HASH_WORKERS,
+    max_pending=Config.HASH_MAX_PENDING,
+    queue_timeout=Config.HASH_QUEUE_TIMEOUT,
+)
+atexit.register(hashing_service.shutdown)
+os.register_at_fork(after_in_child=hashing_service._forget_executor)
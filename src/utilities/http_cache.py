@@ -0,0 +1,158 @@
+"""
+HTTP caching helpers.
+
+This module provides:
+- Strong ETags for catalog pages derived from row ids, ``updated_at``,
+  seller names and which resized variants of each row's image are ready
+- Last-Modified from the catalog's last change, which also moves when
+  rows are deleted or leave the page
+- Conditional GET handling that answers 304 before any template renders
+- Long-lived, immutable Cache-Control for content-hashed static uploads
+
+Usage:
+    from src.utilities.http_cache import conditional_render
+    return conditional_render(items, lambda: render_template(...))
+"""
+import hashlib
+import re
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from flask import Response, make_response, request, session
+
+from src.utilities.cache import catalog_cache
+from src.utilities.helper import get_utc_now
+from src.utilities.images import image_pipeline
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+# "<sha256>.<ext>" uploads and "<upload>.<digest16>.<width>w.<ext>" variants
+_HASHED_ASSET = re.compile(r"(^|/)([0-9a-f]{64}\.[a-z0-9]+|[^/]+\.[0-9a-f]{16}\.\d+w\.[a-z]+)$")
+
+
+def catalog_etag(items: Iterable[Any], *parts: Any) -> str:
+    """
+    Build a strong ETag for a list of rows plus request-specific parts.
+
+    The rendered ``srcset`` changes when an image's variants finish
+    generating, without any change to the row, so each row's variant
+    state is part of the tag.
+
+    Args:
+        items (Iterable[Any]): Rows with ``id``, ``updated_at`` and optionally ``image``
+            and ``seller_name``.
+        *parts (Any): Anything else the rendered page depends on.
+
+    Returns:
+        str: Hex digest usable as an ETag value.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\0")
+    for item in items:
+        variants = image_pipeline.variant_tag(getattr(item, "image", None))
+        seller = getattr(item, "seller_name", "")
+        digest.update(f"{item.id}:{item.updated_at.isoformat()}:{variants}:{seller}\0".encode())
+    return digest.hexdigest()
+
+
+def catalog_last_modified(items: Iterable[Any]) -> datetime | None:
+    """
+    Return the Last-Modified time of a catalog page, if it can have one.
+
+    A deleted or deactivated row, or one that moved off the page, leaves
+    no ``updated_at`` behind, so the catalog cache's change time (bumped
+    by every catalog write, in every worker) counts as well.
+
+    Args:
+        items (Iterable[Any]): Rows shown on the page.
+
+    Returns:
+        Optional[datetime]: Time of the last change, or None within a second
+        of it, where a further change would share the same HTTP date.
+    """
+    changed = max([catalog_cache.changed_at, *(item.updated_at for item in items)])
+    if get_utc_now() - changed < timedelta(seconds=1):
+        return None
+    return changed
+
+
+def conditional_render(items: list, render: Callable[[], str], *parts: Any) -> Response:
+    """
+    Answer a catalog GET with 304 when the client's copy is current.
+
+    The ETag covers the rows on the page and the session details shown
+    in the navigation; Last-Modified is :func:`catalog_last_modified`. Pages with pending flash messages are always
+    rendered, since rendering consumes them.
+
+    Args:
+        items (list): Rows shown on the page.
+        render (Callable[[], str]): Renders the full page on a miss.
+        *parts (Any): Extra ETag inputs, e.g. page number or search query.
+
+    Returns:
+        Response: A 304 or the rendered page with validators.
+    """
+    if "_flashes" in session:
+        return make_response(render())
+
+    etag = catalog_etag(
+        items,
+        request.full_path,
+        session.get("user_id"),
+        session.get("role"),
+        session.get("full_name"),
+        *parts,
+    )
+    # A page still waiting for image variants will change without any
+    # row's updated_at moving: validate it by ETag only
+    variants_pending = any(
+        getattr(item, "image", None) and not image_pipeline.variant_tag(item.image) for item in items
+    )
+    last_modified = None if variants_pending else catalog_last_modified(items)
+
+    if request.if_none_match.contains(etag) or (
+            not request.if_none_match
+            and last_modified is not None
+            and request.if_modified_since is not None
+            and last_modified.replace(microsecond=0) <= request.if_modified_since
+    ):
+        response = Response(status=304)
+    else:
+        response = make_response(render())
+
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # Pages depend on the session, so only the browser may reuse them
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    response.vary.add("Cookie")
+    return response
+
+
+def cache_static_assets(response: Response) -> Response:
+    """
+    ``after_request`` hook: mark content-hashed static files immutable.
+
+    Args:
+        response (Response): Outgoing response.
+
+    Returns:
+        Response: The same response, with Cache-Control adjusted.
+    """
+    if request.endpoint != "static" or response.status_code not in (200, 304):
+        return response
+
+    filename = (request.view_args or {}).get("filename", "")
+    if _HASHED_ASSET.search(filename):
+        response.cache_control.public = True
+        response.cache_control.max_age = IMMUTABLE_MAX_AGE
+        response.cache_control.immutable = True
+        response.cache_control.no_cache = None
+    return response
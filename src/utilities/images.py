@@ -0,0 +1,292 @@
+"""
+Responsive image variants for inventory uploads.
+
+This module provides:
+- Background generation of resized WebP and JPEG variants per upload
+- Content-hashed variant file names that are safe to cache forever
+- A template helper that returns ``src``/``srcset`` for an upload
+
+Variants are written next to the uploads as
+``variants/<upload>.<digest>.<width>w.<ext>``; the name alone is enough
+to rebuild the in-memory manifest after a restart.
+
+Usage:
+    from src.utilities.images import image_pipeline
+    image_pipeline.schedule("Wireless_Mouse.png")
+"""
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+from flask import url_for
+
+from src.utilities.config import Config
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+VARIANT_WIDTHS = (240, 480, 720)
+VARIANT_DIR = os.path.join(Config.UPLOAD_DIR, "variants")
+VARIANT_FORMATS = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+# Seconds between directory rescans when a variant is not yet in the manifest
+RESCAN_INTERVAL = 30.0
+
+
+class ImageVariants(NamedTuple):
+    """URLs a template needs to render a responsive image."""
+
+    src: str
+    webp_srcset: str
+    jpeg_srcset: str
+
+
+class _Entry(NamedTuple):
+    digest: str
+    widths: list[int]
+
+
+def _variant_name(filename: str, digest: str, width: int, ext: str) -> str:
+    return f"{filename}.{digest}.{width}w.{ext}"
+
+
+def _static_url(path: str) -> str:
+    return url_for("static", filename=os.path.relpath(path, "static").replace(os.sep, "/"))
+
+
+class ImagePipeline:
+    """
+    Generate and look up resized variants of uploaded images.
+
+    Args:
+        source_dir (str): Directory holding the original uploads.
+        variant_dir (str): Directory the variants are written to.
+        widths (tuple): Target widths in pixels.
+        workers (int): Background worker threads.
+    """
+
+    def __init__(self, source_dir: str, variant_dir: str, widths: tuple, workers: int):
+        self.source_dir = source_dir
+        self.variant_dir = variant_dir
+        self.widths = widths
+        self.workers = workers
+        self._manifest: dict[str, _Entry] = {}
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._last_scan = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="image-variants"
+                    )
+        return self._executor
+
+    def schedule(self, filename: str | None) -> None:
+        """
+        Queue variant generation for an upload; returns immediately.
+
+        Args:
+            filename (Optional[str]): Upload file name inside ``source_dir``.
+        """
+        if not filename:
+            return
+        with self._lock:
+            if filename in self._pending:
+                return
+            self._pending.add(filename)
+        self._get_executor().submit(self._generate_safely, filename)
+
+    def _generate_safely(self, filename: str) -> None:
+        try:
+            self.generate(filename)
+        except Exception:
+            logger.exception(f"Failed to generate image variants for {filename}")
+        finally:
+            with self._lock:
+                self._pending.discard(filename)
+
+    def generate(self, filename: str) -> list[str]:
+        """
+        Write every variant of an upload synchronously.
+
+        Args:
+            filename (str): Upload file name inside ``source_dir``.
+
+        Returns:
+            List[str]: Names of the variant files written.
+        """
+        # Imported on first use: Pillow is not needed to start serving
+        from PIL import Image, ImageOps
+
+        source_path = os.path.join(self.source_dir, filename)
+        with open(source_path, "rb") as source:
+            digest = hashlib.sha256(source.read()).hexdigest()[:16]
+
+        os.makedirs(self.variant_dir, exist_ok=True)
+        written = []
+        widths = []
+        with Image.open(source_path) as original:
+            image = ImageOps.exif_transpose(original)
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+
+            # JPEG has no alpha channel: flatten onto white once
+            flattened = Image.new("RGB", image.size, (255, 255, 255))
+            flattened.paste(image, mask=image.getchannel("A") if image.mode == "RGBA" else None)
+
+            for target in self.widths:
+                width = min(target, image.width)
+                if width in widths:
+                    continue
+                height = max(1, round(image.height * width / image.width))
+                widths.append(width)
+
+                for ext, (image_format, options) in VARIANT_FORMATS.items():
+                    source_image = image if image_format == "WEBP" else flattened
+                    resized = source_image.resize((width, height), Image.Resampling.LANCZOS)
+                    name = _variant_name(filename, digest, width, ext)
+                    temp_path = os.path.join(self.variant_dir, f".{name}.tmp")
+                    resized.save(temp_path, image_format, **options)
+                    os.replace(temp_path, os.path.join(self.variant_dir, name))
+                    written.append(name)
+
+        with self._lock:
+            self._manifest[filename] = _Entry(digest, sorted(widths))
+        logger.info(f"Generated {len(written)} image variants for {filename}")
+        return written
+
+    def _rescan(self) -> None:
+        self._last_scan = time.monotonic()
+        if not os.path.isdir(self.variant_dir):
+            return
+
+        found: dict[str, _Entry] = {}
+        for name in os.listdir(self.variant_dir):
+            parts = name.rsplit(".", 3)
+            if len(parts) != 4 or parts[3] != "webp" or not parts[2].endswith("w"):
+                continue
+            filename, digest, width = parts[0], parts[1], int(parts[2][:-1])
+            entry = found.setdefault(filename, _Entry(digest, []))
+            if entry.digest == digest:
+                entry.widths.append(width)
+
+        with self._lock:
+            for filename, entry in found.items():
+                entry.widths.sort()
+                self._manifest.setdefault(filename, entry)
+
+    def variants(self, filename: str | None) -> ImageVariants | None:
+        """
+        Look up the variant URLs of an upload.
+
+        Args:
+            filename (Optional[str]): Upload file name.
+
+        Returns:
+            Optional[ImageVariants]: URLs, or None while variants are not ready.
+        """
+        entry = self._entry(filename)
+        if entry is None:
+            return None
+
+        def srcset(ext: str) -> str:
+            return ", ".join(
+                f"{_static_url(os.path.join(self.variant_dir, _variant_name(filename, entry.digest, width, ext)))} {width}w"
+                for width in entry.widths
+            )
+
+        smallest = _variant_name(filename, entry.digest, entry.widths[0], "jpg")
+        return ImageVariants(
+            src=_static_url(os.path.join(self.variant_dir, smallest)),
+            webp_srcset=srcset("webp"),
+            jpeg_srcset=srcset("jpg"),
+        )
+
+    def variant_tag(self, filename: str | None) -> str:
+        """
+        Identify the variants :meth:`variants` would currently return.
+
+        Pages embedding an upload add this to their validators, so they
+        change once the resized copies are ready.
+
+        Args:
+            filename (Optional[str]): Upload file name.
+
+        Returns:
+            str: Digest and widths of the variants, or "" while none are ready.
+        """
+        entry = self._entry(filename)
+        if entry is None:
+            return ""
+        return f"{entry.digest}:{','.join(str(width) for width in entry.widths)}"
+
+    def _entry(self, filename: str | None) -> _Entry | None:
+        if not filename:
+            return None
+        entry = self._manifest.get(filename)
+        if entry is None and time.monotonic() - self._last_scan > RESCAN_INTERVAL:
+            self._rescan()
+            entry = self._manifest.get(filename)
+        return entry
+
+    def discard(self, filename: str) -> None:
+        """
+        Delete every variant of an upload that no longer exists.
+
+        Args:
+            filename (str): Upload file name.
+        """
+        with self._lock:
+            self._manifest.pop(filename, None)
+        if not os.path.isdir(self.variant_dir):
+            return
+        prefix = f"{filename}."
+        for name in os.listdir(self.variant_dir):
+            if name.startswith(prefix):
+                try:
+                    os.remove(os.path.join(self.variant_dir, name))
+                except FileNotFoundError:
+                    pass
+
+    def backfill(self) -> int:
+        """
+        Queue variant generation for uploads that have none yet.
+
+        Returns:
+            int: Number of uploads scheduled.
+        """
+        self._rescan()
+        scheduled = 0
+        if not os.path.isdir(self.source_dir):
+            return scheduled
+        for filename in os.listdir(self.source_dir):
+            path = os.path.join(self.source_dir, filename)
+            if filename.startswith("."):
+                continue
+            if os.path.isfile(path) and filename not in self._manifest:
+                self.schedule(filename)
+                scheduled += 1
+        return scheduled
+
+
+image_pipeline = ImagePipeline(
+    source_dir=Config.UPLOAD_DIR,
+    variant_dir=VARIANT_DIR,
+    widths=VARIANT_WIDTHS,
+    workers=Config.IMAGE_WORKERS,
+)
+
+
+def image_variants(filename: str | None) -> ImageVariants | None:
+    """Template helper: responsive URLs for an upload, or None."""
+    return image_pipeline.variants(filename)
@@ -0,0 +1,110 @@
+"""
+Index management and query plan checks.
+
+This module provides:
+- Creation of indexes declared on the models for tables that already
+  exist (``create_all`` only creates them together with a new table)
+- Removal of retired single-column indexes that cost writes but serve
+  no query
+- ``EXPLAIN QUERY PLAN`` helpers that report table scans
+
+Usage:
+    from src.utilities.indexes import table_scans
+    scans = table_scans(connection, "SELECT * FROM inventory WHERE seller_id = ?", (1,))
+"""
+from collections.abc import Sequence
+
+from sqlalchemy import text
+
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Replaced by the composite and partial indexes declared on the models
+RETIRED_INDEXES = (
+    "ix_inventory_name",
+    "ix_inventory_is_active",
+    "ix_inventory_created_at",
+    "ix_inventory_updated_at",
+    "ix_users_role",
+    "ix_users_is_active",
+    "ix_users_created_at",
+    "ix_users_updated_at",
+)
+
+
+def sync_indexes(connection, metadata) -> None:
+    """
+    Bring the indexes of existing tables in line with the models.
+
+    Missing indexes are created and retired ones dropped. When anything
+    changed, ``ANALYZE`` refreshes the planner statistics so the new
+    indexes are picked up.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+        metadata (MetaData): Metadata holding the model tables.
+    """
+    existing = set(connection.execute(
+        text("SELECT name FROM sqlite_master WHERE type = 'index'")
+    ).scalars())
+
+    changed = []
+    for table in metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(connection)
+                changed.append(f"+{index.name}")
+
+    for name in RETIRED_INDEXES:
+        if name in existing:
+            connection.execute(text(f"DROP INDEX {name}"))
+            changed.append(f"-{name}")
+
+    if changed:
+        connection.execute(text("ANALYZE"))
+        logger.info(f"Indexes updated: {', '.join(changed)}")
+
+
+def explain(connection, statement: str, parameters: Sequence = ()) -> list[str]:
+    """
+    Return the ``EXPLAIN QUERY PLAN`` detail lines of a statement.
+
+    Args:
+        connection: DBAPI (sqlite3) connection or cursor.
+        statement (str): SQL with ``?`` placeholders.
+        parameters (Sequence): Values for the placeholders.
+
+    Returns:
+        List[str]: One line per plan step, e.g. ``SEARCH inventory USING INDEX ...``.
+    """
+    rows = connection.execute(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters)).fetchall()
+    return [row[-1] for row in rows]
+
+
+def table_scans(connection, statement: str, parameters: Sequence = ()) -> list[str]:
+    """
+    Return the plan steps that read a whole table without an index.
+
+    Index scans (``SCAN t USING INDEX``), scans of subqueries and FTS5
+    virtual table lookups are not counted.
+
+    Args:
+        connection: DBAPI (sqlite3) connection or cursor.
+        statement (str): SQL with ``?`` placeholders.
+        parameters (Sequence): Values for the placeholders.
+
+    Returns:
+        List[str]: Offending plan lines; empty when every table is searched.
+    """
+    tables = {
+        name for (name,) in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL%'"
+        )
+    }
+    scans = []
+    for step in explain(connection, statement, parameters):
+        words = step.split()
+        if words[0] == "SCAN" and words[1] in tables and " USING " not in step:
+            scans.append(step)
+    return scans
@@ -0,0 +1,313 @@
+"""
+Request instrumentation and profiling.
+
+This module provides:
+- Per-route latency histograms
+- SQL statement count and time per request via SQLAlchemy engine events
+- Template render timing via Flask's render signals
+- Named timing sections (e.g. bcrypt) recorded from anywhere
+- An opt-in stack sampler that writes flamegraph-compatible folded
+  stacks for requests slower than a threshold
+
+Usage:
+    from src.utilities.instrumentation import init_instrumentation
+    init_instrumentation(app, engine)
+"""
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+from flask import (
+    Flask,
+    before_render_template,
+    g,
+    has_request_context,
+    request,
+    template_rendered,
+)
+from sqlalchemy import event
+
+from src.utilities.config import Config
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds in milliseconds; the last bucket catches everything else
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf"))
+
+
+class Histogram:
+    """Fixed-bucket latency histogram with approximate percentiles."""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKETS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        for index, bound in enumerate(BUCKETS_MS):
+            if value_ms <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        cumulative = 0
+        for bound, bucket_count in zip(BUCKETS_MS, self.counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return min(float(bound), round(self.max_ms, 3))
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                ("+Inf" if bound == float("inf") else str(bound)): bucket_count
+                for bound, bucket_count in zip(BUCKETS_MS, self.counts)
+            },
+        }
+
+
+class RouteStats:
+    """Aggregated timings for one endpoint."""
+
+    def __init__(self):
+        self.latency = Histogram()
+        self.sql_queries = 0
+        self.sql_ms = 0.0
+        self.template_ms = 0.0
+        self.errors = 0
+
+    def snapshot(self) -> dict:
+        requests = self.latency.count or 1
+        return {
+            "latency": self.latency.snapshot(),
+            "errors": self.errors,
+            "sql_queries_per_request": round(self.sql_queries / requests, 3),
+            "sql_ms_per_request": round(self.sql_ms / requests, 3),
+            "template_ms_per_request": round(self.template_ms / requests, 3),
+        }
+
+
+class MetricsRegistry:
+    """Thread-safe store of route, SQL, template and section timings."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: dict[str, RouteStats] = {}
+        self.sections: dict[str, Histogram] = {}
+        self.sql = Histogram()
+        self.templates = Histogram()
+        self.slow_profiles = 0
+
+    def record_request(self, endpoint: str, elapsed_ms: float, sql_queries: int,
+                       sql_ms: float, template_ms: float, failed: bool) -> None:
+        with self._lock:
+            stats = self.routes.setdefault(endpoint, RouteStats())
+            stats.latency.observe(elapsed_ms)
+            stats.sql_queries += sql_queries
+            stats.sql_ms += sql_ms
+            stats.template_ms += template_ms
+            if failed:
+                stats.errors += 1
+
+    def record_sql(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.sql.observe(elapsed_ms)
+
+    def record_template(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.templates.observe(elapsed_ms)
+
+    def record_section(self, name: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.sections.setdefault(name, Histogram()).observe(elapsed_ms)
+
+    def record_profile(self) -> None:
+        with self._lock:
+            self.slow_profiles += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "routes": {name: stats.snapshot() for name, stats in sorted(self.routes.items())},
+                "sql": self.sql.snapshot(),
+                "templates": self.templates.snapshot(),
+                "sections": {name: hist.snapshot() for name, hist in sorted(self.sections.items())},
+                "slow_profiles": self.slow_profiles,
+            }
+
+
+metrics = MetricsRegistry()
+
+
+@contextmanager
+def timed(name: str):
+    """
+    Time a block of code into a named section histogram.
+
+    Example:
+        >>> with timed("bcrypt.verify"):
+        ...     verify()
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.record_section(name, (time.perf_counter() - start) * 1000)
+
+
+def _fold_stack(frame) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    Sample the stacks of request threads at a fixed interval.
+
+    Args:
+        interval (float): Seconds between samples.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._active: dict[int, Counter] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, thread_id: int) -> None:
+        with self._lock:
+            self._active[thread_id] = Counter()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+
+    def stop(self, thread_id: int) -> Counter:
+        with self._lock:
+            return self._active.pop(thread_id, Counter())
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._active:
+                    continue
+                frames = sys._current_frames()
+                for thread_id, stacks in self._active.items():
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        stacks[_fold_stack(frame)] += 1
+
+
+def _write_profile(endpoint: str, elapsed_ms: float, stacks: Counter) -> None:
+    os.makedirs(Config.PROFILE_DIR, exist_ok=True)
+    safe_endpoint = re.sub(r"[^a-zA-Z0-9_.-]", "_", endpoint)
+    path = os.path.join(
+        Config.PROFILE_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}_{safe_endpoint}_{int(elapsed_ms)}ms.folded"
+    )
+    with open(path, "w", encoding="utf-8") as profile:
+        profile.writelines(f"{stack} {count}\n" for stack, count in stacks.most_common())
+    logger.warning(f"Slow request {endpoint} took {elapsed_ms:.1f} ms; profile written to {path}")
+
+
+def _start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append((context, time.perf_counter()))
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    _, start = conn.info["query_start"].pop()
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    metrics.record_sql(elapsed_ms)
+    if has_request_context() and "instrumentation" in g:
+        g.instrumentation["sql_queries"] += 1
+        g.instrumentation["sql_ms"] += elapsed_ms
+
+
+def _discard_query_timer(context):
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time, unless it failed before its timer was started
+    starts = context.connection.info.get("query_start") if context.connection is not None else None
+    if starts and starts[-1][0] is context.execution_context:
+        starts.pop()
+
+
+def init_instrumentation(app: Flask, engine) -> None:
+    """
+    Register request, SQL and template instrumentation on an app.
+
+    Args:
+        app (Flask): Application to instrument.
+        engine (Engine): SQLAlchemy engine whose statements are timed.
+    """
+    sampler = StackSampler(Config.PROFILER_INTERVAL_MS / 1000) if Config.PROFILER_ENABLED else None
+
+    @app.before_request
+    def start_request_timer():
+        g.instrumentation = {"start": time.perf_counter(), "sql_queries": 0, "sql_ms": 0.0, "template_ms": 0.0}
+        if sampler is not None:
+            sampler.start(threading.get_ident())
+
+    @app.teardown_request
+    def record_request(error=None):
+        state = g.pop("instrumentation", None)
+        if state is None:
+            return
+
+        elapsed_ms = (time.perf_counter() - state["start"]) * 1000
+        endpoint = request.endpoint or "<unmatched>"
+        metrics.record_request(
+            endpoint, elapsed_ms, state["sql_queries"], state["sql_ms"], state["template_ms"], error is not None
+        )
+
+        if sampler is not None:
+            stacks = sampler.stop(threading.get_ident())
+            if elapsed_ms >= Config.PROFILER_THRESHOLD_MS and stacks:
+                try:
+                    _write_profile(endpoint, elapsed_ms, stacks)
+                    metrics.record_profile()
+                except OSError:
+                    logger.exception("Failed to write request profile")
+
+    def before_render(sender, template, context, **extra):
+        if has_request_context() and "instrumentation" in g:
+            g.instrumentation["template_start"] = time.perf_counter()
+
+    def after_render(sender, template, context, **extra):
+        if has_request_context() and "instrumentation" in g:
+            start = g.instrumentation.pop("template_start", None)
+            if start is not None:
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                g.instrumentation["template_ms"] += elapsed_ms
+                metrics.record_template(elapsed_ms)
+
+    before_render_template.connect(before_render, app, weak=False)
+    template_rendered.connect(after_render, app, weak=False)
+
+    # Engine listeners are per engine, not per app: register them only once
+    if not event.contains(engine, "before_cursor_execute", _start_query_timer):
+        event.listen(engine, "before_cursor_execute", _start_query_timer)
+        event.listen(engine, "after_cursor_execute", _record_query)
+        event.listen(engine, "handle_error", _discard_query_timer)
+
+    logger.info(f"Instrumentation enabled (profiler={'on' if sampler else 'off'})")
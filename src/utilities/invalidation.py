@@ -0,0 +1,162 @@
+"""
+Cross-process cache invalidation.
+
+This module provides:
+- A version counter per cache namespace in the shared ``cache_versions``
+  table; invalidating a cache bumps its counter in one upsert
+- A poller thread in every worker process that reads the counters and
+  invalidates its local caches when another process bumped one
+- A restart hook for server workers forked from a parent that already
+  started the poller; other children (e.g. the hashing pool) stay idle
+
+Workers therefore keep their in-process caches and still see each
+other's writes within ``INVALIDATION_POLL_INTERVAL`` seconds, instead
+of waiting for the cache TTL.
+
+Usage:
+    from src.utilities.invalidation import invalidation_bus
+    invalidation_bus.subscribe("catalog", drop_local_copy)
+    invalidation_bus.start(engine, Config.INVALIDATION_POLL_INTERVAL)
+    invalidation_bus.publish("catalog")
+"""
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+
+from sqlalchemy import text
+
+from src.models.invalidation import CacheVersion
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+_BUMP = text(
+    "INSERT INTO cache_versions (channel, version) VALUES (:channel, 1) "
+    "ON CONFLICT (channel) DO UPDATE SET version = version + 1 "
+    "RETURNING version"
+)
+_VERSIONS = text("SELECT channel, version FROM cache_versions")
+
+
+class InvalidationBus:
+    """Publish and deliver invalidations between processes sharing one database."""
+
+    def __init__(self):
+        self._engine = None
+        self._interval = 0.0
+        self._subscribers: dict[str, list[Callable[[], None]]] = defaultdict(list)
+        self._seen: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.published = 0
+        self.delivered = 0
+        self.errors = 0
+
+    def subscribe(self, channel: str, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` whenever another process publishes on ``channel``.
+
+        Args:
+            channel (str): Cache namespace.
+            callback (Callable[[], None]): Drops the local copy; must not publish.
+        """
+        self._subscribers[channel].append(callback)
+
+    def start(self, engine, interval: float) -> None:
+        """
+        Start polling every ``interval`` seconds; 0 keeps caches process-local.
+
+        Args:
+            engine (Engine): Engine of the shared database.
+            interval (float): Seconds between polls.
+        """
+        if self._engine is not None or interval <= 0:
+            return
+        with engine.begin() as connection:
+            CacheVersion.__table__.create(connection, checkfirst=True)
+        self._engine = engine
+        self._interval = interval
+        # Whatever happened before this process started is already in the database
+        self._seen = self._read_versions()
+        self._start_thread()
+
+    def publish(self, channel: str) -> None:
+        """
+        Tell every other process to invalidate ``channel``.
+
+        Call after the change is committed; the caller invalidates its own
+        copy itself. Does nothing when the bus is not started.
+
+        Args:
+            channel (str): Cache namespace.
+        """
+        if self._engine is None:
+            return
+        try:
+            with self._engine.begin() as connection:
+                version = connection.execute(_BUMP, {"channel": channel}).scalar_one()
+        except Exception:
+            self.errors += 1
+            logger.exception(f"Failed to publish invalidation for {channel}")
+            return
+
+        with self._lock:
+            self.published += 1
+            # Skip our own bump, unless another process bumped in between
+            if version == self._seen.get(channel, 0) + 1:
+                self._seen[channel] = version
+
+    def poll(self) -> int:
+        """
+        Deliver every invalidation published since the last poll.
+
+        Returns:
+            int: Channels invalidated.
+        """
+        versions = self._read_versions()
+        with self._lock:
+            changed = [channel for channel, version in versions.items() if self._seen.get(channel) != version]
+            self._seen = versions
+            self.delivered += len(changed)
+
+        for channel in changed:
+            for callback in self._subscribers.get(channel, ()):
+                callback()
+        return len(changed)
+
+    def _read_versions(self) -> dict[str, int]:
+        with self._engine.connect() as connection:
+            return dict(connection.execute(_VERSIONS).all())
+
+    def _start_thread(self) -> None:
+        def run():
+            while not self._stop.wait(self._interval):
+                try:
+                    self.poll()
+                except Exception:
+                    self.errors += 1
+                    logger.exception("Invalidation poll failed")
+
+        self._thread = threading.Thread(target=run, name="invalidation-poller", daemon=True)
+        self._thread.start()
+
+    def restart_after_fork(self) -> None:
+        """Start this process's own poller; call in a server worker right after ``fork()``."""
+        # The poller thread does not survive fork(), and the lock may have been held
+        self._lock = threading.Lock()
+        if self._thread is not None:
+            self._stop = threading.Event()
+            self._start_thread()
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self._engine is not None,
+            "published": self.published,
+            "delivered": self.delivered,
+            "errors": self.errors,
+            "versions": dict(self._seen),
+        }
+
+
+invalidation_bus = InvalidationBus()
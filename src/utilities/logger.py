@@ -2,40 +2,191 @@
 Application logging utilities.
 
 This module provides a centralized logger factory that:
-- Logs to both console and rotating log files
+- Hands records to a bounded in-memory queue, never blocking the caller
+- Writes to console and rotating log files from one background listener,
+  started (and the log directory created) when the first record arrives
+- Optionally emits one JSON object per line instead of plain text
+- Samples DEBUG/INFO records per request; warnings and errors always pass
+- Counts records dropped when the queue is full
 - Uses configuration values from Config
-- Prevents duplicate handlers
-- Is safe for reuse across the application
 
 Usage:
     from src.utilities.logger import get_logger
     logger = get_logger(__name__)
 """
+import atexit
+import copy
+import json
 import logging
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional
+import queue
+import random
+import threading
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from src.utilities.config import Config
 
-try:
-    os.makedirs(Config.LOG_DIR, exist_ok=True)
-except OSError as exc:
-    raise RuntimeError(
-        f"Failed to create log directory: {Config.LOG_DIR}"
-    ) from exc
-
-LOG_FILE_PATH = os.path.join(Config.LOG_DIR, Config.LOG_FILE)
+# Whether DEBUG/INFO records of the current request are kept
+_request_sampled: ContextVar[bool] = ContextVar("log_request_sampled", default=True)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format each record as a single-line JSON object."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "location": f"{record.filename}:{record.lineno}",
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class RequestSamplingFilter(logging.Filter):
+    """Drop DEBUG/INFO records from requests that were not sampled."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or _request_sampled.get()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops and counts records instead of blocking."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self._dropped_lock = threading.Lock()
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback once; the listener formats the rest
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if _listener is None:
+            _ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+
+
+def _build_formatter(detailed: bool) -> logging.Formatter:
+    if Config.LOG_FORMAT == "json":
+        return JsonFormatter()
+    if detailed:
+        return logging.Formatter(
+            "%(asctime)s | %(levelname)s | %(name)s | "
+            "%(filename)s:%(lineno)d | %(message)s"
+        )
+    return logging.Formatter(
+        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+    )
 
 
-def get_logger(name: Optional[str] = None) -> logging.Logger:
+def _start_listener(log_queue: queue.Queue) -> QueueListener:
+    try:
+        os.makedirs(Config.LOG_DIR, exist_ok=True)
+    except OSError as exc:
+        raise RuntimeError(
+            f"Failed to create log directory: {Config.LOG_DIR}"
+        ) from exc
+
+    # Console Handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(_build_formatter(detailed=False))
+
+    # File Handler (Rotating)
+    file_handler = RotatingFileHandler(
+        os.path.join(Config.LOG_DIR, Config.LOG_FILE),
+        maxBytes=Config.MAX_BYTES,
+        backupCount=Config.BACKUP_COUNT,
+        encoding="utf-8",
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(_build_formatter(detailed=True))
+
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    return listener
+
+
+def _start_pipeline() -> DroppingQueueHandler:
+    # Handlers, files and the listener thread wait for the first record
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=Config.LOG_QUEUE_SIZE))
+    queue_handler.addFilter(RequestSamplingFilter())
+    return queue_handler
+
+
+def _ensure_listener() -> None:
+    global _listener
+    with _pipeline_lock:
+        if _listener is not None:
+            return
+        try:
+            _listener = _start_listener(_queue_handler.queue)
+
+        except Exception as exc:
+            raise RuntimeError("Failed to initialize logger") from exc
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
+def _reset_after_fork() -> None:
+    # The listener thread does not survive fork(), and the inherited queue
+    # may have been locked mid-put: give the child its own queue, and a
+    # listener only once it logs, so children that never log (such as
+    # the hashing pool) run no extra thread
+    global _listener, _pipeline_lock
+    _pipeline_lock = threading.Lock()
+    _listener = None
+    if _queue_handler is not None:
+        _queue_handler.queue = queue.Queue(maxsize=Config.LOG_QUEUE_SIZE)
+
+
+_queue_handler: DroppingQueueHandler | None = None
+_listener: QueueListener | None = None
+_pipeline_lock = threading.Lock()
+atexit.register(_stop_listener)
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _get_queue_handler() -> DroppingQueueHandler:
+    global _queue_handler
+    if _queue_handler is None:
+        with _pipeline_lock:
+            if _queue_handler is None:
+                _queue_handler = _start_pipeline()
+    return _queue_handler
+
+
+def get_logger(name: str | None = None) -> logging.Logger:
     """
     Create or retrieve a configured application logger.
 
     The logger includes:
-    - Console logging
-    - Rotating file logging
-    - Standardized log format
+    - A shared non-blocking queue handler
+    - Console and rotating file output on a background thread
+    - Standardized text or JSON log format
     - Protection against duplicate handlers
 
     Args:
@@ -58,37 +209,33 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    try:
-        # Console Handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
+    logger.addHandler(_get_queue_handler())
+    logger.debug("Logger initialized successfully")
 
-        console_formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-        )
-        console_handler.setFormatter(console_formatter)
-
-        # File Handler (Rotating)
-        file_handler = RotatingFileHandler(
-            LOG_FILE_PATH,
-            maxBytes=Config.MAX_BYTES,
-            backupCount=Config.BACKUP_COUNT,
-            encoding="utf-8",
-        )
-        file_handler.setLevel(logging.INFO)
+    return logger
 
-        file_formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | "
-            "%(filename)s:%(lineno)d | %(message)s"
-        )
-        file_handler.setFormatter(file_formatter)
 
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+def sample_request() -> None:
+    """
+    Decide whether DEBUG/INFO logs of the current request are kept.
 
-        logger.debug("Logger initialized successfully")
+    Registered as a ``before_request`` hook; the decision applies to
+    the current context only.
+    """
+    _request_sampled.set(random.random() < Config.LOG_SAMPLE_RATE)
 
-    except Exception as exc:
-        raise RuntimeError("Failed to initialize logger") from exc
 
-    return logger
+def get_log_metrics() -> dict:
+    """
+    Report logging queue occupancy and dropped record count.
+
+    Returns:
+        dict: Queue size, capacity and drops.
+    """
+    handler = _get_queue_handler()
+    return {
+        "queued": handler.queue.qsize(),
+        "capacity": handler.queue.maxsize,
+        "dropped": handler.dropped,
+        "sample_rate": Config.LOG_SAMPLE_RATE,
+    }
@@ -0,0 +1,290 @@
+"""
+Versioned schema migrations and online backfills.
+
+This module provides:
+- An ordered revision chain; each revision runs once, in its own
+  transaction, and is recorded in ``schema_revisions``
+- Helpers for changes SQLite can make without rebuilding a table
+  (``ADD COLUMN`` only rewrites the schema, not the rows)
+- Chunked, resumable backfills: rows are processed in primary key order,
+  ``MIGRATION_BATCH_SIZE`` per transaction with a pause between batches,
+  and progress is stored in ``backfills`` so a restart picks up where the
+  last run stopped
+
+A revision that needs existing rows rewritten adds the column (cheap),
+ships code that writes it for new rows, and schedules a backfill for the
+old ones instead of updating the whole table in one long write lock.
+
+Usage:
+    from src.utilities.migrations import upgrade
+    upgrade(engine)
+
+    # A new revision, appended to REVISIONS:
+    def _add_sku(connection):
+        add_column(connection, "inventory", "sku", "TEXT")
+        schedule_backfill(connection, "inventory_sku")
+
+    BACKFILLS["inventory_sku"] = Backfill(
+        "inventory", "UPDATE inventory SET sku = 'SKU-' || id WHERE id BETWEEN :first AND :last"
+    )
+"""
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import text
+from sqlmodel import SQLModel
+
+from src.models.analytics import CatalogStats, SellerStats
+from src.models.migration import BackfillProgress, SchemaRevision
+from src.utilities.analytics import init_analytics
+from src.utilities.helper import get_utc_now
+from src.utilities.indexes import sync_indexes
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Revision:
+    """One schema change; ``down_revision`` links it to its predecessor."""
+
+    revision: str
+    down_revision: str | None
+    description: str
+    upgrade: Callable
+
+
+@dataclass(frozen=True)
+class Backfill:
+    """
+    A rewrite of existing rows, applied one primary key range at a time.
+
+    ``statement`` is executed once per batch with ``:first`` and ``:last``
+    bound to the batch's id range.
+    """
+
+    table: str
+    statement: str
+
+
+def add_column(connection, table: str, column: str, ddl: str) -> None:
+    """
+    Add a column unless it already exists.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+        table (str): Table name.
+        column (str): Column name.
+        ddl (str): Type and constraints, e.g. ``"INTEGER NOT NULL DEFAULT 0"``.
+    """
+    columns = {row[1] for row in connection.execute(text(f"PRAGMA table_info({table})"))}
+    if column not in columns:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+
+def schedule_backfill(connection, name: str) -> None:
+    """
+    Register a backfill to run over the rows that exist now.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+        name (str): Key of ``BACKFILLS``.
+    """
+    table = BACKFILLS[name].table
+    end_id = connection.execute(text(f"SELECT coalesce(max(id), 0) FROM {table}")).scalar_one()
+    connection.execute(
+        text("INSERT OR IGNORE INTO backfills (name, last_id, end_id, rows, done, updated_at) "
+             "VALUES (:name, 0, :end_id, 0, 0, :now)"),
+        {"name": name, "end_id": end_id, "now": get_utc_now()},
+    )
+
+
+def _stock_value_cents(connection) -> None:
+    # Summary tables only hold derived data: recreate them and rebuild
+    # their rows along with the new triggers
+    for table in (CatalogStats.__table__, SellerStats.__table__):
+        table.drop(connection, checkfirst=True)
+        table.create(connection)
+    init_analytics(connection)
+
+
+REVISIONS: list[Revision] = [
+    Revision("0001", None, "baseline schema", lambda connection: None),
+    Revision(
+        "0002", "0001", "composite and partial access-path indexes",
+        lambda connection: sync_indexes(connection, SQLModel.metadata),
+    ),
+    Revision("0003", "0002", "stock value summaries in whole cents", _stock_value_cents),
+]
+
+BACKFILLS: dict[str, Backfill] = {}
+
+
+def _check_chain() -> None:
+    previous = None
+    for revision in REVISIONS:
+        if revision.down_revision != previous:
+            raise RuntimeError(
+                f"Revision {revision.revision} follows {revision.down_revision}, expected {previous}"
+            )
+        previous = revision.revision
+
+
+_check_chain()
+
+
+def _ensure_tables(engine) -> None:
+    with engine.begin() as connection:
+        SchemaRevision.__table__.create(connection, checkfirst=True)
+        BackfillProgress.__table__.create(connection, checkfirst=True)
+
+
+def applied_revisions(engine) -> list[str]:
+    """Return the recorded revisions, oldest first."""
+    _ensure_tables(engine)
+    with engine.connect() as connection:
+        return list(connection.execute(
+            text("SELECT revision FROM schema_revisions ORDER BY revision")
+        ).scalars())
+
+
+def upgrade(engine) -> list[str]:
+    """
+    Apply every revision that has not run yet, in chain order.
+
+    Each revision and its ``schema_revisions`` row commit together, so a
+    failed revision leaves nothing behind and is retried on the next run.
+
+    Args:
+        engine (Engine): Database engine.
+
+    Returns:
+        List[str]: Revisions applied by this call.
+    """
+    applied = set(applied_revisions(engine))
+    unknown = applied - {revision.revision for revision in REVISIONS}
+    if unknown:
+        logger.warning(f"Database has revisions this code does not know: {sorted(unknown)}")
+
+    newly_applied = []
+    for revision in REVISIONS:
+        if revision.revision in applied:
+            continue
+        with engine.begin() as connection:
+            revision.upgrade(connection)
+            connection.execute(
+                text("INSERT INTO schema_revisions (revision, applied_at) VALUES (:revision, :now)"),
+                {"revision": revision.revision, "now": get_utc_now()},
+            )
+        newly_applied.append(revision.revision)
+        logger.info(f"Applied schema revision {revision.revision}: {revision.description}")
+    return newly_applied
+
+
+def pending_backfills(engine) -> list[BackfillProgress]:
+    """Return the scheduled backfills that have not finished."""
+    _ensure_tables(engine)
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text("SELECT name, last_id, end_id, rows, done FROM backfills WHERE done = 0 ORDER BY name")
+        ).all()
+    return [BackfillProgress(name=name, last_id=last_id, end_id=end_id, rows=count, done=bool(done))
+            for name, last_id, end_id, count, done in rows]
+
+
+def run_backfill(engine, name: str, batch_size: int, pause: float,
+                 stop: threading.Event | None = None) -> int:
+    """
+    Process a scheduled backfill batch by batch until it finishes or ``stop`` is set.
+
+    Every batch commits its rows and its progress together, so an
+    interrupted run resumes after the last committed batch.
+
+    Args:
+        engine (Engine): Database engine.
+        name (str): Key of ``BACKFILLS``.
+        batch_size (int): Rows per transaction.
+        pause (float): Seconds to sleep between batches, leaving the write lock free.
+        stop (Optional[threading.Event]): Set to stop after the current batch.
+
+    Returns:
+        int: Rows processed by this call.
+    """
+    backfill = BACKFILLS[name]
+    stop = stop or threading.Event()
+    processed = 0
+
+    while not stop.is_set():
+        with engine.begin() as connection:
+            last_id, end_id = connection.execute(
+                text("SELECT last_id, end_id FROM backfills WHERE name = :name"), {"name": name}
+            ).one()
+            ids = connection.execute(
+                text(f"SELECT id FROM {backfill.table} WHERE id > :last_id AND id <= :end_id "
+                     f"ORDER BY id LIMIT :limit"),
+                {"last_id": last_id, "end_id": end_id, "limit": batch_size},
+            ).scalars().all()
+
+            if ids:
+                connection.execute(text(backfill.statement), {"first": ids[0], "last": ids[-1]})
+            connection.execute(
+                text("UPDATE backfills SET last_id = :last_id, rows = rows + :count, done = :done, "
+                     "updated_at = :now WHERE name = :name"),
+                {"last_id": ids[-1] if ids else last_id, "count": len(ids), "done": len(ids) < batch_size,
+                 "now": get_utc_now(), "name": name},
+            )
+        processed += len(ids)
+        if len(ids) < batch_size:
+            logger.info(f"Backfill {name} finished")
+            break
+        stop.wait(pause)
+    return processed
+
+
+class BackfillRunner:
+    """Run the pending backfills on a daemon thread."""
+
+    def __init__(self):
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self.rows = 0
+        self.current: str | None = None
+
+    def start(self, engine, batch_size: int, pause: float) -> None:
+        """
+        Work through every pending backfill, one at a time.
+
+        Args:
+            engine (Engine): Database engine.
+            batch_size (int): Rows per transaction.
+            pause (float): Seconds between batches.
+        """
+        if self._thread is not None:
+            return
+
+        def run():
+            for progress in pending_backfills(engine):
+                if progress.name not in BACKFILLS:
+                    logger.warning(f"Skipping unknown backfill {progress.name}")
+                    continue
+                self.current = progress.name
+                try:
+                    self.rows += run_backfill(engine, progress.name, batch_size, pause, self._stop)
+                except Exception:
+                    logger.exception(f"Backfill {progress.name} failed; it resumes on the next start")
+                if self._stop.is_set():
+                    break
+            self.current = None
+
+        self._thread = threading.Thread(target=run, name="backfill-runner", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> dict:
+        return {"current": self.current, "rows": self.rows}
+
+
+backfill_runner = BackfillRunner()
@@ -0,0 +1,222 @@
+"""
+Pagination utilities shared by the catalog listing routes.
+
+This module provides:
+- A registry of the supported inventory sort orders
+- COUNT(*) based totals that never hydrate ORM rows
+- Offset pagination for numbered page links
+- Opt-in keyset (cursor) pagination that seeks by (sort key, id)
+
+Usage:
+    from src.utilities.pagination import paginate
+    result = paginate(db_session, stmt, sort="price_asc", page=2)
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from math import ceil
+from typing import Any
+
+from sqlalchemy import func, tuple_
+
+from src.models.inventory import Inventory
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """A sort column, the Python type of its values and the direction; ``Inventory.id`` breaks ties."""
+
+    column: Any
+    value_type: type
+    descending: bool = False
+
+
+DEFAULT_SORT = "date_desc"
+
+SORT_KEYS = {
+    "name_asc": SortKey(Inventory.name, str),
+    "name_desc": SortKey(Inventory.name, str, descending=True),
+    "price_asc": SortKey(Inventory.price, float),
+    "price_desc": SortKey(Inventory.price, float, descending=True),
+    "date_asc": SortKey(Inventory.created_at, datetime),
+    "date_desc": SortKey(Inventory.created_at, datetime, descending=True),
+}
+
+
+@dataclass
+class Page:
+    """One page of results plus the metadata templates need."""
+
+    items: list[Any]
+    page: int
+    per_page: int
+    total_items: int | None = None
+    total_pages: int | None = None
+    next_cursor: str | None = None
+
+
+def get_sort_key(sort: str | None) -> SortKey:
+    """
+    Resolve a ``sort`` query parameter to a registered sort key.
+
+    Unknown or empty values fall back to newest first.
+
+    Args:
+        sort (Optional[str]): Value of the ``sort`` query parameter.
+
+    Returns:
+        SortKey: The matching sort key.
+    """
+    return SORT_KEYS.get(sort or DEFAULT_SORT, SORT_KEYS[DEFAULT_SORT])
+
+
+def count_rows(db_session, stmt) -> int:
+    """
+    Count the rows a statement would return with a single COUNT(*).
+
+    The statement's WHERE clause is reused as-is, while ordering,
+    limit and offset are stripped so SQLite can answer from an index.
+
+    Args:
+        db_session (Session): Open database session.
+        stmt (Select): Filtered ``select(...)`` statement.
+
+    Returns:
+        int: Number of matching rows.
+    """
+    count_stmt = (
+        stmt.with_only_columns(func.count(), maintain_column_froms=True)
+        .order_by(None)
+        .limit(None)
+        .offset(None)
+    )
+    return db_session.scalar(count_stmt)
+
+
+def encode_cursor(sort_key: SortKey, row: Any) -> str:
+    """
+    Encode the position of ``row`` under ``sort_key`` as an opaque token.
+
+    Args:
+        sort_key (SortKey): Active sort key.
+        row (Any): Last row of the current page.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    value = getattr(row, sort_key.column.key)
+    if isinstance(value, datetime):
+        value = {"dt": value.isoformat()}
+    payload = json.dumps([value, row.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _matches_sort(value: Any, sort_key: SortKey) -> bool:
+    if sort_key.value_type is float:
+        # Any JSON number will do; booleans are ints but never prices
+        return isinstance(value, int | float) and not isinstance(value, bool)
+    return isinstance(value, sort_key.value_type)
+
+
+def decode_cursor(cursor: str, sort_key: SortKey) -> tuple | None:
+    """
+    Decode a cursor produced by :func:`encode_cursor` for ``sort_key``.
+
+    A cursor whose value does not fit the sort column, e.g. a price
+    cursor reused after switching to the date sort, counts as invalid.
+
+    Args:
+        cursor (str): Cursor from the query string.
+        sort_key (SortKey): Active sort key.
+
+    Returns:
+        Optional[tuple]: ``(sort value, id)``, or None if the cursor is invalid.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if isinstance(value, dict):
+            value = datetime.fromisoformat(value["dt"])
+        if not _matches_sort(value, sort_key):
+            raise TypeError(f"cursor value does not fit {sort_key.column.key}")
+        return value, int(row_id)
+
+    except (ValueError, TypeError, KeyError):
+        logger.warning(f"Ignoring malformed pagination cursor: {cursor}")
+        return None
+
+
+def _apply_order(stmt, sort_key: SortKey, id_column):
+    if sort_key.descending:
+        return stmt.order_by(sort_key.column.desc(), id_column.desc())
+    return stmt.order_by(sort_key.column.asc(), id_column.asc())
+
+
+def paginate(
+        db_session,
+        stmt,
+        sort: str | None = None,
+        page: int = 1,
+        per_page: int = 10,
+        cursor: str | None = None,
+        id_column: Any = Inventory.id,
+) -> Page:
+    """
+    Run a filtered statement one page at a time.
+
+    Offset mode (the default) counts with COUNT(*) and fills in
+    ``total_items``/``total_pages`` for numbered links. Passing a
+    ``cursor`` switches to keyset mode: rows are seeked with
+    ``(sort column, id) > (?, ?)`` so any page costs the same as the
+    first, and no total is computed.
+
+    Args:
+        db_session (Session): Open database session.
+        stmt (Select): Filtered, unordered ``select(...)`` statement.
+        sort (Optional[str]): Registered sort name, e.g. ``"price_asc"``.
+        page (int): 1-based page number for offset mode.
+        per_page (int): Page size.
+        cursor (Optional[str]): Cursor from a previous page's ``next_cursor``.
+        id_column (Any): Unique tie-breaker column.
+
+    Returns:
+        Page: Items and pagination metadata.
+    """
+    sort_key = get_sort_key(sort)
+    page = max(page, 1)
+
+    if cursor is not None:
+        position = decode_cursor(cursor, sort_key) if cursor else None
+        if position:
+            seek = tuple_(sort_key.column, id_column)
+            stmt = stmt.where(seek < position if sort_key.descending else seek > position)
+
+        stmt = _apply_order(stmt, sort_key, id_column).limit(per_page + 1)
+        rows = db_session.exec(stmt).all()
+        items = rows[:per_page]
+        next_cursor = encode_cursor(sort_key, items[-1]) if len(rows) > per_page else None
+        return Page(items=items, page=page, per_page=per_page, next_cursor=next_cursor)
+
+    total_items = count_rows(db_session, stmt)
+    total_pages = ceil(total_items / per_page)
+
+    stmt = _apply_order(stmt, sort_key, id_column)
+    stmt = stmt.offset((page - 1) * per_page).limit(per_page)
+    items = db_session.exec(stmt).all()
+
+    next_cursor = None
+    if items and page < total_pages:
+        next_cursor = encode_cursor(sort_key, items[-1])
+
+    return Page(
+        items=items,
+        page=page,
+        per_page=per_page,
+        total_items=total_items,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
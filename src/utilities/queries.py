@@ -0,0 +1,110 @@
+"""
+Query repository for inventory and users.
+
+This module provides:
+- Lookups built with ``lambda_stmt``, so SQLAlchemy caches the whole
+  statement construction as well as its compiled SQL; only the bound
+  parameters change per request
+- Prebuilt base statements for the catalog and seller listings
+- A column projection for list views that returns plain ``Row`` tuples
+  instead of hydrated, identity-mapped ORM objects
+
+Routes that change rows still load full models through
+:func:`find_seller_item` and :func:`find_user_by_email`; everything that
+only renders a list goes through the projection.
+
+Usage:
+    from src.utilities.queries import find_seller_item
+    from src.utilities.queries import seller_listing
+    item = find_seller_item(db_session, item_id, seller_id)
+    result = paginate(db_session, seller_listing(seller_id), sort="price_asc")
+"""
+
+from sqlalchemy import Select, lambda_stmt
+from sqlmodel import select
+
+from src.models.inventory import Inventory
+from src.models.user import User
+
+# Everything the catalog and dashboard cards, ETags and cursors read
+LIST_COLUMNS = (
+    Inventory.id,
+    Inventory.name,
+    Inventory.description,
+    Inventory.price,
+    Inventory.quantity,
+    Inventory.image,
+    Inventory.created_at,
+    Inventory.updated_at,
+)
+
+_SELLER_LISTING = select(*LIST_COLUMNS).where(Inventory.is_active == True)
+
+# Public cards also show the seller's name; a join replaces the lazy load
+_CATALOG_LISTING = (
+    select(*LIST_COLUMNS, User.full_name.label("seller_name"))
+    .join(User, User.id == Inventory.seller_id)
+    .where(Inventory.is_active == True)
+)
+
+
+def catalog_listing() -> Select:
+    """
+    Return the public catalog statement: active items with their seller's name.
+
+    Returns:
+        Select: Unordered statement for :func:`~src.utilities.pagination.paginate`.
+    """
+    return _CATALOG_LISTING
+
+
+def seller_listing(seller_id: int) -> Select:
+    """
+    Return the dashboard statement for one seller's active items.
+
+    Args:
+        seller_id (int): Owner of the listed items.
+
+    Returns:
+        Select: Unordered statement for :func:`~src.utilities.pagination.paginate`.
+    """
+    return _SELLER_LISTING.where(Inventory.seller_id == seller_id)
+
+
+def find_seller_item(db_session, item_id: int, seller_id: int) -> Inventory | None:
+    """
+    Load an active inventory item owned by ``seller_id``.
+
+    Args:
+        db_session (Session): Open database session.
+        item_id (int): Inventory id.
+        seller_id (int): Expected owner.
+
+    Returns:
+        Optional[Inventory]: The item, or None if it is missing, inactive or not owned.
+    """
+    stmt = lambda_stmt(lambda: select(Inventory).where(
+        Inventory.id == item_id,
+        Inventory.seller_id == seller_id,
+        Inventory.is_active == True,
+    ))
+    return db_session.exec(stmt).scalars().one_or_none()
+
+
+def find_user_by_email(db_session, email_id: str, active_only: bool = False) -> User | None:
+    """
+    Load a user by email id.
+
+    Args:
+        db_session (Session): Open database session.
+        email_id (str): Email id to look up.
+        active_only (bool): Ignore deactivated accounts.
+
+    Returns:
+        Optional[User]: The user, or None if there is no match.
+    """
+    if active_only:
+        stmt = lambda_stmt(lambda: select(User).where(User.email_id == email_id, User.is_active == True))
+    else:
+        stmt = lambda_stmt(lambda: select(User).where(User.email_id == email_id))
+    return db_session.exec(stmt).scalars().one_or_none()
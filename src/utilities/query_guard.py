@@ -0,0 +1,104 @@
+"""
+Development-time N+1 query detection.
+
+This module provides:
+- A per-request count of ORM lazy loads, grouped by relationship
+- A query budget check run after every request, using the SQL count
+  gathered by the instrumentation module
+- ``warn`` mode, which logs offending requests, and ``raise`` mode,
+  which turns them into errors so a test run fails loudly
+
+Usage:
+    from src.utilities.query_guard import init_query_guard
+    init_query_guard(app)   # after init_instrumentation(app, engine)
+"""
+from collections import Counter
+
+from flask import Flask, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from src.utilities.config import Config
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+MODES = ("off", "warn", "raise")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised in ``raise`` mode when a request breaks its query budget."""
+
+
+def _relationship_name(state: ORMExecuteState) -> str:
+    path = state.loader_strategy_path
+    if path is None or len(path) < 2:
+        return "<unknown>"
+    return f"{path[-2].class_.__name__}.{path[-1].key}"
+
+
+def _count_lazy_load(state: ORMExecuteState) -> None:
+    if not has_request_context() or not state.is_select or not state.is_relationship_load:
+        return
+    if state.lazy_loaded_from is None:
+        return
+    lazy_loads = g.get("lazy_loads")
+    if lazy_loads is None:
+        lazy_loads = g.lazy_loads = Counter()
+    lazy_loads[_relationship_name(state)] += 1
+
+
+def check_query_budget(sql_queries: int, lazy_loads: Counter) -> list:
+    """
+    List the ways a request exceeded its query budget.
+
+    Args:
+        sql_queries (int): Statements the request executed.
+        lazy_loads (Counter): Lazy loads per relationship.
+
+    Returns:
+        list: Human-readable problems; empty if within budget.
+    """
+    problems = []
+    if sql_queries > Config.QUERY_GUARD_MAX_QUERIES:
+        problems.append(f"{sql_queries} SQL queries (budget {Config.QUERY_GUARD_MAX_QUERIES})")
+    for relationship, count in lazy_loads.most_common():
+        if count > Config.QUERY_GUARD_MAX_LAZY_LOADS:
+            problems.append(
+                f"{count} lazy loads of {relationship} (budget {Config.QUERY_GUARD_MAX_LAZY_LOADS}); "
+                f"add selectinload/joinedload to the query"
+            )
+    return problems
+
+
+def init_query_guard(app: Flask) -> None:
+    """
+    Enforce the configured query budget on every request.
+
+    Does nothing when ``QUERY_GUARD`` is ``off``.
+
+    Args:
+        app (Flask): Application to guard.
+    """
+    mode = Config.QUERY_GUARD
+    if mode not in MODES:
+        raise ValueError(f"QUERY_GUARD must be one of {', '.join(MODES)}, got '{mode}'")
+    if mode == "off":
+        return
+
+    # The listener is process-wide; a second app must not count every load twice
+    if not event.contains(Session, "do_orm_execute", _count_lazy_load):
+        event.listen(Session, "do_orm_execute", _count_lazy_load)
+
+    @app.after_request
+    def enforce_query_budget(response):
+        state = g.get("instrumentation") or {}
+        problems = check_query_budget(state.get("sql_queries", 0), g.pop("lazy_loads", Counter()))
+        if problems:
+            message = f"Query budget exceeded on {request.method} {request.path}: " + "; ".join(problems)
+            if mode == "raise":
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response
+
+    logger.info(f"Query guard enabled (mode={mode})")
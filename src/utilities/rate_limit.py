@@ -0,0 +1,295 @@
+"""
+Token-bucket rate limiting.
+
+This module provides:
+- Token buckets with a burst capacity and a steady refill rate, keyed by
+  an identity such as a client IP or an email address
+- An in-memory backend (per process) and a SQLite backend shared by every
+  worker process, both evicting buckets that have refilled completely
+- The login throttle, which is checked before any password hashing work
+
+Usage:
+    from src.utilities.rate_limit import login_throttle
+    login_throttle.check(request.remote_addr, email_id)   # raises LoginThrottled
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from sqlalchemy import text
+
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class Decision(NamedTuple):
+    """Outcome of taking a token."""
+
+    allowed: bool
+    retry_after: float
+
+
+class LoginThrottled(RuntimeError):
+    """Raised when a login attempt is over its IP or email limit."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Too many login attempts, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class RateLimitBackend(ABC):
+    """Storage for bucket state: token count and time of the last refill."""
+
+    @abstractmethod
+    def take(self, key: str, capacity: float, rate: float, now: float) -> Decision:
+        """Refill the bucket up to ``now`` and take one token if there is one."""
+
+    @abstractmethod
+    def reset(self, key: str) -> None:
+        """Forget a bucket, i.e. refill it completely."""
+
+    @abstractmethod
+    def evict(self, prefix: str, capacity: float, rate: float, now: float) -> int:
+        """Drop buckets under ``prefix`` that are full again; return how many."""
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """
+    Buckets as ``key -> (tokens, updated)`` tuples in one dict.
+
+    Periodic eviction removes buckets that have refilled; if ``max_keys``
+    is still reached, the oldest keys are dropped, so a flood of distinct
+    identities cannot grow memory without bound.
+
+    Args:
+        max_keys (int): Maximum buckets held.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self.overflow_evictions = 0
+
+    def take(self, key: str, capacity: float, rate: float, now: float) -> Decision:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.max_keys:
+                    self._make_room()
+                tokens = capacity
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return Decision(False, (1 - tokens) / rate)
+            self._buckets[key] = (tokens - 1, now)
+            return Decision(True, 0.0)
+
+    def _make_room(self) -> None:
+        # Dropping a bucket only forgives its attempts; dict order is insertion order
+        excess = len(self._buckets) - self.max_keys + 1
+        for _ in range(excess):
+            del self._buckets[next(iter(self._buckets))]
+        self.overflow_evictions += excess
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def evict(self, prefix: str, capacity: float, rate: float, now: float) -> int:
+        with self._lock:
+            full = [
+                key for key, (tokens, updated) in self._buckets.items()
+                if key.startswith(prefix) and tokens + (now - updated) * rate >= capacity
+            ]
+            for key in full:
+                del self._buckets[key]
+        return len(full)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Buckets in the ``rate_limits`` table, shared by all worker processes.
+
+    Taking a token is a single upsert whose ``WHERE`` clause refuses the
+    update when the refilled bucket is empty, so concurrent processes
+    cannot both spend the last token.
+
+    Args:
+        engine (Engine): Database engine.
+    """
+
+    _take = text("""
+        INSERT INTO rate_limits (key, tokens, updated) VALUES (:key, :capacity - 1, :now)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = min(:capacity, tokens + (:now - updated) * :rate) - 1,
+            updated = :now
+        WHERE min(:capacity, tokens + (:now - updated) * :rate) >= 1
+    """)
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def take(self, key: str, capacity: float, rate: float, now: float) -> Decision:
+        params = {"key": key, "capacity": capacity, "rate": rate, "now": now}
+        with self.engine.begin() as connection:
+            if connection.execute(self._take, params).rowcount:
+                return Decision(True, 0.0)
+            tokens = connection.execute(
+                text("SELECT min(:capacity, tokens + (:now - updated) * :rate) FROM rate_limits WHERE key = :key"),
+                params,
+            ).scalar_one()
+        return Decision(False, (1 - tokens) / rate)
+
+    def reset(self, key: str) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(text("DELETE FROM rate_limits WHERE key = :key"), {"key": key})
+
+    def evict(self, prefix: str, capacity: float, rate: float, now: float) -> int:
+        # A bucket last touched a full refill period ago is full whatever it held
+        with self.engine.begin() as connection:
+            return connection.execute(
+                text("DELETE FROM rate_limits WHERE updated < :cutoff AND substr(key, 1, :length) = :prefix"),
+                {"cutoff": now - capacity / rate, "length": len(prefix), "prefix": prefix},
+            ).rowcount
+
+
+class RateLimiter:
+    """
+    One named token-bucket policy.
+
+    Args:
+        name (str): Key prefix and metrics label.
+        backend (RateLimitBackend): Where bucket state lives.
+        capacity (int): Burst size, in attempts.
+        refill_seconds (float): Seconds to earn back one attempt.
+        evict_interval (float): Minimum seconds between eviction sweeps.
+    """
+
+    def __init__(self, name: str, backend: RateLimitBackend, capacity: int, refill_seconds: float,
+                 evict_interval: float):
+        self.name = name
+        self.backend = backend
+        self.capacity = capacity
+        self.rate = 1 / refill_seconds
+        self.evict_interval = evict_interval
+        self._last_evict = time.time()
+        self.allowed = 0
+        self.rejected = 0
+        self.evicted = 0
+
+    def hit(self, identity: str) -> Decision:
+        """
+        Spend one attempt for ``identity``.
+
+        Args:
+            identity (str): Who is being limited, e.g. an IP address.
+
+        Returns:
+            Decision: Whether the attempt may proceed, and if not, when to retry.
+        """
+        now = time.time()
+        if now - self._last_evict > self.evict_interval:
+            self._last_evict = now
+            self.evicted += self.backend.evict(f"{self.name}:", self.capacity, self.rate, now)
+
+        decision = self.backend.take(f"{self.name}:{identity}", self.capacity, self.rate, now)
+        if decision.allowed:
+            self.allowed += 1
+        else:
+            self.rejected += 1
+        return decision
+
+    def reset(self, identity: str) -> None:
+        """Give ``identity`` its full burst back."""
+        self.backend.reset(f"{self.name}:{identity}")
+
+    def stats(self) -> dict:
+        return {"allowed": self.allowed, "rejected": self.rejected, "evicted": self.evicted}
+
+
+class LoginThrottle:
+    """
+    Limit login attempts per client IP and per email address.
+
+    The IP limit slows down spraying many accounts from one client; the
+    email limit slows down guessing one account from many clients. A
+    successful login restores the account's email budget.
+
+    Args:
+        by_ip (RateLimiter): Limiter keyed by client IP.
+        by_email (RateLimiter): Limiter keyed by normalised email.
+    """
+
+    def __init__(self, by_ip: RateLimiter, by_email: RateLimiter):
+        self.by_ip = by_ip
+        self.by_email = by_email
+        self.successes = 0
+        self.failures = 0
+
+    def check(self, ip: str, email: str) -> None:
+        """
+        Spend one attempt from both buckets.
+
+        Raises:
+            LoginThrottled: If either bucket is empty.
+        """
+        for limiter, identity in ((self.by_ip, ip), (self.by_email, email.lower())):
+            decision = limiter.hit(identity)
+            if not decision.allowed:
+                logger.warning(f"Login throttled by {limiter.name} for {identity}")
+                raise LoginThrottled(decision.retry_after)
+
+    def use_shared_backend(self) -> None:
+        """
+        Keep the buckets in SQLite, whatever ``RATE_LIMIT_BACKEND`` says.
+
+        Needed when several worker processes serve requests: with
+        per-process buckets every worker would grant the full budget.
+        """
+        if not isinstance(self.by_ip.backend, SQLiteRateLimitBackend):
+            logger.warning("Several workers share the login limits: using the sqlite rate limit backend")
+            self.by_ip.backend = self.by_email.backend = SQLiteRateLimitBackend(engine)
+
+    def succeeded(self, email: str) -> None:
+        self.successes += 1
+        self.by_email.reset(email.lower())
+
+    def failed(self) -> None:
+        self.failures += 1
+
+    def stats(self) -> dict:
+        stats = {
+            "successes": self.successes,
+            "failures": self.failures,
+            self.by_ip.name: self.by_ip.stats(),
+            self.by_email.name: self.by_email.stats(),
+        }
+        if isinstance(self.by_ip.backend, MemoryRateLimitBackend):
+            stats["buckets"] = len(self.by_ip.backend)
+            stats["overflow_evictions"] = self.by_ip.backend.overflow_evictions
+        return stats
+
+
+def _build_backend() -> RateLimitBackend:
+    if Config.RATE_LIMIT_BACKEND == "sqlite":
+        return SQLiteRateLimitBackend(engine)
+    return MemoryRateLimitBackend(Config.RATE_LIMIT_MAX_KEYS)
+
+
+_backend = _build_backend()
+login_throttle = LoginThrottle(
+    RateLimiter("login-ip", _backend, Config.LOGIN_IP_BURST, Config.LOGIN_IP_REFILL,
+                Config.RATE_LIMIT_EVICT_INTERVAL),
+    RateLimiter("login-email", _backend, Config.LOGIN_EMAIL_BURST, Config.LOGIN_EMAIL_REFILL,
+                Config.RATE_LIMIT_EVICT_INTERVAL),
+)
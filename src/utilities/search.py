@@ -0,0 +1,158 @@
+"""
+Full-text catalog search backed by SQLite FTS5.
+
+This module provides:
+- An external-content FTS5 index over inventory name/description
+- Triggers that keep the index in sync with every INSERT/UPDATE/DELETE
+- Safe translation of free-text user input into prefix MATCH queries
+- bm25-ranked and filter-only statement helpers for the routes
+
+Usage:
+    from src.utilities.search import ranked_matches
+    matches = ranked_matches("wireless mouse")
+    stmt = select(Inventory).join(matches, matches.c.rowid == Inventory.id)
+"""
+import re
+
+from sqlalchemy import Float, Integer, column, text
+
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+FTS_TABLE = "inventory_fts"
+
+# Column weights for bm25(): a hit in the name outranks one in the description
+NAME_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+SCHEMA = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        name,
+        description,
+        content='inventory',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON inventory BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON inventory BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF name, description ON inventory BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, description)
+        VALUES ('delete', old.id, old.name, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, name, description)
+        VALUES (new.id, new.name, new.description);
+    END
+    """,
+)
+
+
+def init_search_index(connection) -> None:
+    """
+    Create the FTS5 index and its sync triggers if they are missing.
+
+    When the index is created against an existing catalog it is
+    rebuilt once from the ``inventory`` table.
+
+    Args:
+        connection (Connection): Open SQLAlchemy connection inside a transaction.
+    """
+    exists = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first()
+
+    for statement in SCHEMA:
+        connection.execute(text(statement))
+
+    if not exists:
+        connection.execute(text(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"))
+        logger.info("Full-text search index built")
+
+
+def build_match_query(query: str) -> str | None:
+    """
+    Translate free-text input into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, so FTS5 operators and
+    punctuation in user input are never interpreted.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        Optional[str]: MATCH expression, or None if the input has no words.
+
+    Example:
+        >>> build_match_query("wire mous")
+        '"wire"* "mous"*'
+    """
+    tokens = _TOKEN_PATTERN.findall(query or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def _match_clause(query: str) -> str:
+    # Input without any words matches nothing rather than raising a syntax error
+    if build_match_query(query) is None:
+        return "0"
+    return f"{FTS_TABLE} MATCH :match"
+
+
+def _match_params(query: str) -> dict:
+    match = build_match_query(query)
+    return {"match": match} if match is not None else {}
+
+
+def matching_ids(query: str):
+    """
+    Build a ``SELECT rowid`` statement for use with ``Inventory.id.in_(...)``.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        TextualSelect: Statement yielding the ids of matching items.
+    """
+    return text(
+        f"SELECT rowid FROM {FTS_TABLE} WHERE {_match_clause(query)}"
+    ).bindparams(**_match_params(query)).columns(column("rowid", Integer))
+
+
+def ranked_matches(query: str):
+    """
+    Build a subquery of matching ids with their bm25 rank.
+
+    Lower ``rank`` values are better matches, so order ascending.
+
+    Args:
+        query (str): Raw search text.
+
+    Returns:
+        Subquery: Selectable with ``rowid`` and ``rank`` columns.
+    """
+    return text(
+        f"SELECT rowid, bm25({FTS_TABLE}, {NAME_WEIGHT}, {DESCRIPTION_WEIGHT}) AS rank "
+        f"FROM {FTS_TABLE} WHERE {_match_clause(query)}"
+    ).bindparams(
+        **_match_params(query)
+    ).columns(
+        column("rowid", Integer),
+        column("rank", Float),
+    ).subquery("ranked_matches")
@@ -2,16 +2,19 @@
 Authentication and authorization utilities.
 
 This module provides:
-- Password hashing and verification using bcrypt
-- Login-required and role-based access decorators
+- Password hashing and verification using bcrypt on the hashing pool
+- Detection of hashes created with an outdated bcrypt cost
+- A dummy verify so unknown accounts cost as much as wrong passwords
+- Login-required and role-based access decorators, checked against the
+  user's current (cached) role and active state rather than the session
 - Secure session-based access control helpers
 """
-
+import secrets
+from functools import lru_cache
 from functools import wraps
 from typing import Any
 from typing import Callable
 
-import bcrypt
 from flask import flash
 from flask import redirect
 from flask import request
@@ -19,7 +22,14 @@ from flask import session
 from flask import url_for
 
 from src.utilities.config import Config
+from src.utilities.hashing import HashingBusyError
+from src.utilities.hashing import bcrypt_check
+from src.utilities.hashing import bcrypt_hash
+from src.utilities.hashing import hashing_service
+from src.utilities.instrumentation import timed
 from src.utilities.logger import get_logger
+from src.utilities.user_state import UserState
+from src.utilities.user_state import get_user_state
 
 logger = get_logger(__name__)
 
@@ -36,6 +46,7 @@ def hash_password(plain_password: str) -> str:
 
     Raises:
         ValueError: If the password is empty.
+        HashingBusyError: If the hashing pool is saturated.
         RuntimeError: If hashing fails.
 
     Example:
@@ -48,11 +59,16 @@ def hash_password(plain_password: str) -> str:
         raise ValueError("Password must not be empty")
 
     try:
-        salt = bcrypt.gensalt(rounds=Config.SALT_LENGTH)
-        hashed = bcrypt.hashpw(plain_password.encode("utf-8"), salt)
+        with timed("bcrypt.hash"):
+            hashed = hashing_service.run(
+                bcrypt_hash, plain_password.encode("utf-8"), Config.SALT_LENGTH
+            )
         logger.debug("Password hashed successfully")
         return hashed.decode("utf-8")
 
+    except HashingBusyError:
+        raise
+
     except Exception as exc:
         logger.exception("Password hashing failed")
         raise RuntimeError("Failed to hash password") from exc
@@ -69,23 +85,101 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise.
 
+    Raises:
+        HashingBusyError: If the hashing pool is saturated.
+
     Example:
         >>> verify_password("MySecret123", hashed)
         True
     """
     try:
-        is_valid = bcrypt.checkpw(
-            plain_password.encode("utf-8"),
-            hashed_password.encode("utf-8"),
-        )
+        with timed("bcrypt.verify"):
+            is_valid = hashing_service.run(
+                bcrypt_check,
+                plain_password.encode("utf-8"),
+                hashed_password.encode("utf-8"),
+            )
         logger.debug("Password verification result: %s", is_valid)
         return is_valid
 
+    except HashingBusyError:
+        raise
+
     except Exception:
         logger.exception("Password verification failed")
         return False
 
 
+@lru_cache(maxsize=1)
+def _dummy_hash() -> str:
+    return hash_password(secrets.token_urlsafe(16))
+
+
+def dummy_verify(plain_password: str) -> bool:
+    """
+    Spend the same bcrypt work as :func:`verify_password` without an account.
+
+    Called for unknown or inactive emails so response time does not reveal
+    which accounts exist. The dummy hash uses the configured cost.
+
+    Args:
+        plain_password (str): User-provided plain password.
+
+    Returns:
+        bool: Always False.
+
+    Raises:
+        HashingBusyError: If the hashing pool is saturated.
+    """
+    verify_password(plain_password, _dummy_hash())
+    return False
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses a different cost than configured.
+
+    Args:
+        hashed_password (str): Stored bcrypt hash, e.g. ``$2b$12$...``.
+
+    Returns:
+        bool: True if the hash should be regenerated at ``SALT_LENGTH``.
+
+    Example:
+        >>> needs_rehash("$2b$10$abcdefghijklmnopqrstuv...")
+        True
+    """
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        logger.warning("Unrecognised password hash format")
+        return True
+    return rounds != Config.SALT_LENGTH
+
+
+def current_user_state() -> UserState | None:
+    """
+    Return the logged-in user's current state, or None if the session
+    is anonymous or belongs to a missing or deactivated user.
+
+    Keeps ``session["role"]`` in step when an admin changes the role.
+
+    Returns:
+        Optional[UserState]: State of an active logged-in user.
+    """
+    user_id = session.get("user_id")
+    if user_id is None:
+        return None
+
+    state = get_user_state(user_id)
+    if state is None or not state.is_active:
+        return None
+
+    if session.get("role") != state.role:
+        session["role"] = state.role
+    return state
+
+
 def login_required(view: Callable[..., Any]) -> Callable[..., Any]:
     """
     Decorator to enforce authentication on protected routes.
@@ -114,7 +208,17 @@ def login_required(view: Callable[..., Any]) -> Callable[..., Any]:
                 request.path
             )
             flash("Please log in first", "error")
-            return redirect(url_for("user.login", next=request.url))
+            return redirect(url_for("auth.login", next=request.url))
+
+        if current_user_state() is None:
+            logger.warning(
+                "Revoked session for user %s on %s",
+                session.get("user_id"),
+                request.path,
+            )
+            session.clear()
+            flash("Your session has ended, please log in again", "error")
+            return redirect(url_for("auth.login"))
 
         logger.debug(
             "User %s accessed %s",
@@ -130,7 +234,8 @@ def role_required(*allowed_roles: str):
     """
     Decorator to restrict access based on user role(s).
 
-    The user's role is expected to be stored in session["role"].
+    The role is looked up from the user record (through the user cache),
+    so role changes and deactivations apply to existing sessions.
 
     Args:
         *allowed_roles (str): One or more allowed roles
@@ -165,7 +270,8 @@ def role_required(*allowed_roles: str):
         @wraps(view)
         def wrapped_view(*args, **kwargs):
             user_id = session.get("user_id")
-            user_role = session.get("role")
+            state = current_user_state()
+            user_role = state.role if state else None
 
             if not user_role:
                 logger.warning(
@@ -174,7 +280,7 @@ def role_required(*allowed_roles: str):
                     request.path,
                 )
                 flash("Access denied", "error")
-                return redirect(url_for("index"))
+                return redirect(url_for("user.index"))
 
             if user_role.lower() not in allowed_roles_set:
                 logger.warning(
@@ -185,7 +291,7 @@ def role_required(*allowed_roles: str):
                     request.path,
                 )
                 flash("You do not have permission to access this page", "error")
-                return redirect(url_for("index"))
+                return redirect(url_for("user.index"))
 
             logger.debug(
                 "Role access granted: user_id=%s role=%s path=%s",
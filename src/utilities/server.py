@@ -0,0 +1,228 @@
+"""
+Production WSGI/ASGI serving.
+
+This module provides:
+- A built-in pre-forking server: the listening socket is bound once and
+  shared by several worker processes, each handling requests on a
+  bounded thread pool, with crashed workers replaced
+- Runners for gunicorn (gthread workers) and uvicorn (through the
+  thread-pool ASGI adapter) when those packages are installed
+
+Every runner calls ``on_ready`` once, in the parent process, after the
+workers exist; that is where process-wide background jobs belong.
+``on_worker_start`` runs in each worker forked from the parent, to
+restart the per-process threads ``fork()`` does not carry over.
+
+Usage:
+    from src.utilities.server import serve
+    serve(app, "0.0.0.0", 8181, workers=4, threads=8, server="prefork")
+"""
+import atexit
+import os
+import signal
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+from src.utilities.asgi import ASGIAdapter
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+SERVERS = ("prefork", "gunicorn", "asgi")
+
+# Seconds to wait before replacing a worker that died, so a worker that
+# crashes on startup does not turn into a fork loop
+RESPAWN_DELAY = 1.0
+# Exported to uvicorn's worker processes, which import ``asgi.py`` instead of running serve.py
+WORKERS_ENV = "SERVE_WORKERS"
+THREADS_ENV = "SERVE_THREADS"
+
+
+class _RequestHandler(WSGIRequestHandler):
+    # One request per connection keeps a pool thread from idling on keep-alive
+    protocol_version = "HTTP/1.0"
+
+    def log_request(self, *args, **kwargs) -> None:
+        # Access logging is left to the proxy in front; it costs a write per request
+        pass
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """Werkzeug server that hands each connection to a fixed-size thread pool."""
+
+    multithread = True
+    multiprocess = True
+
+    def __init__(self, host: str, port: int, app: Flask, threads: int):
+        super().__init__(host, port, app, handler=_RequestHandler)
+        self.threads = threads
+        self._pool: ThreadPoolExecutor | None = None
+
+    def process_request(self, request, client_address) -> None:
+        # Created on first use, i.e. inside the worker process after fork()
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(self.threads, thread_name_prefix="http")
+        self._pool.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:  # noqa: BLE001 - as socketserver does, log it and keep serving
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+
+def serve_prefork(app: Flask, host: str, port: int, workers: int, threads: int,
+                  on_ready: Callable[[], None] | None = None,
+                  on_worker_start: Callable[[], None] | None = None) -> None:
+    """
+    Serve ``app`` from ``workers`` forked processes until SIGINT/SIGTERM.
+
+    Args:
+        app (Flask): Application to serve.
+        host (str): Interface to bind.
+        port (int): Port to bind.
+        workers (int): Worker processes.
+        threads (int): Request threads per worker.
+        on_ready (Optional[Callable]): Called in the parent once workers run.
+        on_worker_start (Optional[Callable]): Called in each worker after fork().
+    """
+    server = PooledWSGIServer(host, port, app, threads)
+    children: dict[int, int] = {}
+    stopping = threading.Event()
+
+    def spawn(slot: int) -> None:
+        pid = os.fork()
+        if pid:
+            children[pid] = slot
+            return
+
+        # Worker: serve until told to stop, run exit hooks (cart flush, log
+        # listener) and leave without returning into the parent's code
+        def stop(signum, frame):
+            threading.Thread(target=server.shutdown).start()
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+        status = 0
+        try:
+            if on_worker_start is not None:
+                on_worker_start()
+            server.serve_forever()
+        except Exception:
+            logger.exception(f"Worker {os.getpid()} crashed")
+            status = 1
+        finally:
+            atexit._run_exitfuncs()
+            os._exit(status)
+
+    def stop_workers(signum, frame):
+        stopping.set()
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for slot in range(workers):
+        spawn(slot)
+    signal.signal(signal.SIGTERM, stop_workers)
+    signal.signal(signal.SIGINT, stop_workers)
+    logger.info(f"Serving on {host}:{server.server_port} with {workers} workers x {threads} threads")
+    if on_ready is not None:
+        on_ready()
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        slot = children.pop(pid, None)
+        if slot is None or stopping.is_set():
+            continue
+        logger.warning(f"Worker {pid} exited with status {status}, starting a replacement")
+        time.sleep(RESPAWN_DELAY)
+        spawn(slot)
+
+    server.server_close()
+    logger.info("All workers stopped")
+
+
+def serve_gunicorn(app: Flask, host: str, port: int, workers: int, threads: int,
+                   on_ready: Callable[[], None] | None = None,
+                   on_worker_start: Callable[[], None] | None = None) -> None:
+    """Serve ``app`` with gunicorn's threaded workers; same arguments as :func:`serve_prefork`."""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError as exc:
+        raise RuntimeError("SERVER=gunicorn requires the gunicorn package") from exc
+
+    options = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "threads": threads,
+        "worker_class": "gthread",
+        "preload_app": True,
+        "when_ready": lambda arbiter: on_ready and on_ready(),
+        "post_fork": lambda arbiter, worker: on_worker_start and on_worker_start(),
+    }
+
+    class Application(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    Application().run()
+
+
+def serve_asgi(app: Flask, host: str, port: int, workers: int, threads: int,
+               on_ready: Callable[[], None] | None = None,
+               on_worker_start: Callable[[], None] | None = None) -> None:
+    """
+    Serve ``app`` under uvicorn through :class:`ASGIAdapter`.
+
+    The event loop owns the connections, so slow clients and keep-alive
+    connections do not hold one of the ``threads`` request threads.
+    uvicorn spawns its workers rather than forking them, and each builds
+    its own app, so ``on_worker_start`` is not needed; the worker and
+    thread counts reach ``asgi.py`` through ``WORKERS_ENV`` and ``THREADS_ENV``.
+    """
+    try:
+        import uvicorn
+    except ImportError as exc:
+        raise RuntimeError("SERVER=asgi requires the uvicorn package") from exc
+
+    if on_ready is not None:
+        on_ready()
+    if workers > 1:
+        # uvicorn builds the app in each worker process from an import string
+        os.environ[WORKERS_ENV] = str(workers)
+        os.environ[THREADS_ENV] = str(threads)
+        uvicorn.run("asgi:application", host=host, port=port, workers=workers, access_log=False)
+    else:
+        uvicorn.run(ASGIAdapter(app, threads), host=host, port=port, access_log=False)
+
+
+def serve(app: Flask, host: str, port: int, workers: int, threads: int, server: str = "prefork",
+          on_ready: Callable[[], None] | None = None,
+          on_worker_start: Callable[[], None] | None = None) -> None:
+    """
+    Serve ``app`` with the chosen server.
+
+    Raises:
+        ValueError: If ``server`` is not one of :data:`SERVERS`.
+        RuntimeError: If the chosen server's package is not installed.
+    """
+    runners = {"prefork": serve_prefork, "gunicorn": serve_gunicorn, "asgi": serve_asgi}
+    if server not in runners:
+        raise ValueError(f"SERVER must be one of {', '.join(SERVERS)}, got '{server}'")
+    runners[server](app, host, port, workers, threads, on_ready, on_worker_start)
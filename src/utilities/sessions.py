@@ -0,0 +1,293 @@
+"""
+Server-side sessions.
+
+This module provides:
+- A pluggable SessionStore interface with SQLite (default), in-memory
+  and Redis backends
+- A Flask SessionInterface that keeps only an opaque session id in the
+  cookie and the payload on the server, so sessions can be revoked
+- Session id rotation on login, and expiry that slides without writing
+  on every request
+
+Usage:
+    from src.utilities.sessions import session_interface
+    app.session_interface = session_interface
+"""
+import secrets
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+
+from flask import Flask, Request, Response, session
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, delete, select
+from werkzeug.datastructures import CallbackDict
+
+from src.models.session import StoredSession
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.helper import get_utc_now
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (payload, expires_at) as returned by SessionStore.load
+Loaded = tuple[str, datetime]
+
+
+class SessionStore(ABC):
+    """Storage interface for serialized session payloads."""
+
+    @abstractmethod
+    def load(self, sid: str) -> Loaded | None:
+        """Return the payload and expiry of a live session, or None."""
+
+    @abstractmethod
+    def save(self, sid: str, payload: str, user_id: int | None, expires_at: datetime) -> None:
+        """Create or replace a session."""
+
+    @abstractmethod
+    def delete(self, sid: str) -> None:
+        """Remove one session."""
+
+    @abstractmethod
+    def delete_user(self, user_id: int) -> int:
+        """Remove every session of a user and return how many there were."""
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Sessions in the ``sessions`` table; expired rows are purged while saving.
+
+    Args:
+        engine (Engine): Database engine.
+        purge_interval (float): Minimum seconds between purges.
+    """
+
+    def __init__(self, engine, purge_interval: float = 300):
+        self.engine = engine
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+
+    def load(self, sid: str) -> Loaded | None:
+        with Session(self.engine) as db_session:
+            row = db_session.exec(
+                select(StoredSession.data, StoredSession.expires_at)
+                .where(StoredSession.id == sid, StoredSession.expires_at > get_utc_now())
+            ).first()
+        return (row.data, row.expires_at) if row else None
+
+    def save(self, sid: str, payload: str, user_id: int | None, expires_at: datetime) -> None:
+        values = {"id": sid, "user_id": user_id, "data": payload, "expires_at": expires_at}
+        with Session(self.engine) as db_session:
+            db_session.exec(
+                insert(StoredSession).values(**values).on_conflict_do_update(
+                    index_elements=[StoredSession.id],
+                    set_={"user_id": user_id, "data": payload, "expires_at": expires_at},
+                )
+            )
+            if time.monotonic() - self._last_purge > self.purge_interval:
+                self._last_purge = time.monotonic()
+                db_session.exec(delete(StoredSession).where(StoredSession.expires_at <= get_utc_now()))
+            db_session.commit()
+
+    def delete(self, sid: str) -> None:
+        with Session(self.engine) as db_session:
+            db_session.exec(delete(StoredSession).where(StoredSession.id == sid))
+            db_session.commit()
+
+    def delete_user(self, user_id: int) -> int:
+        with Session(self.engine) as db_session:
+            result = db_session.exec(delete(StoredSession).where(StoredSession.user_id == user_id))
+            db_session.commit()
+        return result.rowcount
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Process-local store with key expiry, standing in for Redis-like
+    stores in development and tests. Sessions do not survive a restart
+    and are not shared between worker processes.
+    """
+
+    def __init__(self):
+        self._data: dict[str, tuple[str, int | None, datetime]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, sid: str) -> Loaded | None:
+        with self._lock:
+            entry = self._data.get(sid)
+            if entry is None:
+                return None
+            payload, _, expires_at = entry
+            if expires_at <= get_utc_now():
+                del self._data[sid]
+                return None
+            return payload, expires_at
+
+    def save(self, sid: str, payload: str, user_id: int | None, expires_at: datetime) -> None:
+        with self._lock:
+            self._data[sid] = (payload, user_id, expires_at)
+
+    def delete(self, sid: str) -> None:
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def delete_user(self, user_id: int) -> int:
+        with self._lock:
+            sids = [sid for sid, (_, owner, _) in self._data.items() if owner == user_id]
+            for sid in sids:
+                del self._data[sid]
+        return len(sids)
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Sessions as expiring Redis keys, with a set per user for revocation.
+
+    Args:
+        url (str): Redis connection URL.
+    """
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("SESSION_BACKEND=redis requires the redis package") from exc
+
+        self.client = redis.Redis.from_url(url)
+
+    def load(self, sid: str) -> Loaded | None:
+        pipeline = self.client.pipeline()
+        pipeline.get(f"session:{sid}")
+        pipeline.pttl(f"session:{sid}")
+        payload, ttl_ms = pipeline.execute()
+        if payload is None or ttl_ms is None or ttl_ms < 0:
+            return None
+        return payload.decode("utf-8"), get_utc_now() + timedelta(milliseconds=ttl_ms)
+
+    def save(self, sid: str, payload: str, user_id: int | None, expires_at: datetime) -> None:
+        ttl = max(1, int((expires_at - get_utc_now()).total_seconds()))
+        pipeline = self.client.pipeline()
+        pipeline.set(f"session:{sid}", payload, ex=ttl)
+        if user_id is not None:
+            pipeline.sadd(f"user-sessions:{user_id}", sid)
+            pipeline.expire(f"user-sessions:{user_id}", ttl)
+        pipeline.execute()
+
+    def delete(self, sid: str) -> None:
+        self.client.delete(f"session:{sid}")
+
+    def delete_user(self, user_id: int) -> int:
+        sids = self.client.smembers(f"user-sessions:{user_id}")
+        keys = [f"session:{sid.decode('utf-8')}" for sid in sids]
+        removed = self.client.delete(*keys) if keys else 0
+        self.client.delete(f"user-sessions:{user_id}")
+        return removed
+
+
+class ServerSession(CallbackDict, SessionMixin):
+    """Session dict that tracks changes and knows its server-side id."""
+
+    def __init__(self, initial=None, sid: str = "", new: bool = False, expires_at: datetime | None = None):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.expires_at = expires_at
+        self.modified = False
+        self.rotate = False
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """
+    Keep session payloads in a SessionStore, keyed by a random id cookie.
+
+    A session is written when it changes, when it is new and non-empty,
+    or when less than half of its lifetime is left; other requests only
+    read it.
+
+    Args:
+        store (SessionStore): Where payloads live.
+        lifetime (timedelta): Idle time after which a session expires.
+    """
+
+    serializer = TaggedJSONSerializer()
+
+    def __init__(self, store: SessionStore, lifetime: timedelta):
+        self.store = store
+        self.lifetime = lifetime
+
+    @staticmethod
+    def _new_sid() -> str:
+        return secrets.token_urlsafe(32)
+
+    def open_session(self, app: Flask, request: Request) -> ServerSession:
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            loaded = self.store.load(sid)
+            if loaded is not None:
+                payload, expires_at = loaded
+                try:
+                    return ServerSession(self.serializer.loads(payload), sid=sid, expires_at=expires_at)
+                except ValueError:
+                    logger.warning("Discarding unreadable session payload")
+        return ServerSession(sid=self._new_sid(), new=True)
+
+    def save_session(self, app: Flask, session: ServerSession, response: Response) -> None:
+        cookie_name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if not session:
+            if not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(cookie_name, domain=domain, path=path)
+            return
+
+        if session.rotate:
+            if not session.new:
+                self.store.delete(session.sid)
+            session.sid = self._new_sid()
+            session.new = True
+
+        now = get_utc_now()
+        stale = session.expires_at is None or session.expires_at - now < self.lifetime / 2
+        if not (session.new or session.modified or stale):
+            return
+
+        self.store.save(session.sid, self.serializer.dumps(dict(session)), session.get("user_id"),
+                        now + self.lifetime)
+        response.set_cookie(
+            cookie_name,
+            session.sid,
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+def rotate_session() -> None:
+    """Give the current session a new id when the response is saved (call on login)."""
+    if isinstance(session._get_current_object(), ServerSession):
+        session.rotate = True
+
+
+def _build_store() -> SessionStore:
+    if Config.SESSION_BACKEND == "memory":
+        return MemorySessionStore()
+    if Config.SESSION_BACKEND == "redis":
+        return RedisSessionStore(Config.SESSION_REDIS_URL)
+    return SQLiteSessionStore(engine)
+
+
+session_store = _build_store()
+session_interface = ServerSideSessionInterface(session_store, timedelta(seconds=Config.SESSION_LIFETIME))
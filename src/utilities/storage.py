@@ -0,0 +1,383 @@
+"""
+Content-addressed storage for uploaded files.
+
+This module provides:
+- A StorageBackend interface with local-disk and S3-compatible backends
+- Streaming uploads that are hashed while written to a temp file
+- Deduplication: identical content is stored once under its SHA-256
+- Reference counting in the ``stored_files`` table
+- A background garbage collector for unreferenced files, including
+  uploads that were stored but never referenced
+
+Usage:
+    from src.utilities.storage import storage
+    key = storage.save_upload(request.files["image"])
+    storage.acquire(db_session, key)
+"""
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from datetime import timedelta
+from typing import BinaryIO
+
+from flask import url_for
+from sqlalchemy.dialects.sqlite import insert
+from sqlmodel import Session, delete, func, select, update
+
+from src.models.inventory import Inventory
+from src.models.storage import StoredFile
+from src.utilities.config import Config
+from src.utilities.database import engine
+from src.utilities.helper import get_utc_now
+from src.utilities.images import image_pipeline
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+_EXTENSION_PATTERN = re.compile(r"^\.[a-z0-9]{1,5}$")
+
+
+class StorageBackend(ABC):
+    """Where content-addressed files physically live."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Return True if ``key`` is stored."""
+
+    @abstractmethod
+    def put_file(self, key: str, path: str) -> None:
+        """Store the local file at ``path`` under ``key``, consuming it."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key``; missing keys are ignored."""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Return the public URL of ``key``."""
+
+    def local_path(self, key: str) -> str | None:
+        """Return a local filesystem path for ``key``, if the backend has one."""
+        return None
+
+
+class LocalDiskStorage(StorageBackend):
+    """
+    Store files in a directory served by Flask's static route.
+
+    Args:
+        root (str): Directory inside the ``static`` folder.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(os.path.join(self.root, key))
+
+    def put_file(self, key: str, path: str) -> None:
+        os.replace(path, os.path.join(self.root, key))
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(os.path.join(self.root, key))
+        except FileNotFoundError:
+            pass
+
+    def url(self, key: str) -> str:
+        path = os.path.relpath(os.path.join(self.root, key), "static")
+        return url_for("static", filename=path.replace(os.sep, "/"))
+
+    def local_path(self, key: str) -> str | None:
+        return os.path.join(self.root, key)
+
+
+class ObjectStorage(StorageBackend):
+    """
+    Store files in an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    Args:
+        bucket (str): Bucket name.
+        endpoint_url (str): S3 API endpoint; empty for AWS.
+        public_url (str): Base URL objects are served from.
+    """
+
+    def __init__(self, bucket: str, endpoint_url: str, public_url: str):
+        try:
+            import boto3
+            from botocore.exceptions import ClientError
+        except ImportError as exc:
+            raise RuntimeError("STORAGE_BACKEND=s3 requires the boto3 package") from exc
+
+        self._client_error = ClientError
+        self.bucket = bucket
+        self.public_url = public_url.rstrip("/")
+        self.client = boto3.client("s3", endpoint_url=endpoint_url or None)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except self._client_error:
+            return False
+
+    def put_file(self, key: str, path: str) -> None:
+        try:
+            self.client.upload_file(path, self.bucket, key)
+        finally:
+            os.remove(path)
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def url(self, key: str) -> str:
+        return f"{self.public_url}/{key}"
+
+
+class ContentStore:
+    """
+    Deduplicating, reference-counted file store on top of a backend.
+
+    The backend is built on first use, so starting the application does
+    not create directories or S3 clients.
+
+    Args:
+        backend_factory (Callable[[], StorageBackend]): Builds the physical storage.
+        staging_dir (str): Local directory for in-flight uploads.
+        engine (Engine): Database engine holding ``stored_files``.
+    """
+
+    def __init__(self, backend_factory: Callable[[], StorageBackend], staging_dir: str, engine):
+        self.engine = engine
+        self._backend_factory = backend_factory
+        self._backend: StorageBackend | None = None
+        self._backend_lock = threading.Lock()
+        self.staging_dir = staging_dir
+        self._gc_thread: threading.Thread | None = None
+        self._gc_stop = threading.Event()
+
+    @property
+    def backend(self) -> StorageBackend:
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    self._backend = self._backend_factory()
+        return self._backend
+
+    def save_stream(self, stream: BinaryIO, filename: str) -> str:
+        """
+        Stream a file to storage, hashing it on the way.
+
+        The key's ``stored_files`` row is touched before the file is
+        looked up, which keeps the garbage collector away from it for the
+        grace period; the caller still has to :meth:`acquire` it.
+
+        Args:
+            stream (BinaryIO): Readable binary stream.
+            filename (str): Client-side file name, used for its extension.
+
+        Returns:
+            str: Content key ``"<sha256><ext>"``.
+        """
+        ext = os.path.splitext(filename)[1].lower()
+        if not _EXTENSION_PATTERN.match(ext):
+            ext = ""
+
+        os.makedirs(self.staging_dir, exist_ok=True)
+        digest = hashlib.sha256()
+        with tempfile.NamedTemporaryFile(
+                dir=self.staging_dir, prefix=".upload-", suffix=".tmp", delete=False
+        ) as temp:
+            temp_path = temp.name
+            try:
+                while chunk := stream.read(CHUNK_SIZE):
+                    digest.update(chunk)
+                    temp.write(chunk)
+            except Exception:
+                temp.close()
+                os.remove(temp_path)
+                raise
+
+        key = f"{digest.hexdigest()}{ext}"
+        try:
+            self._touch(key)
+        except Exception:
+            os.remove(temp_path)
+            raise
+
+        if self.backend.exists(key):
+            os.remove(temp_path)
+            logger.info(f"Upload deduplicated: {key}")
+        else:
+            self.backend.put_file(key, temp_path)
+            logger.info(f"Upload stored: {key}")
+        return key
+
+    def _touch(self, key: str) -> None:
+        # Committed before the existence check: a collection that already
+        # deleted the row has deleted the file too, so it is written again
+        now = get_utc_now()
+        stmt = insert(StoredFile).values(key=key, ref_count=0, created_at=now, updated_at=now)
+        with Session(self.engine) as db_session:
+            db_session.exec(stmt.on_conflict_do_update(index_elements=[StoredFile.key], set_={"updated_at": now}))
+            db_session.commit()
+
+    def save_upload(self, file_storage) -> str | None:
+        """
+        Store a Werkzeug ``FileStorage`` from ``request.files``.
+
+        Args:
+            file_storage (FileStorage): Uploaded file, possibly empty.
+
+        Returns:
+            Optional[str]: Content key, or None if no file was sent.
+        """
+        if not file_storage or file_storage.filename == "":
+            return None
+        return self.save_stream(file_storage.stream, file_storage.filename)
+
+    def acquire(self, db_session: Session, key: str | None) -> None:
+        """
+        Add a reference to ``key`` inside the caller's transaction.
+
+        Args:
+            db_session (Session): Session that will commit the change.
+            key (Optional[str]): Content key; None is ignored.
+        """
+        if not key:
+            return
+        now = get_utc_now()
+        stmt = insert(StoredFile).values(key=key, ref_count=1, created_at=now, updated_at=now)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StoredFile.key],
+            set_={"ref_count": StoredFile.ref_count + 1, "updated_at": now},
+        )
+        db_session.exec(stmt)
+
+    def release(self, db_session: Session, key: str | None) -> None:
+        """
+        Drop a reference to ``key`` inside the caller's transaction.
+
+        The file itself is removed later by the garbage collector.
+
+        Args:
+            db_session (Session): Session that will commit the change.
+            key (Optional[str]): Content key; None is ignored.
+        """
+        if not key:
+            return
+        db_session.exec(
+            update(StoredFile)
+            .where(StoredFile.key == key)
+            .values(ref_count=StoredFile.ref_count - 1, updated_at=get_utc_now())
+        )
+
+    def url(self, key: str | None) -> str:
+        """Template helper: public URL of a stored file."""
+        return self.backend.url(key or "")
+
+    def reconcile(self, db_session: Session) -> None:
+        """
+        Rebuild reference counts from the active inventory rows.
+
+        Args:
+            db_session (Session): Open session; committed by this call.
+        """
+        counts = dict(
+            db_session.exec(
+                select(Inventory.image, func.count())
+                .where(Inventory.is_active == True, Inventory.image != None)
+                .group_by(Inventory.image)
+            ).all()
+        )
+        now = get_utc_now()
+        db_session.exec(update(StoredFile).values(ref_count=0, updated_at=now))
+        for key, count in counts.items():
+            stmt = insert(StoredFile).values(key=key, ref_count=count, created_at=now, updated_at=now)
+            db_session.exec(stmt.on_conflict_do_update(
+                index_elements=[StoredFile.key], set_={"ref_count": count, "updated_at": now},
+            ))
+        db_session.commit()
+        logger.info(f"Storage references reconciled for {len(counts)} files")
+
+    def collect_garbage(self, engine, grace_seconds: float) -> int:
+        """
+        Delete files that have had no references for ``grace_seconds``.
+
+        Args:
+            engine (Engine): Database engine.
+            grace_seconds (float): Minimum age of the last reference change.
+
+        Returns:
+            int: Number of files removed.
+        """
+        cutoff = get_utc_now() - timedelta(seconds=grace_seconds)
+        removed = 0
+        with Session(engine) as db_session:
+            keys = db_session.exec(
+                select(StoredFile.key).where(StoredFile.ref_count <= 0, StoredFile.updated_at < cutoff)
+            ).all()
+
+            for key in keys:
+                # Re-check inside the delete so a concurrent acquire or upload wins
+                result = db_session.exec(
+                    delete(StoredFile).where(
+                        StoredFile.key == key, StoredFile.ref_count <= 0, StoredFile.updated_at < cutoff
+                    )
+                )
+                if result.rowcount:
+                    # Still inside the write transaction: an upload of the same
+                    # content waits to touch the row, then finds the file gone
+                    self.backend.delete(key)
+                    image_pipeline.discard(key)
+                    removed += 1
+                db_session.commit()
+
+        if removed:
+            logger.info(f"Storage garbage collector removed {removed} files")
+        return removed
+
+    def start_garbage_collector(self, engine, interval: float, grace_seconds: float) -> None:
+        """
+        Run :meth:`reconcile` once, then :meth:`collect_garbage` every
+        ``interval`` seconds, on a daemon thread.
+
+        Args:
+            engine (Engine): Database engine.
+            interval (float): Seconds between runs.
+            grace_seconds (float): Passed to :meth:`collect_garbage`.
+        """
+        if self._gc_thread is not None:
+            return
+
+        def run():
+            # Startup repair happens here rather than on the boot path
+            try:
+                with Session(engine) as db_session:
+                    self.reconcile(db_session)
+            except Exception:
+                logger.exception("Storage reconcile failed")
+
+            while not self._gc_stop.wait(interval):
+                try:
+                    self.collect_garbage(engine, grace_seconds)
+                except Exception:
+                    logger.exception("Storage garbage collection failed")
+
+        self._gc_thread = threading.Thread(target=run, name="storage-gc", daemon=True)
+        self._gc_thread.start()
+
+
+def _build_backend() -> StorageBackend:
+    if Config.STORAGE_BACKEND == "s3":
+        return ObjectStorage(Config.S3_BUCKET, Config.S3_ENDPOINT_URL, Config.S3_PUBLIC_URL)
+    return LocalDiskStorage(Config.UPLOAD_DIR)
+
+
+storage = ContentStore(_build_backend, staging_dir=Config.UPLOAD_DIR, engine=engine)
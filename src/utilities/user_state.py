@@ -0,0 +1,93 @@
+"""
+Cached user role and active state for per-request authorization.
+
+This module provides:
+- get_user_state: a user's role, active flag and name, read through
+  the in-process ``users`` cache
+- Automatic invalidation after any ORM commit that changes a user's
+  role, active flag or name; a name change also invalidates the
+  catalog, whose cards show seller names
+
+Usage:
+    from src.utilities.user_state import get_user_state
+    state = get_user_state(session["user_id"])
+    if state is None or not state.is_active:
+        ...
+"""
+from typing import NamedTuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.models.user import User
+from src.utilities.cache import catalog_cache, user_cache
+from src.utilities.logger import get_logger
+
+logger = get_logger(__name__)
+
+WATCHED_FIELDS = ("role", "is_active", "full_name")
+
+
+class UserState(NamedTuple):
+    """What authorization needs to know about a user."""
+
+    role: str
+    is_active: bool
+    full_name: str
+
+
+def _load_user_state(user_id: int) -> UserState | None:
+    # Imported here: database imports security, which imports this module
+    from sqlmodel import Session as DBSession
+    from sqlmodel import select
+
+    from src.utilities.database import engine
+
+    with DBSession(engine) as db_session:
+        row = db_session.exec(
+            select(User.role, User.is_active, User.full_name).where(User.id == user_id)
+        ).first()
+    if row is None:
+        return None
+    return UserState(role=row.role.value, is_active=row.is_active, full_name=row.full_name)
+
+
+def get_user_state(user_id: int) -> UserState | None:
+    """
+    Return a user's authorization state, or None if the user does not exist.
+
+    Args:
+        user_id (int): User id from the session.
+
+    Returns:
+        Optional[UserState]: Cached state, at most ``USER_CACHE_TTL`` seconds old.
+    """
+    return user_cache.get_or_load(("user", user_id), lambda: _load_user_state(user_id))
+
+
+def invalidate_user_state() -> None:
+    """Drop all cached user state, e.g. after changing users with raw SQL."""
+    user_cache.invalidate()
+
+
+@event.listens_for(User, "after_update")
+def _remember_changed_user(mapper, connection, target) -> None:
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in WATCHED_FIELDS):
+        session = state.session
+        if session is not None:
+            session.info.setdefault("changed_users", set()).add(target.id)
+            if state.attrs["full_name"].history.has_changes():
+                session.info["catalog_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    # Invalidate only once the change is committed, so a concurrent
+    # request cannot re-cache the old state in between
+    changed = session.info.pop("changed_users", None)
+    if changed:
+        user_cache.invalidate()
+        logger.info(f"User state invalidated for users {sorted(changed)}")
+    if session.info.pop("catalog_changed", False):
+        catalog_cache.invalidate()
@@ -0,0 +1,61 @@
+"""
+Inventory field validation shared by the item form and bulk import.
+
+This module provides:
+- validate_inventory: normalise and check the name, description, price
+  and quantity of an inventory item
+
+Usage:
+    from src.utilities.validation import validate_inventory
+    fields = validate_inventory(name, description, price, quantity)
+"""
+from typing import Any
+
+
+def _text(value: Any) -> str:
+    return "" if value is None else str(value).strip()
+
+
+def validate_inventory(name: Any, description: Any, price: Any, quantity: Any) -> dict:
+    """
+    Validate raw inventory fields.
+
+    Args:
+        name (Any): Item name.
+        description (Any): Item description.
+        price (Any): Price, as entered; must be a positive number.
+        quantity (Any): Stock, as entered; must be an integer >= 0.
+
+    Returns:
+        dict: ``name``, ``description``, ``price`` and ``quantity`` with
+        surrounding whitespace removed and numbers converted.
+
+    Raises:
+        ValueError: With a user-facing message for the first failing rule.
+    """
+    name = _text(name)
+    description = _text(description)
+    if not name or not description:
+        raise ValueError("Name and description are required")
+
+    price = _text(price)
+    if not price:
+        raise ValueError("Price is required")
+    try:
+        price = float(price)
+        if not price > 0 or price == float("inf"):
+            raise ValueError
+    except ValueError:
+        raise ValueError("Price must be a positive number") from None
+
+    quantity = _text(quantity)
+    if not quantity:
+        raise ValueError("Quantity is required")
+    try:
+        quantity = int(quantity)
+        if quantity < 0:
+            raise ValueError
+    except ValueError:
+        raise ValueError("Quantity must be 0 or greater") from None
+
+    return {"name": name, "description": description, "price": price, "quantity": quantity}
@@ -24,7 +24,15 @@ content.addEventListener("scroll", () => {
         const loadingEl = document.getElementById("loading");
         if (loadingEl) loadingEl.style.display = "block";
 
-        fetch(`/?page=${page}`)
+        const grid = document.getElementById("inventoryGrid");
+        const cursor = grid ? grid.dataset.nextCursor : "";
+        if (grid && !cursor) {
+            if (loadingEl) loadingEl.innerText = "No more products";
+            return;
+        }
+        const url = cursor ? `/?cursor=${encodeURIComponent(cursor)}` : `/?page=${page}`;
+
+        fetch(url)
             .then(response => response.text())
             .then(html => {
                 const parser = new DOMParser();
@@ -36,7 +44,8 @@ content.addEventListener("scroll", () => {
                     return;
                 }
 
-                const grid = document.getElementById("inventoryGrid");
+                const newGrid = doc.getElementById("inventoryGrid");
+                grid.dataset.nextCursor = newGrid ? newGrid.dataset.nextCursor : "";
                 newItems.forEach(item => grid.appendChild(item));
 
                 loading = false;
@@ -44,3 +53,29 @@ content.addEventListener("scroll", () => {
             });
     }
 });
+
+const importJob = document.getElementById("importJob");
+
+function pollImport() {
+    fetch(importJob.dataset.statusUrl)
+        .then(response => response.json())
+        .then(job => {
+            document.getElementById("importProgress").value = job.progress;
+            document.getElementById("importSummary").innerText =
+                `${job.message || job.status} — ${job.processed} rows read, ` +
+                `${job.inserted} imported, ${job.error_count} rejected`;
+
+            const list = document.getElementById("importErrors");
+            list.replaceChildren(...job.errors.map(error => {
+                const item = document.createElement("li");
+                item.innerText = `Line ${error.line}: ${error.error}`;
+                return item;
+            }));
+
+            if (job.status !== "done" && job.status !== "failed") {
+                setTimeout(pollImport, 1000);
+            }
+        });
+}
+
+if (importJob) pollImport();
@@ -0,0 +1,93 @@
+"""
+Shared test fixtures.
+
+Config reads the environment when ``src.utilities.config`` is first
+imported, so the suite points it at a throwaway directory here, before
+any test module imports the application.
+
+Run from the repository root:
+    python -m pytest
+"""
+import os
+import shutil
+import tempfile
+import uuid
+
+import pytest
+
+TEST_DIR = tempfile.mkdtemp(prefix="shop-tests-")
+os.environ.update(
+    DATABASE_DIR=os.path.join(TEST_DIR, "database"),
+    DATABASE_NAME="test.db",
+    LOG_DIR=os.path.join(TEST_DIR, "logs"),
+    UPLOAD_DIR=os.path.join(TEST_DIR, "uploads"),
+    PROFILE_DIR=os.path.join(TEST_DIR, "profiles"),
+    DEBUG="false",
+    LOG_SAMPLE_RATE="0",
+    SALT_LENGTH="4",
+    # One process: there are no other workers to hear invalidations from
+    INVALIDATION_POLL_INTERVAL="0",
+    # Tests fail on N+1 queries instead of logging them
+    QUERY_GUARD="raise",
+)
+os.makedirs(os.environ["UPLOAD_DIR"], exist_ok=True)
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The application, backed by a fresh database for the whole run."""
+    from main import create_app
+    from src.utilities.database import engine, init_table
+
+    application = create_app()
+    application.testing = True
+    with application.app_context():
+        init_table()
+    yield application
+    engine.dispose()
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def engine(app):
+    from src.utilities.database import engine
+
+    return engine
+
+
+@pytest.fixture
+def create_seller(app, engine):
+    """Factory for a seller with ``items`` active listings; returns ``(seller_id, item_ids)``."""
+    from sqlmodel import Session
+
+    from src.models.inventory import Inventory
+    from src.models.user import User, UserRole
+
+    def create(items: int = 3, quantity: int = 10, price: float = 9.99):
+        tag = uuid.uuid4().hex[:8]
+        with Session(engine) as db_session:
+            seller = User(full_name=f"Seller {tag}", email_id=f"seller-{tag}@test.local",
+                          hashed_password="unused", role=UserRole.SELLER)
+            db_session.add(seller)
+            db_session.flush()
+            listings = [Inventory(name=f"Item {tag} {index}", description="test item", price=price,
+                                  quantity=quantity, seller_id=seller.id) for index in range(items)]
+            db_session.add_all(listings)
+            db_session.commit()
+            return seller.id, [listing.id for listing in listings]
+
+    return create
+
+
+
+@pytest.fixture
+def login():
+    """Mark a test client's session as logged in, as the login route does."""
+
+    def log_in(client, user_id: int, role: str = "seller") -> None:
+        with client.session_transaction() as session:
+            session["user_id"] = user_id
+            session["role"] = role
+            session["full_name"] = "Test User"
+
+    return log_in
@@ -0,0 +1,35 @@
+from sqlalchemy import text
+from sqlmodel import Session
+
+from src.models.analytics import SellerStats
+from src.models.inventory import Inventory
+from src.utilities.analytics import reconcile
+
+
+def test_triggers_and_reconciler_agree_to_the_cent(engine, create_seller):
+    seller_id, item_ids = create_seller(items=3, quantity=7, price=19.995)
+    with Session(engine) as db_session:
+        for quantity, price in ((6, 0.333), (5, 12.3456), (3, 0.0133)):
+            for item_id in item_ids:
+                item = db_session.get(Inventory, item_id)
+                item.quantity, item.price = quantity, price
+            db_session.commit()
+
+    assert reconcile(engine) == 0
+    with Session(engine) as db_session:
+        assert db_session.get(SellerStats, seller_id).stock_value_cents == 3 * 4  # 3.99 cents per item, rounded
+
+
+def test_reconcile_corrects_drift(engine, create_seller):
+    seller_id, _ = create_seller(items=2, quantity=4, price=2.5)
+    with engine.begin() as connection:
+        connection.execute(
+            text("UPDATE seller_stats SET stock_units = 0, stock_value_cents = 1 WHERE seller_id = :seller_id"),
+            {"seller_id": seller_id},
+        )
+
+    assert reconcile(engine) == 1
+    assert reconcile(engine) == 0
+    with Session(engine) as db_session:
+        stats = db_session.get(SellerStats, seller_id)
+        assert (stats.active_items, stats.stock_units, stats.stock_value_cents) == (2, 8, 2000)
@@ -0,0 +1,25 @@
+import importlib
+import sys
+
+from src.utilities.cart import cart_store
+from src.utilities.config import Config
+from src.utilities.rate_limit import SQLiteRateLimitBackend, login_throttle
+from src.utilities.server import WORKERS_ENV
+
+
+def test_asgi_workers_share_carts_and_login_limits(app, monkeypatch):
+    # Restored after the test, so the rest of the suite keeps its defaults
+    monkeypatch.setattr(cart_store, "write_through", False)
+    monkeypatch.setattr(login_throttle.by_ip, "backend", login_throttle.by_ip.backend)
+    monkeypatch.setattr(login_throttle.by_email, "backend", login_throttle.by_email.backend)
+    # serve.py --workers 2 with WORKERS=1 in .env
+    monkeypatch.setattr(Config, "WORKERS", 1)
+    monkeypatch.setenv(WORKERS_ENV, "2")
+    monkeypatch.delitem(sys.modules, "asgi", raising=False)
+
+    asgi = importlib.import_module("asgi")
+
+    assert asgi.workers == 2
+    assert cart_store.write_through
+    assert isinstance(login_throttle.by_ip.backend, SQLiteRateLimitBackend)
+    assert isinstance(login_throttle.by_email.backend, SQLiteRateLimitBackend)
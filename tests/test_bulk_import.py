@@ -0,0 +1,28 @@
+import io
+import time
+
+from werkzeug.datastructures import FileStorage
+
+from src.utilities.bulk_import import BulkImporter
+
+CSV = b"name,description,price,quantity\nLamp,desk lamp,19.99,5\nChair,,-1,2\nDesk,oak desk,120,1\n"
+
+
+def test_any_worker_reports_import_progress(engine, create_seller):
+    seller_id, _ = create_seller(items=0)
+    running = BulkImporter(engine, batch_size=1, workers=1)
+    upload = FileStorage(io.BytesIO(CSV), filename="items.csv")
+    job_id = running.submit(seller_id, upload).id
+
+    # A second importer stands in for another worker process polling the status
+    other_worker = BulkImporter(engine, batch_size=1, workers=1)
+    deadline = time.monotonic() + 10
+    job = other_worker.get(job_id, seller_id)
+    while not job.finished and time.monotonic() < deadline:
+        time.sleep(0.05)
+        job = other_worker.get(job_id, seller_id)
+
+    assert job.status == "done"
+    assert (job.processed, job.inserted, job.error_count) == (3, 2, 1)
+    assert job.errors[0][0] == 3
+    assert other_worker.get(job_id, seller_id + 1) is None
@@ -0,0 +1,32 @@
+import threading
+
+from sqlmodel import Session, select
+
+from src.models.cart import CartItem
+from src.utilities.cart import CartStore
+
+THREADS = 4
+ADDS_PER_THREAD = 20
+
+
+def test_write_through_keeps_every_concurrent_update(engine, create_seller):
+    user_id, (item_id,) = create_seller(items=1)
+    store = CartStore(engine, max_carts=100, flush_interval=60)
+    store.use_write_through()
+
+    def add_units():
+        for _ in range(ADDS_PER_THREAD):
+            store.add(user_id, item_id, 1)
+
+    threads = [threading.Thread(target=add_units) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with Session(engine) as db_session:
+        stored = db_session.exec(
+            select(CartItem.quantity).where(CartItem.user_id == user_id, CartItem.inventory_id == item_id)
+        ).one()
+    assert stored == THREADS * ADDS_PER_THREAD
+    assert store.items(user_id) == {item_id: THREADS * ADDS_PER_THREAD}
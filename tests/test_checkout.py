@@ -0,0 +1,105 @@
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from src.models.inventory import Inventory
+from src.models.order import Order, OrderLine
+from src.utilities.cache import catalog_cache
+from src.utilities.checkout import OutOfStockError, checkout
+
+STOCK = 40
+BUYERS = 150
+THREADS = 32
+
+
+def _checkout_all(buyer_id, carts):
+    outcomes = {"reserved": 0, "out_of_stock": 0}
+    errors = []
+    lock = threading.Lock()
+    go = threading.Event()
+
+    def buy(cart):
+        go.wait()
+        try:
+            checkout.reserve(buyer_id, cart)
+            outcome = "reserved"
+        except OutOfStockError:
+            outcome = "out_of_stock"
+        except Exception as e:  # noqa: BLE001 - every failure is reported below
+            with lock:
+                errors.append(repr(e))
+            return
+        with lock:
+            outcomes[outcome] += 1
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        futures = [executor.submit(buy, cart) for cart in carts]
+        go.set()  # release the first THREADS buyers at once
+        for future in futures:
+            future.result()
+    assert errors == []
+    return outcomes
+
+
+def _stock_and_sold(engine, item_ids):
+    with Session(engine) as db_session:
+        remaining = dict(db_session.exec(
+            select(Inventory.id, Inventory.quantity).where(Inventory.id.in_(item_ids))
+        ).all())
+        sold = dict(db_session.exec(
+            select(OrderLine.inventory_id, func.sum(OrderLine.quantity))
+            .join(Order, Order.id == OrderLine.order_id)
+            .where(OrderLine.inventory_id.in_(item_ids))
+            .group_by(OrderLine.inventory_id)
+        ).all())
+    return remaining, sold
+
+
+def test_concurrent_checkouts_of_one_item_never_oversell(engine, create_seller):
+    _, (item_id,) = create_seller(items=1, quantity=STOCK)
+    buyer_id, _ = create_seller(items=0)
+
+    outcomes = _checkout_all(buyer_id, [{item_id: 1}] * BUYERS)
+
+    remaining, sold = _stock_and_sold(engine, [item_id])
+    assert outcomes == {"reserved": STOCK, "out_of_stock": BUYERS - STOCK}
+    assert remaining[item_id] == 0
+    assert sold[item_id] == STOCK
+
+
+def test_concurrent_multi_line_checkouts_never_oversell(engine, create_seller):
+    _, item_ids = create_seller(items=3, quantity=STOCK)
+    buyer_id, _ = create_seller(items=0)
+    rng = random.Random(42)
+    carts = [
+        {item_id: rng.randint(1, 3) for item_id in rng.sample(item_ids, rng.randint(1, len(item_ids)))}
+        for _ in range(BUYERS)
+    ]
+
+    outcomes = _checkout_all(buyer_id, carts)
+
+    remaining, sold = _stock_and_sold(engine, item_ids)
+    assert outcomes["reserved"] > 0 and outcomes["out_of_stock"] > 0
+    for item_id in item_ids:
+        assert remaining[item_id] >= 0
+        assert sold.get(item_id, 0) + remaining[item_id] == STOCK
+
+
+def test_catalog_invalidated_only_when_stock_crosses_zero(create_seller, monkeypatch):
+    _, (item_id,) = create_seller(items=1, quantity=3)
+    buyer_id, _ = create_seller(items=0)
+    invalidations = []
+    monkeypatch.setattr(catalog_cache, "invalidate", lambda: invalidations.append(item_id))
+
+    first = checkout.reserve(buyer_id, {item_id: 1})
+    assert invalidations == []
+    second = checkout.reserve(buyer_id, {item_id: 2})
+    assert len(invalidations) == 1  # sold out
+
+    assert checkout.cancel(second.id, buyer_id)
+    assert len(invalidations) == 2  # back in stock
+    assert checkout.cancel(first.id, buyer_id)
+    assert len(invalidations) == 2
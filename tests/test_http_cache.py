@@ -0,0 +1,68 @@
+import os
+from datetime import timedelta
+
+from PIL import Image
+from sqlmodel import Session, select, update
+
+from src.models.inventory import Inventory
+from src.utilities import http_cache
+from src.utilities.cache import catalog_cache
+from src.utilities.config import Config
+from src.utilities.helper import get_utc_now
+from src.utilities.images import image_pipeline
+
+
+def test_catalog_etag_changes_when_image_variants_are_ready(app, engine, create_seller):
+    _, (item_id,) = create_seller(items=1)
+    filename = f"etag-test-{item_id}.png"
+    Image.new("RGB", (800, 600), "white").save(os.path.join(Config.UPLOAD_DIR, filename))
+    with Session(engine) as db_session:
+        item = db_session.get(Inventory, item_id)
+        item.image = filename
+        db_session.add(item)
+        db_session.commit()
+    catalog_cache.invalidate()
+    client = app.test_client()
+
+    pending = client.get("/")
+    assert filename.encode() in pending.data
+    assert pending.last_modified is None
+
+    image_pipeline.generate(filename)
+    ready = client.get("/", headers={"If-None-Match": pending.headers["ETag"]})
+
+    assert ready.status_code == 200
+    assert ready.headers["ETag"] != pending.headers["ETag"]
+    assert b"srcset" in ready.data
+    assert client.get("/", headers={"If-None-Match": ready.headers["ETag"]}).status_code == 304
+
+
+def test_deleting_a_listed_item_invalidates_if_modified_since(app, engine, create_seller, login, monkeypatch):
+    seller_id, item_ids = create_seller(items=2)
+    an_hour_ago = get_utc_now() - timedelta(hours=1)
+    with engine.begin() as connection:
+        # Every row, since other tests' items share the page
+        connection.execute(update(Inventory).values(updated_at=an_hour_ago))
+        deleted_name = connection.execute(select(Inventory.name).where(Inventory.id == item_ids[0])).scalar_one()
+    catalog_cache.invalidate()
+    monkeypatch.setattr(catalog_cache, "changed_at", an_hour_ago)
+    visitor = app.test_client()
+
+    before = visitor.get("/")
+    assert deleted_name.encode() in before.data
+    since = {"If-Modified-Since": before.headers["Last-Modified"]}
+    assert visitor.get("/", headers=since).status_code == 304
+
+    seller = app.test_client()
+    login(seller, seller_id)
+    assert seller.post(f"/seller/delete-inventory/{item_ids[0]}").status_code == 302
+
+    # No row left on the page moved its updated_at, but the catalog did change
+    after = visitor.get("/", headers=since)
+    assert after.status_code == 200
+    assert deleted_name.encode() not in after.data
+
+    monkeypatch.setattr(http_cache, "get_utc_now", lambda: get_utc_now() + timedelta(seconds=2))
+    later = visitor.get("/", headers=since)
+    assert later.status_code == 200
+    assert later.last_modified > before.last_modified
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy import exc, text
+
+from src.utilities.instrumentation import metrics
+
+
+def test_sql_listeners_registered_once_per_engine(app, engine):
+    from main import create_app
+
+    create_app()  # a second app on the same engine
+    before = metrics.sql.count
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    assert metrics.sql.count == before + 1
+
+
+def test_failed_statement_leaves_no_timer(app, engine):
+    with engine.connect() as connection:
+        with pytest.raises(exc.OperationalError):
+            connection.execute(text("SELECT * FROM no_such_table"))
+        assert not connection.info.get("query_start")
+
+        connection.execute(text("SELECT 1"))
+        assert not connection.info.get("query_start")
@@ -0,0 +1,36 @@
+import base64
+import json
+from datetime import datetime
+
+import pytest
+
+from src.utilities.pagination import SORT_KEYS, decode_cursor, encode_cursor
+
+
+def _cursor(payload) -> str:
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize(("sort", "value"), [
+    ("date_desc", 1),
+    ("date_desc", "Lamp"),
+    ("price_asc", {"dt": "2026-01-01T00:00:00"}),
+    ("price_asc", True),
+    ("name_asc", 9.99),
+])
+def test_cursor_of_another_sort_is_rejected(sort, value):
+    assert decode_cursor(_cursor([value, 2]), SORT_KEYS[sort]) is None
+
+
+def test_cursor_round_trips_for_its_sort():
+    row = type("Row", (), {"id": 7, "name": "Lamp", "price": 12, "created_at": datetime(2026, 1, 2, 3, 4, 5)})
+    for sort, value in (("date_desc", row.created_at), ("price_asc", 12), ("name_asc", "Lamp")):
+        assert decode_cursor(encode_cursor(SORT_KEYS[sort], row), SORT_KEYS[sort]) == (value, 7)
+
+
+def test_catalog_falls_back_to_the_first_page_on_a_mistyped_cursor(app, create_seller):
+    create_seller(items=2)
+    client = app.test_client()
+
+    assert client.get(f"/?cursor={_cursor([1, 2])}").status_code == 200
+    assert client.get(f"/?cursor={_cursor([9.99, 2])}&sort=date_asc").status_code == 200
@@ -0,0 +1,47 @@
+import pytest
+from sqlmodel import Session, select
+
+from src.models.inventory import Inventory
+from src.utilities.query_guard import QueryBudgetExceeded
+
+
+def test_catalog_renders_within_query_budget(app, create_seller, login):
+    seller_id, _ = create_seller(items=5)
+    client = app.test_client()
+
+    assert client.get("/").status_code == 200
+    assert client.get("/search?q=item").status_code == 200
+    login(client, seller_id)
+    assert client.get("/seller/dashboard").status_code == 200
+
+
+def _lazy_seller_route(engine, item_ids):
+    from main import create_app
+
+    # A second app in the same process, as a multi-app test run or a reload would build
+    guarded = create_app()
+    guarded.testing = True
+
+    @guarded.route("/lazy-sellers")
+    def lazy_sellers():
+        with Session(engine) as db_session:
+            items = db_session.exec(select(Inventory).where(Inventory.id.in_(item_ids))).all()
+            return ",".join(item.seller.full_name for item in items)
+
+    return guarded.test_client()
+
+
+def test_guard_raises_on_n_plus_one(engine, create_seller):
+    item_ids = [create_seller(items=1)[1][0] for _ in range(4)]
+    client = _lazy_seller_route(engine, item_ids)
+
+    with pytest.raises(QueryBudgetExceeded, match="Inventory.seller"):
+        client.get("/lazy-sellers")
+
+
+def test_lazy_loads_counted_once_per_load(engine, create_seller):
+    # Two loads are within the budget of three; counting them twice would not be
+    item_ids = [create_seller(items=1)[1][0] for _ in range(2)]
+    client = _lazy_seller_route(engine, item_ids)
+
+    assert client.get("/lazy-sellers").status_code == 200
@@ -0,0 +1,15 @@
+from benchmarks.check_query_plans import check_routes, plan_routes
+from benchmarks.seed import populate
+from src.utilities.cache import catalog_cache
+
+
+def test_hot_routes_search_indexes(app, engine):
+    populate(engine, rows=2000, sellers=20, customers=20)
+    catalog_cache.invalidate()  # raw inserts; cached pages would skip their queries
+    seller_id, routes = plan_routes(engine)
+
+    results = check_routes(app, engine, seller_id, routes)
+
+    assert {result["route"] for result in results} >= {name for name, *_ in routes}
+    scans = [(result["route"], result["sql"], result["table_scans"]) for result in results if result["table_scans"]]
+    assert scans == []
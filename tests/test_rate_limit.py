@@ -0,0 +1,33 @@
+from src.utilities.rate_limit import (
+    LoginThrottle,
+    MemoryRateLimitBackend,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+)
+
+
+def _throttle(backend) -> LoginThrottle:
+    return LoginThrottle(
+        RateLimiter("login-ip", backend, capacity=2, refill_seconds=3600, evict_interval=3600),
+        RateLimiter("login-email", backend, capacity=2, refill_seconds=3600, evict_interval=3600),
+    )
+
+
+def test_shared_backend_spends_one_budget_across_workers(app):
+    # Two throttles built from the memory default stand in for two worker processes
+    workers = [_throttle(MemoryRateLimitBackend(100)) for _ in range(2)]
+    for throttle in workers:
+        throttle.use_shared_backend()
+        assert isinstance(throttle.by_ip.backend, SQLiteRateLimitBackend)
+
+    decisions = [throttle.by_email.hit("shared@test.local").allowed for throttle in workers * 2]
+    assert decisions == [True, True, False, False]
+
+
+def test_memory_backend_drops_oldest_keys_when_full():
+    backend = MemoryRateLimitBackend(3)
+    for key in ("a", "b", "c", "d"):
+        backend.take(key, capacity=2, rate=0.001, now=0.0)
+
+    assert list(backend._buckets) == ["b", "c", "d"]
+    assert backend.overflow_evictions == 1
@@ -0,0 +1,37 @@
+import io
+import os
+from datetime import timedelta
+
+from sqlmodel import Session, update
+
+from src.models.storage import StoredFile
+from src.utilities.helper import get_utc_now
+from src.utilities.storage import ContentStore, LocalDiskStorage
+
+GRACE = 60
+
+
+def _age(engine, key: str) -> None:
+    with Session(engine) as db_session:
+        db_session.exec(
+            update(StoredFile).where(StoredFile.key == key)
+            .values(updated_at=get_utc_now() - timedelta(seconds=2 * GRACE))
+        )
+        db_session.commit()
+
+
+def test_reupload_keeps_an_unreferenced_file_from_collection(engine, tmp_path):
+    store = ContentStore(lambda: LocalDiskStorage(str(tmp_path)), staging_dir=str(tmp_path), engine=engine)
+    content = os.urandom(32)
+    key = store.save_stream(io.BytesIO(content), "photo.png")
+    _age(engine, key)
+
+    # Deduplicated against the stored file, which must now survive until acquired
+    assert store.save_stream(io.BytesIO(content), "photo.png") == key
+    assert store.collect_garbage(engine, GRACE) == 0
+    assert store.backend.exists(key)
+
+    # Never acquired: collected once the grace period has passed
+    _age(engine, key)
+    assert store.collect_garbage(engine, GRACE) == 1
+    assert not store.backend.exists(key)